@@ -1,24 +1,150 @@
-import json
-from flask import Flask, render_template, request, jsonify, send_from_directory, redirect, url_for
+import dataclasses
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory, redirect, url_for
 from flask_cors import CORS
-from utils.nlp_processor import ClaimProcessor
-from utils.fact_checkers.google_fact_check import GoogleFactChecker
-from utils.fact_checkers.aggregator import FactCheckAggregator
+from utils.nlp_processor import ClaimProcessor, sentence_terminator
 from utils.credibility_scorer import CredibilityScorer
 from utils.social_monitor import SocialMediaMonitor
 from utils.geo_tracker import GeoTracker
+from utils.lazy import LazyService
+from utils.log import bind_request_id, configure_logging, current_request_id, in_context
+from utils.records import ClaimResult
+from utils.sentence_segmenter import iter_sentences
+from utils.serialization import PayloadCache, dumps, json_response
 from datetime import datetime
 from collections import defaultdict
 
+configure_logging()
+logger = logging.getLogger(__name__)
+
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
-claim_processor = ClaimProcessor()
-fact_checkers = [GoogleFactChecker()]
-fact_checker = FactCheckAggregator(fact_checkers)
-credibility_scorer = CredibilityScorer()
-social_monitor = SocialMediaMonitor()
-geo_tracker = GeoTracker()
+@app.before_request
+def assign_request_id():
+    # Honour an ID set by a proxy so log lines correlate across services
+    bind_request_id(request.headers.get('X-Request-ID'))
+
+@app.after_request
+def add_request_id_header(response):
+    response.headers['X-Request-ID'] = current_request_id()
+    return response
+
+def build_verification_cache():
+    from utils.verification_cache import VerificationCache
+    return VerificationCache.from_env(
+        default_path=os.path.join(app.instance_path, 'verification_cache.sqlite3')
+    )
+
+def build_sentence_memo():
+    from utils.sentence_memo import SentenceMemo
+    return SentenceMemo.from_env()
+
+def build_geo_tracker():
+    # Workers share the tracked claims through one SQLite log
+    return GeoTracker.from_env(default_path=os.path.join(app.instance_path, 'geo_tracker.sqlite3'))
+
+def build_fact_checker():
+    # The fact checking stack pulls in requests and the HTTP pools, so it is
+    # only imported when the first claim needs verifying
+    from utils.fact_checkers.google_fact_check import GoogleFactChecker
+    from utils.fact_checkers.aggregator import FactCheckAggregator
+    from utils.fact_checkers.local_index import LocalFactChecker
+    from utils.single_flight import CoalescingFactChecker
+
+    fact_checkers = [GoogleFactChecker()]
+    if os.getenv('LOCAL_FACT_INDEX'):
+        fact_checkers.append(LocalFactChecker(os.getenv('LOCAL_FACT_INDEX')))
+        if os.getenv('SEMANTIC_FACT_MATCHING'):
+            # numpy is only needed when semantic matching is enabled
+            from utils.fact_checkers.semantic import SemanticFactChecker
+            fact_checkers.append(SemanticFactChecker(index_path=os.getenv('LOCAL_FACT_INDEX')))
+
+    # Concurrent requests for the same claim share one aggregator call
+    return CoalescingFactChecker(FactCheckAggregator(fact_checkers, cache=verification_cache.get()))
+
+# Services are constructed on first use; call warm_up() to build them ahead of traffic
+claim_processor = LazyService(ClaimProcessor)
+verification_cache = LazyService(build_verification_cache)
+sentence_memo = LazyService(build_sentence_memo)
+fact_checker = LazyService(build_fact_checker)
+credibility_scorer = LazyService(CredibilityScorer)
+social_monitor = LazyService(SocialMediaMonitor)
+geo_tracker = LazyService(build_geo_tracker)
+
+# Geo and dashboard payloads polled by every open page, reserialized only when the data changes
+geo_payloads = PayloadCache()
+
+def warm_up():
+    """Construct every service now, e.g. from a gunicorn post_worker_init hook."""
+    for service in (claim_processor, verification_cache, sentence_memo, fact_checker,
+                    credibility_scorer, social_monitor, geo_tracker):
+        service.get()
+
+if os.getenv('TRUTHLENS_EAGER_INIT'):
+    warm_up()
+
+# Claims of one request are verified concurrently on this pool; 1 disables the pipeline
+app.config['ANALYZE_PARALLELISM'] = int(os.getenv('ANALYZE_PARALLELISM', 8))
+analysis_executor = ThreadPoolExecutor(max_workers=max(app.config['ANALYZE_PARALLELISM'], 1),
+                                       thread_name_prefix='analyze')
+
+def verify_and_score(claim):
+    """Verify a single claim and compute its credibility score."""
+    fact_check = fact_checker.verify_claim(claim['text'])
+
+    # Ensure fact_check is a dictionary with required fields
+    if not isinstance(fact_check, dict):
+        fact_check = {'verified': False, 'sources': [], 'matching_facts': []}
+
+    credibility_result = credibility_scorer.calculate_score(claim, fact_check)
+    return fact_check, credibility_result
+
+def verify_and_remember(claim, key):
+    """Verify and score a claim, remembering the outcome for its sentence."""
+    from utils.sentence_memo import SentenceAnalysis
+
+    fact_check, credibility_result = verify_and_score(claim)
+    sentence_memo.remember(key, SentenceAnalysis(claim, fact_check, credibility_result))
+    return fact_check, credibility_result
+
+def verify_claims(claims, keys):
+    """Verify and score claims, concurrently when enabled, preserving claim order."""
+    if app.config['ANALYZE_PARALLELISM'] <= 1 or len(claims) <= 1:
+        return [verify_and_remember(claim, key) for claim, key in zip(claims, keys)]
+    return list(analysis_executor.map(in_context(verify_and_remember), claims, keys))
+
+def plan_claims(content):
+    """
+    Extract the claims of content, reusing the analysis of sentences seen before.
+
+    Returns:
+        List of (claim, sentence key, memoized SentenceAnalysis or None) in
+        document order; claims with a memoized analysis need no new work
+    """
+    from utils.sentence_memo import SentenceAnalysis
+
+    planned = []
+    for sentence, start, end in iter_sentences(content):
+        terminator = sentence_terminator(content, end)
+        key = sentence_memo.key(sentence + terminator)
+        memoized = sentence_memo.lookup(key)
+        if memoized is not None:
+            if memoized.claim is not None:
+                # Same sentence, possibly at a new position in the document
+                claim = dataclasses.replace(memoized.claim, span=(start, end))
+                planned.append((claim, key, memoized))
+            continue
+
+        claim = claim_processor.claim_from_sentence(sentence, start, end, terminator)
+        if claim is None:
+            sentence_memo.remember(key, SentenceAnalysis())
+        else:
+            planned.append((claim, key, None))
+    return planned
 
 @app.route('/')
 def home():
@@ -52,6 +178,36 @@ def serve_tutorial_js():
 def index():
     return render_template('index.html', include_tutorial=True)
 
+def build_claim_result(claim, fact_check, credibility_result, location):
+    """Track a verified claim geographically and build its result entry."""
+    # Track geographical data if provided
+    if location:
+        claim_data = {
+            'text': claim['text'],
+            'entities': claim.get('entities', []),
+            'credibility_score': credibility_result,
+            'sources': fact_check.get('sources', []),
+            'false_claim': credibility_result.get('risk_level') == 'high'
+        }
+        geo_tracker.track_claim(claim_data, location)
+
+    # reasoning is repeated at the top level for clients such as the browser extension
+    return ClaimResult(
+        claim=claim,
+        credibility_score=credibility_result,
+        fact_check=fact_check,
+        reasoning=credibility_result.reasoning
+    )
+
+def placeholder_result(text, risk_level, reason):
+    """Result entry used when there is no claim to verify."""
+    return ClaimResult(
+        claim={'text': text},
+        credibility_score={'score': 0.0, 'risk_level': risk_level},
+        fact_check=None,
+        reasoning=[reason]
+    )
+
 @app.route('/analyze', methods=['POST'])
 def analyze():
     """Analyze text content for fact-checking."""
@@ -60,79 +216,136 @@ def analyze():
         location = request.json.get('location', {})
 
         if not content:
-            return jsonify({
+            return json_response({
                 'success': True,
-                'results': [{
-                    'claim': {'text': 'No content provided'},
-                    'credibility_score': {'score': 0.0, 'risk_level': 'high'},
-                    'fact_check': None,
-                    'reasoning': ['No content to analyze']
-                }]
+                'results': [placeholder_result('No content provided', 'high', 'No content to analyze')]
             })
 
-        # Extract claims from the content
-        claims = claim_processor.extract_claims(content)
-        if not claims:
-            return jsonify({
+        # Extract claims from the content, reusing unchanged sentences
+        planned = plan_claims(content)
+        if not planned:
+            return json_response({
                 'success': True,
-                'results': [{
-                    'claim': {'text': content},
-                    'credibility_score': {'score': 0.0, 'risk_level': 'medium'},
-                    'fact_check': None,
-                    'reasoning': ['No clear claims were detected in the text']
-                }]
+                'results': [placeholder_result(content, 'medium', 'No clear claims were detected in the text')],
+                'reused_claims': 0
             })
 
-        # Process all claims
+        # Only claims without a memoized analysis are verified
+        fresh = [(claim, key) for claim, key, memoized in planned if memoized is None]
+        verified = iter(verify_claims([claim for claim, _ in fresh], [key for _, key in fresh]))
         results = []
-        for claim in claims:
-            fact_check = fact_checker.verify_claim(claim['text'])
-
-            # Ensure fact_check is a dictionary with required fields
-            if not isinstance(fact_check, dict):
-                fact_check = {'verified': False, 'sources': [], 'matching_facts': []}
-
-            credibility_result = credibility_scorer.calculate_score(claim, fact_check)
-
-            # Track geographical data if provided
-            if location:
-                claim_data = {
-                    'text': claim['text'],
-                    'entities': claim.get('entities', []),
-                    'credibility_score': credibility_result,
-                    'sources': fact_check.get('sources', []),
-                    'false_claim': credibility_result.get('risk_level') == 'high'
-                }
-                geo_tracker.track_claim(claim_data, location)
-
-            results.append({
-                'claim': claim,
-                'credibility_score': credibility_result,
-                'fact_check': fact_check,
-                'reasoning': credibility_result.get('reasoning', [])
-            })
+        for claim, key, memoized in planned:
+            if memoized is not None:
+                fact_check, credibility_result = memoized.fact_check, memoized.credibility_score
+            else:
+                fact_check, credibility_result = next(verified)
+            results.append(build_claim_result(claim, fact_check, credibility_result, location))
 
         # Format response
         response = {
             'success': True,
-            'results': results
+            'results': results,
+            'reused_claims': len(planned) - len(fresh)
         }
 
-        print(f"Analysis response: {response}")  # Debug log
-        return jsonify(response)
+        logger.info("Analyzed %d claims, %d reused", len(results), response['reused_claims'])
+        return json_response(response)
 
     except Exception as e:
-        print(f"Error processing request: {str(e)}")  # Debug log
-        return jsonify({
+        logger.exception("Error processing request: %s", e)
+        return json_response({
             'success': False,
-            'results': [{
-                'claim': {'text': content if 'content' in locals() else 'Error processing request'},
-                'credibility_score': {'score': 0.0, 'risk_level': 'high'},
-                'fact_check': None,
-                'reasoning': [f'An error occurred during analysis: {str(e)}']
-            }]
+            'results': [placeholder_result(content if 'content' in locals() else 'Error processing request',
+                                           'high', f'An error occurred during analysis: {str(e)}')]
         })
 
+@app.route('/analyze/stream', methods=['POST'])
+def analyze_stream():
+    """
+    Analyze text content, streaming results as newline-delimited JSON.
+
+    Each claim is emitted as a ``result`` record carrying its position in
+    the text as soon as its verification completes, followed by one
+    ``summary`` record. Claims in sentences analyzed before are emitted
+    first, from the sentence memo.
+    """
+    data = request.get_json(silent=True) or {}
+    content = data.get('content', '')
+    location = data.get('location', {})
+
+    def record(payload):
+        return dumps(payload) + b'\n'
+
+    request_id = current_request_id()
+
+    def generate():
+        # The body is produced after the view returns, outside the request's context
+        bind_request_id(request_id)
+        started = time.monotonic()
+        success = True
+        total = 0
+        reused = 0
+        try:
+            planned = plan_claims(content) if content else None
+            if not content:
+                total = 1
+                yield record({'type': 'result', 'index': 0,
+                              **placeholder_result('No content provided', 'high', 'No content to analyze').to_dict()})
+            elif not planned:
+                total = 1
+                yield record({'type': 'result', 'index': 0,
+                              **placeholder_result(content, 'medium',
+                                                   'No clear claims were detected in the text').to_dict()})
+            else:
+                total = len(planned)
+                claims = [claim for claim, _, _ in planned]
+                futures = {}
+                for index, (claim, key, memoized) in enumerate(planned):
+                    if memoized is None:
+                        futures[analysis_executor.submit(in_context(verify_and_remember), claim, key)] = index
+
+                # Unchanged sentences are answered before any new verification completes
+                for index, (claim, key, memoized) in enumerate(planned):
+                    if memoized is not None:
+                        reused += 1
+                        result = build_claim_result(claim, memoized.fact_check, memoized.credibility_score,
+                                                    location)
+                        yield record({'type': 'result', 'index': index, **result.to_dict()})
+
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        fact_check, credibility_result = future.result()
+                        result = build_claim_result(claims[index], fact_check, credibility_result, location)
+                    except Exception as e:
+                        success = False
+                        result = placeholder_result(claims[index]['text'], 'high',
+                                                    f'An error occurred during analysis: {str(e)}')
+                    yield record({'type': 'result', 'index': index, **result.to_dict()})
+
+        except Exception as e:
+            logger.exception("Error processing request: %s", e)
+            success = False
+            yield record({'type': 'result', 'index': total,
+                          **placeholder_result(content or 'Error processing request', 'high',
+                                               f'An error occurred during analysis: {str(e)}').to_dict()})
+        finally:
+            # Also logged when the client disconnects and the stream is closed early
+            elapsed_ms = round((time.monotonic() - started) * 1000, 1)
+            logger.info("Streamed %d claims (%d reused) in %.1f ms", total, reused, elapsed_ms,
+                        extra={'fields': {'claims': total, 'reused_claims': reused, 'elapsed_ms': elapsed_ms}})
+
+        yield record({
+            'type': 'summary',
+            'success': success,
+            'total_claims': total,
+            'reused_claims': reused,
+            'elapsed_ms': elapsed_ms
+        })
+
+    return Response(generate(), mimetype='application/x-ndjson',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/social/tracking', methods=['GET', 'POST'])
 def manage_tracking():
     if request.method == 'POST':
@@ -172,18 +385,17 @@ def get_social_updates():
 
 @app.route('/geo/country/<country>', methods=['GET'])
 def get_country_trends(country):
-    try:
+    def build():
         trends = geo_tracker.get_regional_trends(country)
 
         if trends:
-            print(f"Country trends for {country}: {trends}")
-            return jsonify({
+            return {
                 'success': True,
                 'trends': trends
-            })
+            }
         else:
-            print(f"No trends found for country: {country}")
-            return jsonify({
+            logger.debug("No trends found for country: %s", country)
+            return {
                 'success': False,
                 'message': 'No data available for this country',
                 'trends': {
@@ -194,20 +406,25 @@ def get_country_trends(country):
                     'trending_topics': {},
                     'sources': {}
                 }
-            })
+            }
+
+    try:
+        return geo_payloads.response(request, ('country', country), geo_tracker.data_version(), build)
     except Exception as e:
-        print(f"Error getting country trends: {str(e)}")
+        logger.exception("Error getting country trends: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/geo/hotspots', methods=['GET'])
 def get_hotspots():
     """Get global misinformation hotspots data."""
-    try:
-        hotspots = geo_tracker.get_hotspots()
-        return jsonify({
+    def build():
+        return {
             'success': True,
-            'hotspots': hotspots
-        })
+            'hotspots': geo_tracker.get_hotspots()
+        }
+
+    try:
+        return geo_payloads.response(request, 'hotspots', geo_tracker.data_version(), build)
     except Exception as e:
         return jsonify({
             'success': False,
@@ -215,6 +432,16 @@ def get_hotspots():
             'hotspots': []  # Return empty list as fallback
         })
 
+@app.route('/stats/cache', methods=['GET'])
+def cache_stats():
+    """Get verification cache, sentence memo and request coalescing counters."""
+    return jsonify({
+        'success': True,
+        'cache': verification_cache.stats(),
+        'sentence_memo': sentence_memo.stats(),
+        'coalescing': fact_checker.stats()
+    })
+
 @app.route('/dashboard')
 def dashboard():
     """Render the personal dashboard page."""
@@ -228,17 +455,35 @@ def dashboard():
 
 @app.route('/dashboard/data')
 def dashboard_data():
-    """Get data for dashboard charts."""
-    try:
-        timeline_data = geo_tracker.get_timeline_data()
+    """Get data for dashboard charts.
+
+    The timeline can be narrowed with ISO 8601 'start' and 'end' query
+    parameters, a 'granularity' of 'day' (default) or 'hour', and a 'country'.
+    """
+    def build():
+        start = request.args.get('start')
+        end = request.args.get('end')
+        timeline_data = geo_tracker.get_timeline_data(
+            start=datetime.fromisoformat(start) if start else None,
+            end=datetime.fromisoformat(end) if end else None,
+            granularity=request.args.get('granularity', 'day'),
+            country_code=request.args.get('country')
+        )
         topics_data = geo_tracker.get_trending_topics()
-        return jsonify({
+        return {
             'success': True,
             'timeline_data': timeline_data,
             'topics_data': topics_data
-        })
+        }
+
+    try:
+        key = ('dashboard', tuple(sorted(request.args.items())))
+        return geo_payloads.response(request, key, geo_tracker.data_version(), build)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
+    warm_up()
     app.run(host='0.0.0.0', port=5000)
\ No newline at end of file
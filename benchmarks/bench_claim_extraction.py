@@ -0,0 +1,104 @@
+"""Microbenchmark for ClaimProcessor.extract_claims.
+
+Compares the current extractor with the single-token entity detector
+it replaced (kept below as a reference) on a synthetic corpus and reports
+documents per second. The two tag entities differently, so only
+throughput is compared. With --batch it also
+reports extract_claims_batch throughput for increasing process counts.
+
+Run from the repository root:
+    python -m benchmarks.bench_claim_extraction
+"""
+import argparse
+import os
+import random
+import time
+
+from utils.nlp_processor import ClaimProcessor
+from utils.sentence_segmenter import iter_sentences
+
+SENTENCES = [
+    "According to the report, unemployment fell to 3.5 percent in March",
+    "Scientists discovered a new species of frog in the Amazon rainforest",
+    "The weather was nice today",
+    "NASA announced new findings about Mars atmosphere",
+    "Experts say the new policy will cost 2 billion dollars",
+    "I think we should go",
+    "A new study shows coffee drinkers live longer",
+    "The Prime Minister stated that taxes will rise next year",
+    "It rained",
+    "Research shows that 40 percent of adults sleep less than 7 hours",
+    "The company revealed record profits of 12 million in the last quarter",
+    "we went to the beach and had a great time with friends",
+]
+
+def legacy_extract_claims(processor, text):
+    """The claim detector before the single-pass rewrite and gazetteer matching, for comparison."""
+    claims = []
+    for sentence, start, end in iter_sentences(text):
+        if len(sentence.split()) < 3:
+            continue
+        has_claim = any(indicator in sentence.lower() for indicator in processor.claim_indicators)
+        has_numbers = any(c.isdigit() for c in sentence)
+        entities = []
+        words = sentence.split()
+        for word in words:
+            if word and word[0].isupper() and len(word) > 1:
+                entities.append((word, 'ENTITY'))
+            if any(c.isdigit() for c in word):
+                entities.append((word, 'NUMBER'))
+        is_statement = len(sentence.split()) >= 4 and entities
+        if has_claim or is_statement or (len(entities) > 0 and has_numbers):
+            terminator = text[end] if end < len(text) and text[end] in '.!?' else '.'
+            claims.append({
+                'text': sentence + terminator,
+                'entities': entities,
+                'confidence': processor._calculate_confidence(sentence, entities, has_claim),
+                'span': (start, end)
+            })
+    return claims
+
+def make_corpus(documents, sentences_per_document, seed=0):
+    rng = random.Random(seed)
+    return ['. '.join(rng.choice(SENTENCES) for _ in range(sentences_per_document)) + '.'
+            for _ in range(documents)]
+
+def measure(fn, corpus, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for document in corpus:
+            fn(document)
+        best = min(best, time.perf_counter() - started)
+    return len(corpus) / best
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--documents', type=int, default=2000)
+    parser.add_argument('--sentences', type=int, default=40)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--batch', action='store_true', help="also measure process-pool scaling")
+    args = parser.parse_args()
+
+    processor = ClaimProcessor()
+    corpus = make_corpus(args.documents, args.sentences)
+
+    before = measure(lambda doc: legacy_extract_claims(processor, doc), corpus, args.repeat)
+    after = measure(processor.extract_claims, corpus, args.repeat)
+    print(f"before: {before:,.0f} docs/s")
+    print(f"after:  {after:,.0f} docs/s ({after / before:.2f}x)")
+
+    if args.batch:
+        batch_corpus = corpus * 10
+        assert processor.extract_claims_batch(corpus[:200], processes=2) == \
+            [processor.extract_claims(document) for document in corpus[:200]]
+        processes = 1
+        while processes <= (os.cpu_count() or 1):
+            started = time.perf_counter()
+            processor.extract_claims_batch(batch_corpus, processes=processes)
+            rate = len(batch_corpus) / (time.perf_counter() - started)
+            print(f"batch, {processes} processes: {rate:,.0f} docs/s")
+            processes *= 2
+
+if __name__ == "__main__":
+    main()
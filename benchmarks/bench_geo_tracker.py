@@ -0,0 +1,112 @@
+"""Multithreaded stress test and throughput benchmark for GeoTracker.
+
+Writer threads track claims from a skewed mix of countries while reader
+threads poll every dashboard query, as a threaded server does. Any
+exception in a thread fails the run, and the final totals are checked
+against the number of claims tracked. Reports claims tracked and reads
+served per second.
+
+Run from the repository root:
+    python -m benchmarks.bench_geo_tracker --writers 8 --readers 4 --claims 20000
+"""
+import argparse
+import random
+import threading
+import time
+
+from utils.geo_tracker import GeoTracker
+
+COUNTRIES = ['USA', 'GBR', 'CAN', 'AUS', 'IND', 'FRA', 'DEU', 'BRA', 'NGA', 'JPN',
+             'MEX', 'ZAF', 'ESP', 'ITA', 'KEN', 'PHL', 'IDN', 'ARG', 'EGY', 'TUR']
+TOPICS = [f'topic {i}' for i in range(500)]
+SOURCES = [f'source{i}.example' for i in range(50)]
+
+def make_claims(count, seed):
+    rng = random.Random(seed)
+    claims = []
+    for i in range(count):
+        claims.append((
+            {
+                'text': f'claim {seed}-{i}',
+                'entities': [(rng.choice(TOPICS), 'ORG') for _ in range(rng.randint(0, 3))],
+                'sources': rng.sample(SOURCES, rng.randint(0, 2)),
+                'false_claim': rng.random() < 0.3,
+                'credibility_score': {'risk_level': rng.choice(['low', 'medium', 'high'])}
+            },
+            # A few countries get most of the traffic
+            {'country': COUNTRIES[min(int(rng.paretovariate(1.2)) - 1, len(COUNTRIES) - 1)]}
+        ))
+    return claims
+
+def read_all(tracker):
+    tracker.get_hotspots()
+    tracker.get_regional_trends(random.choice(COUNTRIES))
+    tracker.get_active_countries()
+    tracker.get_recent_claims(limit=10)
+    tracker.get_timeline_data()
+    tracker.get_timeline_data(granularity='hour', country_code='USA')
+    tracker.get_trending_topics()
+    tracker.get_total_claims()
+    tracker.get_accuracy_rate()
+
+def run(workloads, readers):
+    tracker = GeoTracker(max_history=10000)
+    errors = []
+    reads = [0] * readers
+    writing = threading.Event()
+    writing.set()
+
+    def write(claims):
+        try:
+            for claim, location in claims:
+                tracker.track_claim(claim, location)
+        except Exception as e:
+            errors.append(e)
+
+    def read(slot):
+        try:
+            while writing.is_set():
+                read_all(tracker)
+                reads[slot] += 1
+        except Exception as e:
+            errors.append(e)
+
+    writer_threads = [threading.Thread(target=write, args=(claims,)) for claims in workloads]
+    reader_threads = [threading.Thread(target=read, args=(slot,)) for slot in range(readers)]
+    started = time.perf_counter()
+    for thread in reader_threads + writer_threads:
+        thread.start()
+    for thread in writer_threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    writing.clear()
+    for thread in reader_threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    expected = sum(len(claims) for claims in workloads)
+    false_expected = sum(claim['false_claim'] for claims in workloads for claim, _ in claims)
+    hotspots = tracker.get_hotspots()
+    timeline = tracker.get_timeline_data()
+    assert tracker.get_total_claims() == expected
+    assert sum(h['total_claims'] for h in hotspots) == expected
+    assert sum(h['false_claims'] for h in hotspots) == false_expected
+    assert sum(b['true_claims'] + b['false_claims'] for b in timeline) == expected
+    return expected / elapsed, sum(reads) / elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, default=8)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--claims', type=int, default=20000, help="claims tracked per writer")
+    args = parser.parse_args()
+
+    workloads = [make_claims(args.claims, seed) for seed in range(args.writers)]
+    print(f"{args.writers} writers x {args.claims} claims, {args.readers} readers")
+    writes, reads = run(workloads, args.readers)
+    print(f"{writes:.0f} claims/s, {reads:.1f} reads/s")
+    print("totals consistent, no errors")
+
+if __name__ == "__main__":
+    main()
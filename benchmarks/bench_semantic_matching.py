@@ -0,0 +1,155 @@
+"""Recall and latency benchmark for semantic claim matching.
+
+Builds a synthetic corpus of fact checks from claim templates and queries
+it with reworded versions of known claims (passive voice, reordered
+clauses, inflections, filler words), some with a misspelled word.
+Reports recall@1 and recall@5 and per-query latency for the keyword
+FactIndex, the exact vector index and the IVF approximate index, one
+query at a time and batched.
+
+Run from the repository root:
+    python -m benchmarks.bench_semantic_matching --records 50000 --queries 500
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from utils.fact_checkers.local_index import FactIndex, append_segment
+from utils.fact_checkers.semantic import ExactVectorIndex, IVFVectorIndex, SemanticFactChecker
+
+# Each template lists the published wording first, then rewordings used as queries
+TEMPLATES = [
+    ["{s} banned {o} in {y}", "in {y} {o} was banned by {s}", "{s} has been banning {o} since {y}"],
+    ["{s} reported that {o} causes cancer", "{o} causes cancer according to {s}",
+     "{s} says {o} is causing cancer"],
+    ["{s} spent {n} million dollars on {o}", "{n} million dollars were spent on {o} by {s}",
+     "spending on {o} by {s} reached {n} million dollars"],
+    ["{s} confirmed that {o} prices doubled in {y}", "{o} prices doubled in {y}, {s} confirmed",
+     "in {y} the price of {o} doubled, says {s}"],
+    ["{s} announced a nationwide ban on {o}", "a nationwide {o} ban was announced by {s}",
+     "{s} is banning {o} nationwide"],
+    ["{s} found that {n} percent of adults use {o}", "{n}% of adults use {o}, {s} found",
+     "{s} study: {n} percent of adults are using {o}"],
+]
+FILLERS = ["", "", "breaking: ", "reportedly ", "viral post claims "]
+OBJECTS = """
+vaccines masks cigarettes coffee sugar plastic bags tiktok cryptocurrency gasoline diesel cars
+electric scooters fireworks alcohol cannabis vaping handguns pesticides fluoride glyphosate
+5g towers smartphones video games fast food energy drinks raw milk palm oil coal nuclear power
+solar panels wind turbines bottled water microplastics antibiotics ivermectin hydroxychloroquine
+aspartame red meat eggs wheat rice corn soy salmon chicken beef pork lithium batteries
+self-driving cars drones facial recognition artificial intelligence chatgpt social media
+""".split()
+
+def load_subjects():
+    directory = os.path.join(os.path.dirname(__file__), '..', 'utils', 'data', 'gazetteer')
+    subjects = []
+    for name in sorted(os.listdir(directory)):
+        with open(os.path.join(directory, name), encoding='utf-8') as f:
+            subjects.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+    return subjects
+
+def misspell(text, rng):
+    """Swap two adjacent letters of one longer word."""
+    words = text.split()
+    candidates = [i for i, word in enumerate(words) if len(word) > 4 and word.isalpha()]
+    if not candidates:
+        return text
+    i = rng.choice(candidates)
+    j = rng.randrange(1, len(words[i]) - 2)
+    word = words[i]
+    words[i] = word[:j] + word[j + 1] + word[j] + word[j + 2:]
+    return ' '.join(words)
+
+def make_corpus(records, queries, typo_rate=0.3, seed=0):
+    """Return (fact check records, [(query text, id of the record it rewords)])."""
+    rng = random.Random(seed)
+    subjects = load_subjects()
+    facts, slots = [], []
+    for _ in range(records):
+        template = rng.randrange(len(TEMPLATES))
+        values = {'s': rng.choice(subjects), 'o': rng.choice(OBJECTS),
+                  'y': rng.randint(1990, 2025), 'n': rng.randint(2, 99)}
+        slots.append((template, values))
+        facts.append({
+            'text': TEMPLATES[template][0].format(**values),
+            'rating': rng.choice(['False', 'Mostly False', 'True', 'Mixed']),
+            'title': 'Fact check',
+            'url': f'https://factcheck.example/{len(facts)}',
+            'publisher': rng.choice(['Snopes', 'PolitiFact', 'Full Fact', 'AFP'])
+        })
+
+    pairs = []
+    for target in rng.sample(range(records), queries):
+        template, values = slots[target]
+        wording = rng.choice(TEMPLATES[template][1:])
+        text = rng.choice(FILLERS) + wording.format(**values)
+        if rng.random() < typo_rate:
+            text = misspell(text, rng)
+        pairs.append((text, target))
+    return facts, pairs
+
+def evaluate(search, pairs, url_ids):
+    """recall@1, recall@5 and mean milliseconds per query for search(texts) -> ranked records."""
+    started = time.perf_counter()
+    ranked = search([text for text, _ in pairs])
+    elapsed = time.perf_counter() - started
+    hits1 = hits5 = 0
+    for (_, target), records in zip(pairs, ranked):
+        ids = [url_ids[record['url']] for record in records[:5]]
+        hits1 += bool(ids) and ids[0] == target
+        hits5 += target in ids
+    return hits1 / len(pairs), hits5 / len(pairs), elapsed * 1000 / len(pairs)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--records', type=int, default=50000)
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--nprobe', type=int, default=8)
+    parser.add_argument('--typo-rate', type=float, default=0.3, help="share of queries with a misspelling")
+    args = parser.parse_args()
+
+    facts, pairs = make_corpus(args.records, args.queries, typo_rate=args.typo_rate)
+    url_ids = {fact['url']: i for i, fact in enumerate(facts)}
+
+    with tempfile.TemporaryDirectory() as index_path:
+        append_segment(index_path, facts)
+        keyword = FactIndex(index_path)
+        rows = [('keyword FactIndex', evaluate(
+            lambda texts: [[m['record'] for m in keyword.search(text, limit=5)] for text in texts],
+            pairs, url_ids))]
+        keyword.close()
+
+    started = time.perf_counter()
+    checker = SemanticFactChecker(records=facts, approximate_threshold=len(facts) + 1)
+    print(f"embedded {len(facts)} records in {time.perf_counter() - started:.1f}s")
+    vectors = checker.index.vectors
+
+    def semantic(index, batched):
+        checker.index = index
+
+        def search(texts):
+            if batched:
+                return [[m['record'] for m in matches] for matches in checker.search(texts)]
+            return [[m['record'] for m in checker.search([text])[0]] for text in texts]
+        return search
+
+    started = time.perf_counter()
+    ivf = IVFVectorIndex(vectors, nprobe=args.nprobe)
+    print(f"trained IVF ({len(ivf.centroids)} lists) in {time.perf_counter() - started:.1f}s")
+    exact = ExactVectorIndex(vectors)
+
+    rows.append(('semantic exact', evaluate(semantic(exact, False), pairs, url_ids)))
+    rows.append(('semantic exact, batched', evaluate(semantic(exact, True), pairs, url_ids)))
+    rows.append((f'semantic IVF nprobe={args.nprobe}', evaluate(semantic(ivf, False), pairs, url_ids)))
+    rows.append(('semantic IVF, batched', evaluate(semantic(ivf, True), pairs, url_ids)))
+
+    print(f"{len(facts)} records, {len(pairs)} reworded queries")
+    print(f"{'':32} {'recall@1':>9} {'recall@5':>9} {'ms/query':>9}")
+    for name, (recall1, recall5, latency) in rows:
+        print(f"{name:32} {recall1:9.3f} {recall5:9.3f} {latency:9.3f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark for building and serializing large /analyze responses.
+
+Compares the previous response shape (nested dicts serialized with
+``jsonify``) against the record types serialized with
+``utils.serialization.dumps``, reporting time and peak allocated memory per
+response.
+
+Run from the repository root:
+    python -m benchmarks.bench_serialization --claims 500 --repeat 50
+"""
+import argparse
+import time
+import tracemalloc
+
+from flask import Flask, jsonify
+
+from utils.credibility_scorer import CredibilityScorer
+from utils.fact_checkers.base import FactCheckResult
+from utils.nlp_processor import ClaimProcessor
+from utils.records import ClaimResult
+from utils.serialization import dumps, orjson
+
+SENTENCES = [
+    "The President of France said unemployment rose 5% in 2023.",
+    "Scientists claim NASA found water on Mars.",
+    "Reports show 50 percent of voters in Texas oppose the new law.",
+    "According to the WHO, vaccination rates fell by 12% last year.",
+]
+
+def make_fact_check(text):
+    return FactCheckResult(
+        verified=True,
+        matching_facts=[{'text': text, 'claimant': 'Unknown', 'rating': 'Mostly True',
+                         'title': 'Fact check', 'url': 'https://example.org/check', 'publisher': 'Example'}],
+        sources=['Example'],
+        confidence=0.8,
+        status='success'
+    ).to_dict()
+
+def legacy_response(claims, scorer):
+    """Response built from plain dicts, as before the record types."""
+    results = []
+    for claim in claims:
+        claim = claim.to_dict()
+        fact_check = make_fact_check(claim['text'])
+        credibility = scorer.calculate_score(claim, fact_check).to_dict()
+        results.append({
+            'claim': claim,
+            'credibility_score': credibility,
+            'fact_check': fact_check,
+            'reasoning': credibility.get('reasoning', [])
+        })
+    return {'success': True, 'results': results}
+
+def record_response(claims, scorer):
+    results = []
+    for claim in claims:
+        fact_check = make_fact_check(claim.text)
+        credibility = scorer.calculate_score(claim, fact_check)
+        results.append(ClaimResult(claim=claim, credibility_score=credibility,
+                                   fact_check=fact_check, reasoning=credibility.reasoning))
+    return {'success': True, 'results': results}
+
+def measure(build, serialize, repeat):
+    """Median seconds and peak traced bytes for building and serializing a response."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        serialize(build())
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+
+    tracemalloc.start()
+    serialize(build())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return timings[len(timings) // 2], peak
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--claims', type=int, default=500)
+    parser.add_argument('--repeat', type=int, default=50)
+    args = parser.parse_args()
+
+    text = ' '.join(SENTENCES[i % len(SENTENCES)] for i in range(args.claims))
+    claims = ClaimProcessor().extract_claims(text)
+    scorer = CredibilityScorer()
+    app = Flask(__name__)
+
+    with app.app_context():
+        before = measure(lambda: legacy_response(claims, scorer),
+                         lambda response: jsonify(response).get_data(), args.repeat)
+    after = measure(lambda: record_response(claims, scorer), dumps, args.repeat)
+
+    print(f"{len(claims)} claims per response, encoder: {'orjson' if orjson else 'json'}")
+    print(f"dicts + jsonify:   {before[0] * 1000:8.2f} ms  peak {before[1] / 1024:8.1f} KiB")
+    print(f"records + dumps:   {after[0] * 1000:8.2f} ms  peak {after[1] / 1024:8.1f} KiB")
+    print(f"speedup: {before[0] / after[0]:.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Cold-start benchmark for the Flask app.
+
+Each run starts a fresh interpreter and measures how long ``import app``
+takes, how long the first requests take on the cold process, and how
+long ``warm_up()`` takes when called explicitly. The first /analyze
+request posts a checkable claim, so it goes through claim extraction,
+fact checking and scoring; the Google Fact Check API is replaced by a
+local stub server and the persistent caches are disabled, so no run is
+served from a previous one. A run fails if ``import app`` loads requests,
+which belongs to the deferred fact checking stack. Medians over several
+runs are reported.
+
+Run from the repository root:
+    python -m benchmarks.bench_startup --runs 5
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+CLAIM = 'The unemployment rate in Canada rose to 7 percent in 2023.'
+
+PROBE = r'''
+import json, os, sys, threading, time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+class Upstream(BaseHTTPRequestHandler):
+    requests = 0
+
+    def do_GET(self):
+        Upstream.requests += 1
+        body = json.dumps({'claims': [{
+            'text': 'Unemployment in Canada rose to 7 percent in 2023',
+            'claimant': 'Statistics office',
+            'claimReview': [{'publisher': {'name': 'Stub Checks'}, 'url': 'https://stub.example/1',
+                             'title': 'Unemployment', 'textualRating': 'Mostly True'}]
+        }]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+upstream = ThreadingHTTPServer(('127.0.0.1', 0), Upstream)
+threading.Thread(target=upstream.serve_forever, daemon=True).start()
+os.environ['GOOGLE_FACT_CHECK_API_URL'] = f'http://127.0.0.1:{upstream.server_address[1]}/claims:search'
+os.environ.setdefault('GOOGLE_FACT_CHECK_API_KEY', 'stub')
+
+started = time.perf_counter()
+import app
+imported = time.perf_counter()
+# The HTTP stack is only loaded once the first claim needs verifying
+if 'requests' in sys.modules:
+    sys.exit("import app loaded requests")
+client = app.app.test_client()
+client.get('/')
+landing = time.perf_counter()
+response = client.post('/analyze', json={'content': sys.argv[1]})
+analyze = time.perf_counter()
+results = response.get_json()['results']
+if not Upstream.requests or not results[0].get('fact_check', {}).get('verified'):
+    sys.exit(f"/analyze did not fact check the claim: {response.get_data(as_text=True)}")
+app.warm_up()
+warmed = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - started) * 1000,
+    'first_landing_ms': (landing - imported) * 1000,
+    'first_analyze_ms': (analyze - landing) * 1000,
+    'warm_up_ms': (warmed - analyze) * 1000,
+}))
+'''
+
+def run_once(env):
+    output = subprocess.run([sys.executable, '-c', PROBE, CLAIM], env=env, capture_output=True,
+                            text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--eager', action='store_true', help="build services at import (TRUTHLENS_EAGER_INIT)")
+    args = parser.parse_args()
+
+    # Cached verifications or tracked claims from earlier runs would skew a cold start
+    env = dict(os.environ, PYTHONPATH=os.getcwd(), VERIFICATION_CACHE_PATH='', GEO_STORE_PATH='')
+    if args.eager:
+        env['TRUTHLENS_EAGER_INIT'] = '1'
+
+    samples = [run_once(env) for _ in range(args.runs)]
+    for key in samples[0]:
+        print(f"{key:>18}: {statistics.median(s[key] for s in samples):8.1f} ms")
+
+if __name__ == "__main__":
+    main()
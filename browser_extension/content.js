@@ -33,7 +33,7 @@ if (isExtension) {
             }
             if (request.type === 'highlightText') {
                 try {
-                    highlightText(request.text);
+                    highlightText(request.text, request.span);
                     sendResponse({ success: true });
                 } catch (error) {
                     console.error('Error highlighting text:', error);
@@ -48,17 +48,33 @@ if (isExtension) {
     });
 }
 
+// Narrow the selection to a claim's [start, end) offsets within the selected text
+function claimRange(range, span) {
+    const node = range.startContainer;
+    if (!span || node !== range.endContainer || node.nodeType !== Node.TEXT_NODE) {
+        return range;
+    }
+
+    // Offsets are relative to the trimmed selection that was analyzed
+    const selected = node.textContent.slice(range.startOffset, range.endOffset);
+    const start = range.startOffset + (selected.length - selected.trimStart().length);
+    const narrowed = document.createRange();
+    narrowed.setStart(node, Math.min(start + span[0], range.endOffset));
+    narrowed.setEnd(node, Math.min(start + span[1], range.endOffset));
+    return narrowed;
+}
+
 // Add highlight functionality
-function highlightText(text) {
+function highlightText(text, span) {
     try {
         const selection = window.getSelection();
         if (selection.rangeCount > 0) {
-            const range = selection.getRangeAt(0);
-            const span = document.createElement('span');
-            span.style.backgroundColor = 'rgba(31, 119, 180, 0.2)';
-            span.style.padding = '2px';
-            span.style.borderRadius = '2px';
-            range.surroundContents(span);
+            const range = claimRange(selection.getRangeAt(0), span);
+            const marker = document.createElement('span');
+            marker.style.backgroundColor = 'rgba(31, 119, 180, 0.2)';
+            marker.style.padding = '2px';
+            marker.style.borderRadius = '2px';
+            range.surroundContents(marker);
         }
     } catch (error) {
         console.error('Error in highlightText:', error);
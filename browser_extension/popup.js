@@ -138,9 +138,11 @@ document.addEventListener('DOMContentLoaded', function() {
                 chrome.tabs.query({active: true, currentWindow: true}, function(tabs) {
                     if (tabs[0]) {
                         try {
+                            const claim = data.results && data.results[0] && data.results[0].claim;
                             chrome.tabs.sendMessage(tabs[0].id, {
                                 type: 'highlightText',
-                                text: text
+                                text: text,
+                                span: claim && claim.span ? claim.span : null
                             }, function(response) {
                                 if (chrome.runtime.lastError) {
                                     console.log('Could not highlight text:', chrome.runtime.lastError);
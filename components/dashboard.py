@@ -1,6 +1,3 @@
-import streamlit as st
-import pandas as pd
-
 class Dashboard:
     def __init__(self):
         self.risk_colors = {
@@ -11,6 +8,8 @@ class Dashboard:
 
     def display_claims(self, claims: list, fact_checks: dict, credibility_scores: dict):
         """Display claims and their analysis results."""
+        import streamlit as st
+
         st.subheader("Identified Claims and Analysis")
 
         for i, claim in enumerate(claims):
@@ -42,6 +41,8 @@ class Dashboard:
 
     def _display_fact_check_results(self, fact_check: dict):
         """Display fact-checking results."""
+        import streamlit as st
+
         st.markdown("**Fact Check Results:**")
         
         if fact_check['status'] == 'error':
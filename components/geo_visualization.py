@@ -1,7 +1,7 @@
-import streamlit as st
-import plotly.graph_objects as go
-from typing import List, Dict
-import pandas as pd
+from typing import TYPE_CHECKING, List, Dict
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 class GeoVisualizer:
     def __init__(self):
@@ -13,8 +13,10 @@ class GeoVisualizer:
             [1, 'rgb(203, 24, 29)']       # Deep red for high risk
         ]
 
-    def create_world_map(self, hotspots: List[Dict]) -> go.Figure:
+    def create_world_map(self, hotspots: List[Dict]) -> 'go.Figure':
         """Create a world map visualization of misinformation hotspots."""
+        import plotly.graph_objects as go
+
         # Convert country names to ISO codes for better map display
         country_codes = {
             'United States': 'USA',
@@ -68,6 +70,9 @@ class GeoVisualizer:
 
     def display_country_stats(self, country_data: Dict):
         """Display detailed statistics for a country."""
+        import pandas as pd
+        import streamlit as st
+
         if not country_data:
             st.warning("No data available for selected country")
             return
@@ -1,10 +1,13 @@
-import streamlit as st
-import plotly.graph_objects as go
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 class Visualizer:
-    def create_credibility_gauge(self, score: float) -> go.Figure:
+    def create_credibility_gauge(self, score: float) -> 'go.Figure':
         """Create a gauge chart for credibility score."""
+        import plotly.graph_objects as go
+
         fig = go.Figure(go.Indicator(
             mode = "gauge+number",
             value = score * 100,
@@ -32,8 +35,10 @@ class Visualizer:
             return "yellow"
         return "red"
 
-    def create_entity_chart(self, entities: Dict) -> go.Figure:
+    def create_entity_chart(self, entities: Dict) -> 'go.Figure':
         """Create a bar chart of entity frequencies."""
+        import plotly.graph_objects as go
+
         entity_types = list(entities.keys())
         entity_counts = [len(entities[et]) for et in entity_types]
         
@@ -23,7 +23,7 @@ async function analyzeContent() {
             region: 'Global'
         };
 
-        const response = await fetch('/analyze', {
+        const response = await fetch('/analyze/stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -34,22 +34,24 @@ async function analyzeContent() {
             }),
         });
 
-        const data = await response.json();
+        if (!response.ok) {
+            throw new Error('Failed to analyze content');
+        }
 
-        if (response.ok) {
-            if (data.warning) {
-                displayWarning(data.warning);
-                // Show API setup tutorial if there's an API-related warning
-                if (data.warning.includes('API') || data.warning.includes('authentication')) {
-                    tutorialManager.showTutorial('apiSetup');
-                }
-            } else {
-                displayResults(data.results);
-                updateGeoData();
+        // Render each claim as soon as the server finishes verifying it
+        const resultsDiv = document.getElementById('analysis-results');
+        resultsDiv.innerHTML = '<h2>Analysis Results</h2>';
+
+        await readNdjsonStream(response, record => {
+            if (record.type === 'result') {
+                loading.classList.add('hidden');
+                insertClaimResult(resultsDiv, record, record.index);
+                resultsDiv.classList.remove('hidden');
+            } else if (record.type === 'summary') {
+                console.log(`Analyzed ${record.total_claims} claims in ${record.elapsed_ms} ms`);
             }
-        } else {
-            throw new Error(data.error || 'Failed to analyze content');
-        }
+        });
+        updateGeoData();
     } catch (error) {
         displayError(error.message);
         // Show API setup tutorial if there's an API-related error
@@ -61,73 +63,100 @@ async function analyzeContent() {
     }
 }
 
-function displayResults(results) {
-    const resultsDiv = document.getElementById('analysis-results');
-    resultsDiv.innerHTML = '<h2>Analysis Results</h2>';
+async function readNdjsonStream(response, onRecord) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+
+        let newline;
+        while ((newline = buffer.indexOf('\n')) >= 0) {
+            const line = buffer.slice(0, newline).trim();
+            buffer = buffer.slice(newline + 1);
+            if (line) {
+                onRecord(JSON.parse(line));
+            }
+        }
 
-    if (!results || !Array.isArray(results)) {
-        resultsDiv.innerHTML += '<div class="error">No analysis results available</div>';
-        resultsDiv.classList.remove('hidden');
+        if (done) {
+            if (buffer.trim()) {
+                onRecord(JSON.parse(buffer));
+            }
+            return;
+        }
+    }
+}
+
+function insertClaimResult(resultsDiv, result, index) {
+    const claimDiv = renderClaimResult(result, index);
+    if (!claimDiv) {
         return;
     }
 
-    results.forEach((result, index) => {
-        if (!result || !result.claim) {
-            console.error('Invalid result object:', result);
-            return;
-        }
+    // Results arrive in completion order; keep them in claim order
+    claimDiv.dataset.index = index;
+    const next = Array.from(resultsDiv.querySelectorAll('.claim-result'))
+        .find(element => Number(element.dataset.index) > index);
+    resultsDiv.insertBefore(claimDiv, next || null);
+}
 
-        const claimDiv = document.createElement('div');
-        claimDiv.className = 'claim-result';
+function renderClaimResult(result, index) {
+    if (!result || !result.claim) {
+        console.error('Invalid result object:', result);
+        return null;
+    }
 
-        // Create claim content
-        const claimContent = document.createElement('div');
-        claimContent.className = 'claim-text';
-        claimContent.innerHTML = `
-            <h3>Claim ${index + 1}</h3>
-            <p>${result.claim.text || 'No claim text available'}</p>
-        `;
+    const claimDiv = document.createElement('div');
+    claimDiv.className = 'claim-result';
 
-        if (result.claim.entities && Array.isArray(result.claim.entities) && result.claim.entities.length > 0) {
-            const entitiesDiv = document.createElement('div');
-            entitiesDiv.className = 'entities';
-            entitiesDiv.innerHTML = `
-                <h4>Key Entities:</h4>
-                <ul>
-                    ${result.claim.entities.map(([entity, type]) =>
-                        `<li>${entity} (${type})</li>`
-                    ).join('')}
-                </ul>
-            `;
-            claimContent.appendChild(entitiesDiv);
-        }
+    // Create claim content
+    const claimContent = document.createElement('div');
+    claimContent.className = 'claim-text';
+    claimContent.innerHTML = `
+        <h3>Claim ${index + 1}</h3>
+        <p>${result.claim.text || 'No claim text available'}</p>
+    `;
 
-        claimDiv.appendChild(claimContent);
+    if (result.claim.entities && Array.isArray(result.claim.entities) && result.claim.entities.length > 0) {
+        const entitiesDiv = document.createElement('div');
+        entitiesDiv.className = 'entities';
+        entitiesDiv.innerHTML = `
+            <h4>Key Entities:</h4>
+            <ul>
+                ${result.claim.entities.map(([entity, type]) =>
+                    `<li>${entity} (${type})</li>`
+                ).join('')}
+            </ul>
+        `;
+        claimContent.appendChild(entitiesDiv);
+    }
 
-        // Create and add credibility score section if available
-        if (result.credibility_score) {
-            const scoreContainer = document.createElement('div');
-            scoreContainer.className = 'credibility-score';
-            claimDiv.appendChild(scoreContainer);
-            updateCredibilityScore(result.credibility_score.score || 0, scoreContainer);
-        }
+    claimDiv.appendChild(claimContent);
 
-        // Add fact check results if available
-        if (result.fact_check) {
-            const factCheckDiv = document.createElement('div');
-            factCheckDiv.innerHTML = displayFactCheckResults(result.fact_check);
-            claimDiv.appendChild(factCheckDiv);
-        }
+    // Create and add credibility score section if available
+    if (result.credibility_score) {
+        const scoreContainer = document.createElement('div');
+        scoreContainer.className = 'credibility-score';
+        claimDiv.appendChild(scoreContainer);
+        updateCredibilityScore(result.credibility_score.score || 0, scoreContainer);
+    }
 
-        // Add share buttons
-        const shareDiv = document.createElement('div');
-        shareDiv.innerHTML = generateShareButtons(index);
-        claimDiv.appendChild(shareDiv);
+    // Add fact check results if available
+    if (result.fact_check) {
+        const factCheckDiv = document.createElement('div');
+        factCheckDiv.innerHTML = displayFactCheckResults(result.fact_check);
+        claimDiv.appendChild(factCheckDiv);
+    }
 
-        resultsDiv.appendChild(claimDiv);
-    });
+    // Add share buttons
+    const shareDiv = document.createElement('div');
+    shareDiv.innerHTML = generateShareButtons(index);
+    claimDiv.appendChild(shareDiv);
 
-    resultsDiv.classList.remove('hidden');
+    return claimDiv;
 }
 
 function displayFactCheckResults(factCheck) {
@@ -0,0 +1,55 @@
+import os
+import random
+import sys
+
+import pytest
+
+# Tests import the app's modules from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep the app's persistent stores out of the working tree
+os.environ.setdefault('GEO_STORE_PATH', '')
+os.environ.setdefault('VERIFICATION_CACHE_PATH', '')
+
+COUNTRIES = ['USA', 'GBR', 'CAN', 'AUS', 'IND', 'FRA', 'DEU', 'BRA', 'NGA', 'JPN',
+             'MEX', 'ZAF', 'ESP', 'ITA', 'KEN', 'PHL', 'IDN', 'ARG', 'EGY', 'TUR']
+TOPICS = [f'topic {i}' for i in range(500)]
+SOURCES = [f'source{i}.example' for i in range(50)]
+
+def generate_claims(count, seed):
+    """(claim, location) pairs for GeoTracker.track_claim, reproducible per seed."""
+    rng = random.Random(seed)
+    claims = []
+    for i in range(count):
+        claims.append((
+            {
+                'text': f'claim {seed}-{i}',
+                'entities': [(rng.choice(TOPICS), 'ORG') for _ in range(rng.randint(0, 3))],
+                'sources': rng.sample(SOURCES, rng.randint(0, 2)),
+                'false_claim': rng.random() < 0.3,
+                'credibility_score': {'risk_level': rng.choice(['low', 'medium', 'high'])}
+            },
+            # A few countries get most of the traffic
+            {'country': COUNTRIES[min(int(rng.paretovariate(1.2)) - 1, len(COUNTRIES) - 1)]}
+        ))
+    return claims
+
+def query_all(tracker):
+    """Run every dashboard query against tracker."""
+    tracker.get_hotspots()
+    tracker.get_regional_trends(random.choice(COUNTRIES))
+    tracker.get_active_countries()
+    tracker.get_recent_claims(limit=10)
+    tracker.get_timeline_data()
+    tracker.get_timeline_data(granularity='hour', country_code='USA')
+    tracker.get_trending_topics()
+    tracker.get_total_claims()
+    tracker.get_accuracy_rate()
+
+@pytest.fixture
+def make_claims():
+    return generate_claims
+
+@pytest.fixture
+def read_all():
+    return query_all
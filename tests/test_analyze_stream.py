@@ -0,0 +1,39 @@
+import json
+import logging
+
+import pytest
+
+import app as app_module
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, 'verify_and_score',
+                        lambda claim: ({'verified': False, 'status': 'no_match', 'matching_facts': [],
+                                        'sources': [], 'confidence': 0.0},
+                                       app_module.credibility_scorer.calculate_score(claim, {})))
+    return app_module.app.test_client()
+
+def stream(client, content):
+    return client.post('/analyze/stream', json={'content': content}, buffered=False)
+
+def test_stream_ends_with_summary(client):
+    response = stream(client, "The President of France said unemployment rose 5% in 2023.")
+    records = [json.loads(line) for line in response.get_data().splitlines()]
+    assert records[-1]['type'] == 'summary'
+    assert records[-1]['total_claims'] == len(records) - 1
+
+def test_stream_without_claims_still_summarizes(client):
+    records = [json.loads(line) for line in stream(client, "hello there").get_data().splitlines()]
+    assert [r['type'] for r in records] == ['result', 'summary']
+
+def test_client_disconnect_closes_stream_cleanly(client, caplog):
+    caplog.set_level(logging.INFO, logger=app_module.__name__)
+    response = stream(client, "The President of France said unemployment rose 5% in 2023. "
+                              "NASA found water on Mars in 2015.")
+    first = json.loads(next(iter(response.response)))
+    # A generator yielding after GeneratorExit makes close() raise RuntimeError
+    response.close()
+    assert first['type'] == 'result'
+    messages = [r.getMessage() for r in caplog.records if r.name == app_module.__name__]
+    assert any(message.startswith("Streamed 2 claims") for message in messages)
+    assert not [r for r in caplog.records if r.levelno >= logging.ERROR]
@@ -0,0 +1,58 @@
+import json
+
+from utils.claim_history import ClaimHistory, ClaimRecord
+
+def record(i, timestamp=None, is_false=False):
+    return ClaimRecord(f'claim {i}', float(i) if timestamp is None else timestamp,
+                       'USA', 'low', (f'source{i}.example',), is_false)
+
+def test_keeps_the_newest_records_and_counts_every_claim():
+    history = ClaimHistory(max_records=3)
+    for i in range(5):
+        history.append(record(i, is_false=i % 2 == 0))
+    assert [r.text for r in history] == ['claim 2', 'claim 3', 'claim 4']
+    assert len(history) == 3
+    assert history.total == 5
+    assert history.false_total == 3
+
+def test_latest_returns_newest_first():
+    history = ClaimHistory()
+    for i in range(5):
+        history.append(record(i))
+    assert [r.text for r in history.latest(2)] == ['claim 4', 'claim 3']
+    assert len(history.latest(10)) == 5
+    assert history.latest(0) == []
+
+def test_expire_drops_only_older_records():
+    history = ClaimHistory()
+    for i in range(5):
+        history.append(record(i))
+    assert history.expire(3.0) == 3
+    assert [r.text for r in history] == ['claim 3', 'claim 4']
+    assert history.expire(3.0) == 0
+    assert history.total == 5
+
+def test_max_age_expires_on_append():
+    history = ClaimHistory(max_age=10)
+    for timestamp in (0, 5, 12, 16):
+        history.append(record(timestamp, timestamp=timestamp))
+    # 16 - 10 = 6, so the claims at 0 and 5 are gone
+    assert [r.timestamp for r in history] == [12, 16]
+    assert history.total == 4
+
+def test_state_round_trips_through_json():
+    history = ClaimHistory(max_records=3)
+    for i in range(4):
+        history.append(record(i, is_false=i == 3))
+    restored = ClaimHistory(max_records=3)
+    restored.restore(json.loads(json.dumps(history.state())))
+    assert list(restored) == list(history)
+    assert (restored.total, restored.false_total) == (4, 1)
+    # Still bounded after a restore
+    restored.append(record(4))
+    assert [r.text for r in restored] == ['claim 2', 'claim 3', 'claim 4']
+
+def test_to_dict_uses_an_iso_timestamp():
+    served = record(1, timestamp=1700000000.0).to_dict()
+    assert served['timestamp'].startswith('2023-11-1')
+    assert served['sources'] == ['source1.example']
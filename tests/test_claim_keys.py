@@ -0,0 +1,64 @@
+import pytest
+
+from utils.claim_keys import (NearDuplicateIndex, canonicalize_claim, claim_features, exact_features,
+                              name_features)
+
+def features(text):
+    return claim_features(canonicalize_claim(text))
+
+def keys(text):
+    return features(text), exact_features(text, features(text))
+
+def test_canonical_form_keeps_signs_of_numbers():
+    assert canonicalize_claim("Chicago hit -40 degrees") != canonicalize_claim("Chicago hit 40 degrees")
+    assert canonicalize_claim("Chicago hit −40 degrees") == canonicalize_claim("Chicago hit -40 degrees")
+    assert canonicalize_claim("COVID-19 cases rose") == "covid 19 cases rose"
+
+def test_canonical_form_normalizes_formatting():
+    assert canonicalize_claim("Unemployment fell to 3.50%!") == canonicalize_claim("unemployment  fell to 3.5%")
+    assert canonicalize_claim("It cost 1,000,000 dollars") == "it cost 1000000 dollars"
+
+def make_index(*claims):
+    index = NearDuplicateIndex(threshold=0.8)
+    for claim in claims:
+        index.add(canonicalize_claim(claim), *keys(claim))
+    return index
+
+def test_paraphrase_is_a_near_duplicate():
+    claim = "The national unemployment rate in Canada fell to 3.5 percent in March 2023"
+    index = make_index(claim)
+    paraphrase = "Reportedly the national unemployment rate in Canada fell to 3.5 percent in March 2023"
+    assert index.find(*keys(paraphrase)) == canonicalize_claim(claim)
+
+def test_claims_differing_in_a_number_are_not_near_duplicates():
+    index = make_index("The national unemployment rate in Canada fell to 3.5 percent in March 2023")
+    assert index.find(*keys(
+        "The national unemployment rate in Canada fell to 9.5 percent in March 2023"
+    )) is None
+
+def test_negated_claims_are_not_near_duplicates():
+    index = make_index("Officials confirmed the new vaccine causes serious heart problems in young adults")
+    assert index.find(*keys(
+        "Officials confirmed the new vaccine does not cause serious heart problems in young adults"
+    )) is None
+
+def test_capacity_evicts_oldest_claims():
+    index = NearDuplicateIndex(capacity=2)
+    for claim in ["first claim about taxes", "second claim about wages", "third claim about prices"]:
+        index.add(canonicalize_claim(claim), *keys(claim))
+    assert len(index) == 2
+    assert index.find(*keys("first claim about taxes")) is None
+
+def test_names_exclude_words_opening_a_sentence():
+    assert name_features("Officials in France confirmed it. Prices rose in New York") == {'france', 'new', 'york'}
+
+@pytest.mark.parametrize('cached, claim', [
+    ("The national unemployment rate in Mexico fell to 3.5 percent in March 2023",
+     "The national unemployment rate in Canada fell to 3.5 percent in March 2023"),
+    ("Officials in Germany confirmed the new vaccine causes serious heart problems in adults",
+     "Officials in France confirmed the new vaccine causes serious heart problems in adults"),
+    ("Officials confirmed the new vaccine causes serious heart problems in elderly adults",
+     "Officials confirmed the new vaccine causes serious heart problems in young adults"),
+])
+def test_claims_differing_in_a_name_or_qualifier_are_not_near_duplicates(cached, claim):
+    assert make_index(cached).find(*keys(claim)) is None
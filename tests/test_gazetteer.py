@@ -0,0 +1,34 @@
+from utils.gazetteer import Gazetteer, build_gazetteer
+from utils.nlp_processor import ClaimProcessor
+
+def make_gazetteer():
+    gazetteer = Gazetteer()
+    gazetteer.add('France', 'COUNTRY')
+    gazetteer.add('United States', 'COUNTRY')
+    return gazetteer
+
+def test_longest_match_prefers_longest_name():
+    gazetteer = make_gazetteer()
+    assert gazetteer.longest_match(['United', 'States', 'officials'], 0) == (2, 'COUNTRY')
+
+def test_tokens_cleaning_to_empty_key_do_not_match():
+    gazetteer = make_gazetteer()
+    for token in ['(', '*', '""', ')']:
+        assert gazetteer.longest_match([token, 'France'], 0) is None
+    assert gazetteer.longest_match(['France', '('], 0) == (1, 'COUNTRY')
+
+def test_claims_with_bare_punctuation_are_extracted():
+    claims = ClaimProcessor().extract_claims(
+        "Officials in France ( the ministry ) reported 40 new cases."
+    )
+    assert len(claims) == 1
+    assert ('France', 'COUNTRY') in claims[0].entities
+
+def test_rebuilt_gzip_gazetteer_is_byte_identical(tmp_path):
+    names = tmp_path / 'countries.txt'
+    names.write_text('France\nUnited States\n', encoding='utf-8')
+    first, second = tmp_path / 'first.tsv.gz', tmp_path / 'second.tsv.gz'
+    assert build_gazetteer({'COUNTRY': [str(names)]}, str(first)) == 2
+    build_gazetteer({'COUNTRY': [str(names)]}, str(second))
+    assert first.read_bytes() == second.read_bytes()
+    assert Gazetteer.load(str(first)).longest_match(['France'], 0) == (1, 'COUNTRY')
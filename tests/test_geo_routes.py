@@ -0,0 +1,50 @@
+import pytest
+
+import app as app_module
+from utils.geo_tracker import GeoTracker
+from utils.serialization import PayloadCache
+
+CLAIM = {'text': 'Unemployment rose to 7 percent', 'entities': [('Canada', 'COUNTRY')],
+         'false_claim': True, 'credibility_score': {'risk_level': 'high'}}
+
+@pytest.fixture
+def tracker(monkeypatch):
+    tracker = GeoTracker()
+    monkeypatch.setattr(app_module, 'geo_tracker', tracker)
+    monkeypatch.setattr(app_module, 'geo_payloads', PayloadCache())
+    return tracker
+
+@pytest.fixture
+def client(tracker):
+    return app_module.app.test_client()
+
+@pytest.mark.parametrize('path', ['/geo/hotspots', '/geo/country/CAN', '/dashboard/data?granularity=hour'])
+def test_unchanged_payload_revalidates_with_304(client, tracker, path):
+    tracker.track_claim(CLAIM, {'country': 'CAN'})
+    first = client.get(path)
+    assert first.status_code == 200
+    assert first.headers['Cache-Control'] == 'no-cache'
+    etag = first.headers['ETag']
+
+    cached = client.get(path, headers={'If-None-Match': etag})
+    assert cached.status_code == 304
+    assert cached.get_data() == b''
+    assert cached.headers['ETag'] == etag
+
+def test_etag_changes_when_a_claim_is_tracked(client, tracker):
+    tracker.track_claim(CLAIM, {'country': 'CAN'})
+    first = client.get('/geo/hotspots')
+    etag = first.headers['ETag']
+
+    tracker.track_claim(CLAIM, {'country': 'CAN'})
+    updated = client.get('/geo/hotspots', headers={'If-None-Match': etag})
+    assert updated.status_code == 200
+    assert updated.headers['ETag'] != etag
+    assert updated.get_json()['hotspots'][0]['total_claims'] == 2
+
+def test_etag_is_the_same_for_identical_data_in_another_cache(client, tracker, monkeypatch):
+    tracker.track_claim(CLAIM, {'country': 'CAN'})
+    etag = client.get('/geo/hotspots').headers['ETag']
+    # Another worker serving the same data builds its own payload
+    monkeypatch.setattr(app_module, 'geo_payloads', PayloadCache())
+    assert client.get('/geo/hotspots', headers={'If-None-Match': etag}).status_code == 304
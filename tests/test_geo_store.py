@@ -0,0 +1,66 @@
+import multiprocessing
+import sqlite3
+
+from utils.geo_store import InMemoryGeoStore, SQLiteGeoStore
+from utils.geo_tracker import GeoTracker
+
+def dashboard(tracker):
+    return {
+        'hotspots': tracker.get_hotspots(),
+        'timeline': tracker.get_timeline_data(granularity='hour'),
+        'total': tracker.get_total_claims(),
+        'accuracy': tracker.get_accuracy_rate(),
+        'recent': tracker.get_recent_claims(limit=20),
+        'topics': tracker.get_trending_topics(limit=10)
+    }
+
+def logged_claims(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute('SELECT COUNT(*) FROM geo_claims').fetchone()[0]
+
+def test_new_tracker_starts_from_snapshot_and_pruned_log(tmp_path, make_claims):
+    path = str(tmp_path / 'geo.sqlite3')
+    first = GeoTracker(store=SQLiteGeoStore(path))
+    for claim, location in make_claims(500, seed=1):
+        first.track_claim(claim, location)
+    first.store.flush()
+    first.log_retention = 0
+    assert first.snapshot(force=True)
+    assert logged_claims(path) == 0
+
+    for claim, location in make_claims(50, seed=2):
+        first.track_claim(claim, location)
+    first.store.flush()
+    second = GeoTracker(store=SQLiteGeoStore(path))
+    assert second.get_total_claims() == 550
+    assert dashboard(second) == dashboard(first)
+    first.close()
+    second.close()
+
+def test_snapshot_keeps_claims_within_retention(tmp_path, make_claims):
+    store = InMemoryGeoStore()
+    tracker = GeoTracker(store=store)
+    for claim, location in make_claims(100, seed=3):
+        tracker.track_claim(claim, location)
+    assert tracker.snapshot(force=True)
+    # Nothing new, so no new snapshot, and the claims are too recent to prune
+    assert not tracker.snapshot(force=True)
+    assert len(store.read_since(0)) == 100
+    assert GeoTracker(store=store).get_total_claims() == 100
+
+def track_in_child(tracker, claims):
+    for claim, location in claims:
+        tracker.track_claim(claim, location)
+    tracker.close()
+
+def test_store_opened_before_fork_writes_from_child(tmp_path, make_claims):
+    path = str(tmp_path / 'geo.sqlite3')
+    tracker = GeoTracker(store=SQLiteGeoStore(path))
+    child = multiprocessing.get_context('fork').Process(
+        target=track_in_child, args=(tracker, make_claims(20, seed=4)))
+    child.start()
+    child.join(30)
+    assert child.exitcode == 0
+    assert logged_claims(path) == 20
+    assert tracker.sync() == 20
+    tracker.close()
@@ -0,0 +1,44 @@
+import threading
+
+from utils.geo_tracker import GeoTracker
+
+def test_concurrent_writers_and_readers_keep_totals_consistent(make_claims, read_all):
+    tracker = GeoTracker(max_history=1000)
+    workloads = [make_claims(2000, seed) for seed in range(4)]
+    errors = []
+    writing = threading.Event()
+    writing.set()
+
+    def write(claims):
+        try:
+            for claim, location in claims:
+                tracker.track_claim(claim, location)
+        except Exception as e:
+            errors.append(e)
+
+    def read():
+        try:
+            while writing.is_set():
+                read_all(tracker)
+        except Exception as e:
+            errors.append(e)
+
+    writers = [threading.Thread(target=write, args=(claims,)) for claims in workloads]
+    readers = [threading.Thread(target=read) for _ in range(2)]
+    for thread in readers + writers:
+        thread.start()
+    for thread in writers:
+        thread.join()
+    writing.clear()
+    for thread in readers:
+        thread.join()
+
+    assert not errors
+    claims = [claim for workload in workloads for claim, _ in workload]
+    false_claims = sum(claim['false_claim'] for claim in claims)
+    hotspots = tracker.get_hotspots()
+    assert tracker.get_total_claims() == len(claims)
+    assert sum(h['total_claims'] for h in hotspots) == len(claims)
+    assert sum(h['false_claims'] for h in hotspots) == false_claims
+    assert sum(b['true_claims'] + b['false_claims'] for b in tracker.get_timeline_data()) == len(claims)
+    assert tracker.get_accuracy_rate() == round((1 - false_claims / len(claims)) * 100, 1)
@@ -0,0 +1,51 @@
+import json
+import random
+from collections import Counter
+
+from utils.heavy_hitters import SpaceSaving
+
+def test_exact_while_under_capacity():
+    counter = SpaceSaving(capacity=10)
+    for item in 'abracadabra':
+        counter.add(item)
+    assert counter.top(3) == [('a', 5), ('b', 2), ('r', 2)]
+    assert dict(counter.counts) == Counter('abracadabra')
+    assert not any(counter.errors.values())
+    assert counter.total == 11
+
+def test_eviction_replaces_the_oldest_smallest_count():
+    counter = SpaceSaving(capacity=2)
+    for item in 'aab':
+        counter.add(item)
+    counter.add('c')
+    assert 'b' not in counter
+    assert counter.counts['c'] == 2
+    assert counter.errors['c'] == 1
+    assert len(counter) == 2
+
+def test_counts_bound_the_true_frequency():
+    rng = random.Random(0)
+    stream = [int(rng.paretovariate(1.1)) for _ in range(5000)]
+    counter = SpaceSaving(capacity=20)
+    for item in stream:
+        counter.add(item)
+    exact = Counter(stream)
+    for item, count in counter.counts.items():
+        assert count - counter.errors[item] <= exact[item] <= count
+    # Anything above total / capacity is guaranteed to be tracked
+    assert all(item in counter for item, count in exact.items() if count > len(stream) / 20)
+    assert counter.top(1)[0][0] == exact.most_common(1)[0][0]
+
+def test_restored_counter_evicts_like_the_original():
+    counter = SpaceSaving(capacity=3)
+    for item in 'aabcdde':
+        counter.add(item)
+    restored = SpaceSaving(capacity=3)
+    restored.restore(json.loads(json.dumps(counter.state())))
+    assert restored.top(3) == counter.top(3)
+    for item in 'fgfh':
+        counter.add(item)
+        restored.add(item)
+    assert restored.counts == counter.counts
+    assert restored.errors == counter.errors
+    assert restored.total == counter.total
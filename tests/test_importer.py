@@ -0,0 +1,47 @@
+import io
+import json
+
+import pytest
+
+from utils.fact_checkers.importer import _iter_json_values, iter_facts
+
+def claim_review(i):
+    return {
+        '@type': 'ClaimReview',
+        'claimReviewed': f'Claim number {i}',
+        'url': f'https://factcheck.example/{i}',
+        'reviewRating': {'alternateName': 'False'},
+        'author': {'name': 'Example Checks'}
+    }
+
+def values(text, chunk_size=7):
+    return list(_iter_json_values(io.StringIO(text), chunk_size=chunk_size))
+
+def test_top_level_array_is_streamed():
+    records = [claim_review(i) for i in range(20)]
+    assert values(json.dumps(records)) == records
+
+def test_graph_and_claims_containers_are_streamed():
+    records = [claim_review(i) for i in range(20)]
+    document = {'@context': 'https://schema.org', '@graph': records, 'name': 'dump'}
+    assert values(json.dumps(document)) == records
+    assert values(json.dumps({'claims': records, 'nextPageToken': 'x'})) == records
+
+def test_other_objects_are_yielded_whole():
+    document = {'claimReviewed': 'A claim', 'claims': 'not a list', 'count': 12345}
+    assert values(json.dumps(document)) == [document]
+
+def test_newline_delimited_documents_and_split_numbers():
+    lines = [{'n': 1234567}, 9876543210, {'m': [1.5, -2e10]}]
+    assert values('\n'.join(json.dumps(line) for line in lines), chunk_size=3) == lines
+
+def test_truncated_document_raises():
+    with pytest.raises(json.JSONDecodeError):
+        values('{"@graph": [{"a": 1}, {"b": ')
+
+def test_iter_facts_reads_jsonld_graph(tmp_path):
+    path = tmp_path / 'dump.json'
+    path.write_text(json.dumps({'@graph': [claim_review(i) for i in range(3)]}))
+    facts = list(iter_facts([str(path)]))
+    assert [fact['text'] for fact in facts] == ['Claim number 0', 'Claim number 1', 'Claim number 2']
+    assert facts[0]['publisher'] == 'Example Checks'
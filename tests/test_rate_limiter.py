@@ -0,0 +1,82 @@
+import multiprocessing
+import os
+import types
+
+import pytest
+
+from utils import rate_limiter as rate_limiter_module
+from utils.rate_limiter import RateLimiter
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter_module, 'time', types.SimpleNamespace(
+        time=clock.time, monotonic=clock.monotonic, sleep=clock.sleep))
+    return clock
+
+def test_burst_then_empty(clock):
+    limiter = RateLimiter('test', rate=1.0, burst=3)
+    assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+def test_refill_at_rate_up_to_burst(clock):
+    limiter = RateLimiter('test', rate=2.0, burst=2)
+    assert limiter.try_acquire() and limiter.try_acquire()
+    clock.now += 0.5
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    clock.now += 60
+    assert limiter.stats()['available'] == 2.0
+
+def test_acquire_waits_for_a_token_within_the_timeout(clock):
+    limiter = RateLimiter('test', rate=0.5, burst=1)
+    assert limiter.acquire()
+    started = clock.now
+    assert limiter.acquire(timeout=5)
+    assert clock.now - started == pytest.approx(2.0)
+    assert not limiter.acquire(timeout=1)
+
+def test_daily_quota_resets_the_next_day(clock):
+    clock.now = 86400 * 100 + 3600
+    limiter = RateLimiter('test', rate=100.0, burst=10, per_day=3)
+    assert [limiter.try_acquire() for _ in range(4)] == [True, True, True, False]
+    assert limiter.stats()['used_today'] == 3
+    clock.now += 86400
+    assert limiter.try_acquire()
+
+def test_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        RateLimiter('test', rate=0)
+
+def test_limiters_sharing_a_state_file_share_the_bucket(tmp_path):
+    path = str(tmp_path / 'test.bucket')
+    first = RateLimiter('test', rate=0.001, burst=2, state_path=path)
+    second = RateLimiter('test', rate=0.001, burst=2, state_path=path)
+    assert first.try_acquire() and second.try_acquire()
+    assert not first.try_acquire() and not second.try_acquire()
+
+def acquire_in_child(limiter, results):
+    results.put((limiter.try_acquire(), limiter._fd_pid == os.getpid()))
+
+def test_forked_worker_opens_its_own_state_file(tmp_path):
+    limiter = RateLimiter('test', rate=0.001, burst=2, state_path=str(tmp_path / 'test.bucket'))
+    assert limiter.try_acquire()
+    context = multiprocessing.get_context('fork')
+    results = context.Queue()
+    child = context.Process(target=acquire_in_child, args=(limiter, results))
+    child.start()
+    child.join(30)
+    assert results.get(timeout=5) == (True, True)
+    assert not limiter.try_acquire()
@@ -0,0 +1,61 @@
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from utils.rollups import TimeRollups
+
+START = datetime(2024, 3, 1, 9, 30)
+
+def at(hours):
+    return (START + timedelta(hours=hours)).timestamp()
+
+@pytest.fixture
+def rollups():
+    rollups = TimeRollups()
+    rollups.add(at(0), 'USA', False)
+    rollups.add(at(0.25), 'USA', True)
+    rollups.add(at(1), 'GBR', False)
+    rollups.add(at(24), 'USA', True)
+    return rollups
+
+def test_daily_timeline_for_all_regions(rollups):
+    assert rollups.timeline() == [
+        {'date': '2024-03-01', 'true_claims': 2, 'false_claims': 1},
+        {'date': '2024-03-02', 'true_claims': 0, 'false_claims': 1}
+    ]
+
+def test_hourly_timeline_for_one_region(rollups):
+    assert rollups.timeline(granularity='hour', region='USA') == [
+        {'date': '2024-03-01T09:00:00', 'true_claims': 1, 'false_claims': 1},
+        {'date': '2024-03-02T09:00:00', 'true_claims': 0, 'false_claims': 1}
+    ]
+    assert rollups.timeline(region='FRA') == []
+
+def test_bounds_include_the_buckets_containing_them(rollups):
+    hourly = rollups.timeline(START.replace(minute=59), datetime(2024, 3, 1, 10, 1), 'hour')
+    assert [b['date'] for b in hourly] == ['2024-03-01T09:00:00', '2024-03-01T10:00:00']
+    assert [b['date'] for b in rollups.timeline(start=date(2024, 3, 2))] == ['2024-03-02']
+    assert [b['date'] for b in rollups.timeline(end=date(2024, 3, 1))] == ['2024-03-01']
+
+def test_unknown_granularity_is_rejected(rollups):
+    with pytest.raises(ValueError):
+        rollups.timeline(granularity='minute')
+
+def test_hourly_buckets_are_pruned_after_retention():
+    rollups = TimeRollups(hourly_retention=timedelta(hours=2))
+    for hours in range(5):
+        rollups.add(at(hours), 'USA', False)
+    assert [b['date'][11:13] for b in rollups.timeline(granularity='hour')] == ['11', '12', '13']
+    # Daily buckets are kept for good
+    assert rollups.timeline()[0]['true_claims'] == 5
+
+def test_state_round_trips_through_json(rollups):
+    restored = TimeRollups()
+    restored.restore(json.loads(json.dumps(rollups.state())))
+    for granularity in ('hour', 'day'):
+        for region in (None, 'USA', 'GBR'):
+            assert restored.timeline(granularity=granularity, region=region) == \
+                rollups.timeline(granularity=granularity, region=region)
+    restored.add(at(0.5), 'USA', False)
+    assert restored.timeline(region='USA')[0]['true_claims'] == 2
@@ -0,0 +1,65 @@
+import json
+import os
+
+import numpy as np
+import pytest
+
+from utils.fact_checkers.local_index import append_segment
+from utils.fact_checkers.semantic import (SEMANTIC_MANIFEST, SemanticFactChecker,
+                                          build_semantic_index)
+
+TOPICS = ['vaccines', 'coffee', 'plastic bags', 'electric cars', 'fluoride', 'microplastics',
+          'solar panels', 'raw milk', 'energy drinks', 'drones']
+
+def facts(start, count):
+    return [{
+        'text': f'{TOPICS[i % len(TOPICS)]} were banned by parliament in {1950 + i}',
+        'rating': 'False',
+        'url': f'https://factcheck.example/{i}',
+        'publisher': 'Example Checks'
+    } for i in range(start, start + count)]
+
+def in_memory_matches(records, claim, **kwargs):
+    checker = SemanticFactChecker(records=records, **kwargs)
+    return [(m['record']['url'], round(m['score'], 5)) for m in checker.search([claim])[0]]
+
+@pytest.mark.parametrize('threshold', [1000, 1])
+def test_saved_index_is_mapped_and_matches_in_memory_search(tmp_path, threshold):
+    records = facts(0, 60)
+    append_segment(str(tmp_path), records[:30])
+    append_segment(str(tmp_path), records[30:])
+    manifest = build_semantic_index(str(tmp_path), approximate_threshold=threshold)
+    assert manifest['records'] == 60
+    assert manifest['kind'] == ('exact' if threshold > 1 else 'ivf')
+
+    checker = SemanticFactChecker(index_path=str(tmp_path), nprobe=64)
+    assert isinstance(checker.index.vectors, np.memmap)
+    claim = 'parliament banned coffee in 1961'
+    matches = [(m['record']['url'], round(m['score'], 5)) for m in checker.search([claim])[0]]
+    assert matches == in_memory_matches(records, claim, approximate_threshold=threshold, nprobe=64)
+    assert matches[0][0] == 'https://factcheck.example/11'
+
+def test_rebuild_replaces_previous_build(tmp_path):
+    append_segment(str(tmp_path), facts(0, 10))
+    first = build_semantic_index(str(tmp_path))
+    append_segment(str(tmp_path), facts(10, 10))
+    second = build_semantic_index(str(tmp_path))
+    assert second['records'] == 20
+    assert not os.path.exists(tmp_path / first['directory'])
+    with open(tmp_path / SEMANTIC_MANIFEST) as f:
+        assert json.load(f) == second
+
+def test_index_built_before_new_segments_is_still_used(tmp_path):
+    append_segment(str(tmp_path), facts(0, 10))
+    build_semantic_index(str(tmp_path))
+    append_segment(str(tmp_path), facts(10, 10))
+    checker = SemanticFactChecker(index_path=str(tmp_path))
+    assert checker.index.size == 10
+    assert checker.search(['parliament banned coffee in 1951'])[0][0]['record']['url'] == \
+        'https://factcheck.example/1'
+
+def test_without_saved_index_embeds_in_process(tmp_path):
+    append_segment(str(tmp_path), facts(0, 10))
+    checker = SemanticFactChecker(index_path=str(tmp_path))
+    assert checker.index.size == 10
+    assert not isinstance(checker.index.vectors, np.memmap)
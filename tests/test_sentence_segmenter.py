@@ -0,0 +1,36 @@
+from utils.sentence_segmenter import iter_sentences, iter_sentences_from_chunks
+
+def sentences(text):
+    return [sentence for sentence, _, _ in iter_sentences(text)]
+
+def test_no_ends_a_sentence_unless_a_number_follows():
+    assert sentences("The minister said no. Prices rose 5 percent in March.") == [
+        "The minister said no", "Prices rose 5 percent in March"
+    ]
+    assert sentences("Bill No. 5 passed. It takes effect today.") == [
+        "Bill No. 5 passed", "It takes effect today"
+    ]
+
+def test_abbreviations_and_decimals_do_not_end_sentences():
+    assert sentences("Dr. Smith said inflation hit 3.5% in the U.S. last year. Others disagree.") == [
+        "Dr. Smith said inflation hit 3.5% in the U.S. last year", "Others disagree"
+    ]
+
+def test_offsets_point_into_the_text():
+    text = "First claim here.  Second claim there."
+    for sentence, start, end in iter_sentences(text):
+        assert text[start:end] == sentence
+
+def test_chunked_input_matches_whole_text():
+    text = "The minister said no. Bill No. 7 passed. Dr. Who said 4.5 percent."
+    chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+    assert list(iter_sentences_from_chunks(chunks)) == list(iter_sentences(text))
+
+def test_number_after_no_in_the_next_chunk():
+    chunks = ['Bill No. ', '5 passed. It takes effect today.']
+    assert list(iter_sentences_from_chunks(chunks)) == list(iter_sentences(''.join(chunks)))
+
+def test_long_tokens_are_not_abbreviations():
+    assert sentences("See www.example.org/a-very-long-path-name-here. Then leave.") == [
+        "See www.example.org/a-very-long-path-name-here", "Then leave"
+    ]
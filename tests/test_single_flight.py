@@ -0,0 +1,97 @@
+import threading
+import time
+
+from utils.single_flight import CoalescingFactChecker, SingleFlight
+
+CALLERS = 8
+
+def run_concurrently(call, count=CALLERS):
+    """Run call in count threads; returns each thread's (result, error)."""
+    outcomes = [None] * count
+
+    def run(slot):
+        try:
+            outcomes[slot] = (call(slot), None)
+        except Exception as e:
+            outcomes[slot] = (None, e)
+
+    threads = [threading.Thread(target=run, args=(slot,)) for slot in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow(value):
+        calls.append(value)
+        release.wait(5)
+        return {'value': value}
+
+    threads, outcomes = run_concurrently(lambda slot: flight.do('key', slow, 'leader'))
+    # Everyone joins the call in flight before it completes
+    wait_for(lambda: flight.collapsed == CALLERS - 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['leader']
+    results = [result for result, _ in outcomes]
+    assert results == [{'value': 'leader'}] * CALLERS
+    assert all(result is results[0] for result in results)
+    assert flight.stats() == {'in_flight': 0, 'executions': 1, 'collapsed': CALLERS - 1}
+
+def test_error_is_raised_in_every_waiter():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def failing():
+        release.wait(5)
+        raise ValueError("upstream failed")
+
+    threads, outcomes = run_concurrently(lambda slot: flight.do('key', failing))
+    wait_for(lambda: flight.collapsed == CALLERS - 1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    errors = [error for _, error in outcomes]
+    assert all(isinstance(error, ValueError) for error in errors)
+    # The key is released, so the next call runs again
+    assert flight.do('key', lambda: 'retried') == 'retried'
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    assert flight.do('a', lambda: 1) == 1
+    assert flight.do('b', lambda: 2) == 2
+    assert flight.stats()['executions'] == 2
+
+class BlockingChecker:
+    def __init__(self):
+        self.release = threading.Event()
+        self.claims = []
+
+    def verify_claim(self, claim_text):
+        self.claims.append(claim_text)
+        self.release.wait(5)
+        return {'status': 'success', 'claim': claim_text}
+
+def test_checker_coalesces_claims_with_the_same_canonical_form():
+    checker = BlockingChecker()
+    coalescing = CoalescingFactChecker(checker)
+    texts = ["The moon is made of cheese.", "the moon is made of  cheese"]
+    threads, outcomes = run_concurrently(lambda slot: coalescing.verify_claim(texts[slot % 2]))
+    wait_for(lambda: coalescing.stats()['collapsed'] == CALLERS - 1)
+    checker.release.set()
+    for thread in threads:
+        thread.join()
+    assert len(checker.claims) == 1
+    assert len({id(result) for result, _ in outcomes}) == 1
@@ -0,0 +1,105 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from utils.fact_checkers.aggregator import FactCheckAggregator
+from utils.fact_checkers.base import BaseFactChecker, FactCheckResult
+from utils.fact_checkers.transport import DeadlineExceeded, HTTPTransport
+
+class StubHandler(BaseHTTPRequestHandler):
+    """/slow sleeps before answering, /unavailable answers 503 with a long Retry-After,
+    /flaky answers 503 to the first two requests."""
+
+    def do_GET(self):
+        self.server.requests += 1
+        if self.path == '/slow':
+            time.sleep(2)
+            self._reply(200)
+        elif self.path == '/unavailable':
+            self._reply(503, {'Retry-After': '3'})
+        elif self.path == '/flaky':
+            self._reply(503 if self.server.requests <= 2 else 200)
+        else:
+            self._reply(404)
+
+    def _reply(self, status, headers=()):
+        try:
+            self.send_response(status)
+            for name, value in dict(headers).items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'{}')
+        except OSError:
+            pass  # The client gave up
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    httpd.daemon_threads = True
+    httpd.requests = 0
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    httpd.url = f'http://127.0.0.1:{httpd.server_address[1]}'
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+@pytest.fixture
+def transport():
+    transport = HTTPTransport(read_timeout=10.0, max_retries=2, backoff_factor=0.01)
+    yield transport
+    transport.close()
+
+def test_retries_retryable_statuses(server, transport):
+    assert transport.get(server.url + '/flaky').status_code == 200
+    assert server.requests == 3
+
+def test_deadline_cuts_the_read_timeout(server, transport):
+    started = time.monotonic()
+    with pytest.raises(requests.exceptions.Timeout):
+        transport.get(server.url + '/slow', deadline=started + 0.3)
+    assert time.monotonic() - started < 1.0
+
+def test_no_retry_that_cannot_finish_before_the_deadline(server, transport):
+    started = time.monotonic()
+    response = transport.get(server.url + '/unavailable', deadline=started + 1.0)
+    assert response.status_code == 503
+    assert server.requests == 1
+    assert time.monotonic() - started < 1.0
+
+def test_passed_deadline_sends_nothing(server, transport):
+    with pytest.raises(DeadlineExceeded):
+        transport.get(server.url + '/flaky', deadline=time.monotonic() - 1)
+    assert server.requests == 0
+
+class SlowUpstreamChecker(BaseFactChecker):
+    def __init__(self, transport, url):
+        self.transport = transport
+        self.url = url
+
+    def verify_claim(self, claim_text):
+        try:
+            self.transport.get(self.url)
+        except requests.exceptions.RequestException as e:
+            return FactCheckResult(verified=False, status='error', error=str(e)).to_dict()
+        return FactCheckResult(verified=True, status='success', confidence=1.0).to_dict()
+
+    def get_source_info(self):
+        return {'name': 'Slow upstream'}
+
+def test_aggregator_deadline_frees_the_checker_thread(server, transport):
+    aggregator = FactCheckAggregator([SlowUpstreamChecker(transport, server.url + '/slow')],
+                                     checker_timeout=0.3, claim_timeout=1.0)
+    started = time.monotonic()
+    result = aggregator.verify_claim('The moon is made of cheese')
+    assert result['timed_out_sources'] == ['SlowUpstreamChecker']
+    # Without the deadline the request would hold the thread for the full 2s response
+    aggregator.shutdown(wait=True)
+    assert time.monotonic() - started < 1.0
+    assert server.requests == 1
@@ -0,0 +1,66 @@
+import time
+
+import requests
+
+from utils.fact_checkers.aggregator import FactCheckAggregator
+from utils.fact_checkers.google_fact_check import GoogleFactChecker
+from utils.verification_cache import LRUCache, VerificationCache
+
+class RefusingTransport:
+    """Transport whose upstream refuses every connection."""
+
+    def get(self, url, params=None, **kwargs):
+        raise requests.exceptions.ConnectionError("Connection refused")
+
+class EmptyTransport:
+    """Transport whose upstream knows no fact checks."""
+
+    def get(self, url, params=None, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{}'
+        return response
+
+def published_result():
+    return {
+        'verified': True,
+        'status': 'success',
+        'matching_facts': [{'text': 'claim', 'rating': 'False', 'publisher': 'PolitiFact'}],
+        'sources': ['PolitiFact'],
+        'confidence': 0.0
+    }
+
+def test_published_fact_checks_are_positive():
+    assert not VerificationCache.is_negative(published_result())
+
+def test_outage_placeholders_are_negative():
+    aggregator = FactCheckAggregator([GoogleFactChecker(transport=RefusingTransport())])
+    result = aggregator.verify_claim("The moon is made of cheese")
+    assert result['status'] == 'success'
+    assert VerificationCache.is_negative(result)
+
+def test_no_match_placeholders_are_negative():
+    result = GoogleFactChecker(transport=EmptyTransport()).verify_claim("The moon is made of cheese")
+    assert VerificationCache.is_negative(result)
+
+def test_outage_results_get_the_negative_ttl():
+    cache = VerificationCache(memory=LRUCache(), ttl=3600, negative_ttl=0.001)
+    aggregator = FactCheckAggregator([GoogleFactChecker(transport=RefusingTransport())], cache=cache)
+    aggregator.verify_claim("The moon is made of cheese")
+    time.sleep(0.01)
+    assert cache.get("The moon is made of cheese") is None
+
+def test_paraphrase_reuse_is_opt_in(monkeypatch):
+    monkeypatch.delenv('VERIFICATION_CACHE_SIMILARITY', raising=False)
+    assert VerificationCache.from_env().near_duplicates is None
+    monkeypatch.setenv('VERIFICATION_CACHE_SIMILARITY', '0.8')
+    assert VerificationCache.from_env().near_duplicates is not None
+
+def test_near_duplicate_lookup_misses_a_swapped_entity(monkeypatch):
+    monkeypatch.setenv('VERIFICATION_CACHE_SIMILARITY', '0.8')
+    cache = VerificationCache.from_env()
+    cache.set("Officials in Germany confirmed the new vaccine causes heart problems in adults",
+              published_result())
+    assert cache.get("Officials in France confirmed the new vaccine causes heart problems in adults") is None
+    assert cache.get("Reportedly officials in Germany confirmed the new vaccine causes heart problems "
+                     "in adults") == published_result()
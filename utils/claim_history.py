@@ -0,0 +1,97 @@
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+@dataclass(slots=True)
+class ClaimRecord:
+    """One tracked claim; timestamp is seconds since the epoch."""
+    text: str
+    timestamp: float
+    location: str
+    risk_level: str
+    sources: Tuple[str, ...]
+    is_false: bool
+
+    def to_dict(self) -> Dict:
+        """The claim in the shape served to the dashboard, with an ISO timestamp."""
+        return {
+            'text': self.text,
+            'timestamp': datetime.fromtimestamp(self.timestamp).isoformat(),
+            'location': self.location,
+            'risk_level': self.risk_level,
+            'sources': list(self.sources),
+            'is_false': self.is_false
+        }
+
+class ClaimHistory:
+    """Bounded, append-ordered store of tracked claims.
+
+    Records are kept in arrival order in a ring buffer, so the newest
+    claims are at the right end and the oldest fall off the left once
+    max_records or max_age is exceeded. Counters cover every claim ever
+    recorded, including those no longer retained.
+
+    Not thread-safe; the owner serializes access.
+    """
+
+    def __init__(self, max_records: int = 100000, max_age: Optional[float] = None):
+        """
+        Initialize the history.
+
+        Args:
+            max_records: Records retained
+            max_age: Seconds a record is retained, or None to keep records until displaced
+        """
+        self.max_records = max_records
+        self.max_age = max_age
+        self._records = deque(maxlen=max_records)
+        self.total = 0
+        self.false_total = 0
+
+    def append(self, record: ClaimRecord) -> None:
+        self._records.append(record)
+        self.total += 1
+        if record.is_false:
+            self.false_total += 1
+        if self.max_age is not None:
+            self.expire(record.timestamp - self.max_age)
+
+    def state(self) -> Dict:
+        """The history as JSON-serializable data, restorable with restore()."""
+        return {
+            'total': self.total,
+            'false_total': self.false_total,
+            'records': [[r.text, r.timestamp, r.location, r.risk_level, list(r.sources), r.is_false]
+                        for r in self._records]
+        }
+
+    def restore(self, state: Dict) -> None:
+        """Replace the history with one saved by state()."""
+        self._records.clear()
+        self._records.extend(
+            ClaimRecord(text, timestamp, location, risk_level, tuple(sources), is_false)
+            for text, timestamp, location, risk_level, sources, is_false in state['records']
+        )
+        self.total = state['total']
+        self.false_total = state['false_total']
+
+    def expire(self, cutoff: float) -> int:
+        """Drop records older than cutoff, returning how many were dropped."""
+        records = self._records
+        dropped = 0
+        while records and records[0].timestamp < cutoff:
+            records.popleft()
+            dropped += 1
+        return dropped
+
+    def latest(self, limit: int) -> List[ClaimRecord]:
+        """The newest records first, touching only the ones returned."""
+        return list(islice(reversed(self._records), limit))
+
+    def __iter__(self) -> Iterator[ClaimRecord]:
+        return iter(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
@@ -0,0 +1,196 @@
+import hashlib
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional
+
+_THOUSANDS_RE = re.compile(r'(?<=\d),(?=\d{3}(?!\d))')
+_DECIMAL_RE = re.compile(r'\b(\d+)\.(\d+)\b')
+# A minus sign is kept when it is not a hyphen inside a word ("-40" but "covid-19")
+_TOKEN_RE = re.compile(r'(?:(?<![^\W_])-)?\d+(?:\.\d+)?%?|[^\W\d_]+(?:\'[^\W\d_]+)?')
+_MINUS_SIGNS = str.maketrans({'\u2212': '-', '\u2013': '-'})
+# Words, and the sentence ends after which a capital letter says nothing about a name
+_NAME_TOKEN_RE = re.compile(r"[^\W\d_]+(?:'[^\W\d_]+)?|[.!?:](?!\w)")
+
+_STOPWORDS = frozenset([
+    'a', 'an', 'the', 'and', 'or', 'of', 'to', 'in', 'on', 'at', 'for', 'by',
+    'with', 'about', 'from', 'is', 'are', 'was', 'were', 'be', 'been', 'that',
+    'this', 'it', 'its', 'as', 'has', 'have', 'had'
+])
+_SUFFIXES = ('ing', 'ed', 'es', 's')
+# Negating words, as they appear after stemming
+_NEGATORS = frozenset(['no', 'not', 'never', 'none', 'nor', 'neither', 'nobody', 'noth', 'cannot', 'without'])
+
+def _normalize_decimal(match: re.Match) -> str:
+    """Drop trailing zeros from a decimal, so 3.50 and 3.5 compare equal."""
+    fraction = match.group(2).rstrip('0')
+    return match.group(1) + ('.' + fraction if fraction else '')
+
+def canonicalize_claim(text: str) -> str:
+    """
+    Canonical form of a claim used as its exact cache key.
+
+    Case, Unicode width, punctuation and whitespace are normalized, thousands
+    separators are removed and decimals lose trailing zeros. Signs of
+    negative numbers are kept.
+    """
+    text = unicodedata.normalize('NFKC', text).lower().translate(_MINUS_SIGNS)
+    text = _THOUSANDS_RE.sub('', text)
+    text = _DECIMAL_RE.sub(_normalize_decimal, text)
+    return ' '.join(_TOKEN_RE.findall(text))
+
+def _stem(token: str) -> str:
+    """Strip one common inflectional suffix from a word."""
+    if not token[0].isalpha():
+        return token
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            return token[:-len(suffix)]
+    return token
+
+def claim_tokens(canonical: str) -> List[str]:
+    """Stemmed content words of a canonical claim, in order."""
+    return [_stem(token) for token in canonical.split() if token not in _STOPWORDS]
+
+def claim_features(canonical: str) -> FrozenSet[str]:
+    """Stemmed content words of a canonical claim, used for near-duplicate matching."""
+    return frozenset(claim_tokens(canonical))
+
+# Universal hash family h(x) = (a * x + b) mod p for MinHash, fixed so
+# signatures are comparable across processes
+_MINHASH_PRIME = (1 << 61) - 1
+_MINHASH_COEFFICIENTS = [
+    (int.from_bytes(hashlib.blake2b(b'a%d' % i, digest_size=8).digest(), 'big') % (_MINHASH_PRIME - 1) + 1,
+     int.from_bytes(hashlib.blake2b(b'b%d' % i, digest_size=8).digest(), 'big') % _MINHASH_PRIME)
+    for i in range(256)
+]
+
+def minhash(features: Iterable[str], size: int) -> List[int]:
+    """MinHash signature of a feature set; equal positions estimate Jaccard similarity."""
+    values = [int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+              for feature in features]
+    return [min((a * value + b) % _MINHASH_PRIME for value in values)
+            for a, b in _MINHASH_COEFFICIENTS[:size]]
+
+def name_features(text: str) -> FrozenSet[str]:
+    """Stemmed capitalized words of a claim that do not open a sentence: its names."""
+    names = set()
+    sentence_start = True
+    for token in _NAME_TOKEN_RE.findall(unicodedata.normalize('NFKC', text)):
+        if not token[0].isalpha():
+            sentence_start = True
+            continue
+        if token[0].isupper() and not sentence_start:
+            word = token.lower()
+            if word not in _STOPWORDS:
+                names.add(_stem(word))
+        sentence_start = False
+    return frozenset(names)
+
+def exact_features(text: str, features: FrozenSet[str]) -> FrozenSet[str]:
+    """
+    Features that must match exactly for claims to be near duplicates.
+
+    These are the numbers and negators among a claim's features plus the
+    names in its original text (see name_features), so claims about a
+    different place, person or quantity are never conflated.
+    """
+    return frozenset(feature for feature in features
+                     if feature in _NEGATORS or feature.endswith("n't") or not feature[0].isalpha()
+                     ) | name_features(text)
+
+class NearDuplicateIndex:
+    """Bounded MinHash LSH index mapping paraphrased claims to a previously seen claim key.
+
+    Signatures are split into bands of rows values; claims sharing any
+    whole band are candidates, which are then compared by Jaccard
+    similarity. A near duplicate may add or drop words but not replace
+    them, since a swapped qualifier ("young" for "elderly") changes what
+    is claimed. With the default 8 bands of 4 rows, claims at 0.8
+    similarity share a band 98% of the time and unrelated claims almost
+    never, so a lookup compares only a handful of candidates.
+    """
+
+    def __init__(self, threshold: float = 0.8, capacity: int = 50000, bands: int = 8, rows: int = 4):
+        """
+        Initialize the index.
+
+        Args:
+            threshold: Minimum Jaccard similarity of claim features to count as a duplicate
+            capacity: Number of claims remembered; the oldest are forgotten first
+            bands: Number of MinHash bands used to find candidates
+            rows: Signature values per band; more rows make candidates rarer and stricter
+        """
+        self.threshold = threshold
+        self.capacity = capacity
+        self.bands = bands
+        self.rows = rows
+        self._entries = OrderedDict()  # key -> (band values, features, exact features)
+        self._tables = [dict() for _ in range(bands)]  # band value -> set of keys
+        self._lock = threading.Lock()
+        self.matches = 0
+
+    def _band_values(self, features: FrozenSet[str]) -> List[tuple]:
+        signature = minhash(features, self.bands * self.rows)
+        return [tuple(signature[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+
+    def add(self, key: str, features: FrozenSet[str], exact: FrozenSet[str]) -> None:
+        """Remember the features and exact features (see exact_features) of the claim stored under key."""
+        if not features:
+            return
+        band_values = self._band_values(features)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = (band_values, features, exact)
+            for table, value in zip(self._tables, band_values):
+                table.setdefault(value, set()).add(key)
+
+            while len(self._entries) > self.capacity:
+                old_key, (old_band_values, _, _) = self._entries.popitem(last=False)
+                for table, value in zip(self._tables, old_band_values):
+                    bucket = table.get(value)
+                    if bucket is not None:
+                        bucket.discard(old_key)
+                        if not bucket:
+                            del table[value]
+
+    def find(self, features: FrozenSet[str], exact: FrozenSet[str]) -> Optional[str]:
+        """
+        Return the key of the most similar remembered claim above the threshold.
+
+        Claims whose numbers, negations or names differ, or where each has
+        words the other lacks, are never near duplicates, however similar
+        the rest of their wording.
+        """
+        if not features:
+            return None
+        band_values = self._band_values(features)
+        best_key, best_score = None, self.threshold
+        with self._lock:
+            candidates = set()
+            for table, value in zip(self._tables, band_values):
+                candidates.update(table.get(value, ()))
+            for key in candidates:
+                _, other, other_exact = self._entries[key]
+                if other_exact != exact or not (features <= other or other <= features):
+                    continue
+                score = len(features & other) / len(features | other)
+                if score >= best_score:
+                    best_key, best_score = key, score
+            if best_key is not None:
+                self.matches += 1
+        return best_key
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """Get index size and match counter."""
+        return {
+            'entries': len(self._entries),
+            'matches': self.matches,
+            'threshold': self.threshold
+        }
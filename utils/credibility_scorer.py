@@ -1,5 +1,7 @@
 from typing import Dict, List
 
+from .records import CredibilityScore
+
 class CredibilityScorer:
     def __init__(self):
         self.score_weights = {
@@ -8,7 +10,7 @@ class CredibilityScorer:
             'claim_confidence': 0.3
         }
 
-    def calculate_score(self, claim_data: Dict, fact_check_results: Dict) -> Dict:
+    def calculate_score(self, claim_data: Dict, fact_check_results: Dict) -> CredibilityScore:
         """Calculate credibility score for a claim."""
         score = 0.0
         reasoning = []
@@ -42,14 +44,14 @@ class CredibilityScorer:
         # Ensure score is between 0 and 1
         score = max(0.0, min(1.0, score))
 
-        return {
-            'score': score,
-            'reasoning': reasoning,
-            'risk_level': self._get_risk_level(score),
-            'source_score': source_score,
-            'fact_score': fact_score,
-            'confidence_score': confidence_score
-        }
+        return CredibilityScore(
+            score=score,
+            reasoning=reasoning,
+            risk_level=self._get_risk_level(score),
+            source_score=source_score,
+            fact_score=fact_score,
+            confidence_score=confidence_score
+        )
 
     def _evaluate_sources(self, sources: List[str]) -> float:
         """Evaluate reliability of sources."""
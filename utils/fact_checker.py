@@ -1,28 +1,25 @@
 import requests
 from typing import Dict, List, Optional
-import time
 import json
-from datetime import datetime, timedelta
+from datetime import timedelta
 import os
+from .fact_checkers.transport import HTTPTransport, get_transport
+from .fact_checkers.local_index import LocalFactChecker
+from .verification_cache import LRUCache, VerificationCache
+from .rate_limiter import get_rate_limiter
 
 class FactCheckAPI:
-    def __init__(self, name: str, base_url: str, api_key: Optional[str] = None):
+    def __init__(self, name: str, base_url: str, api_key: Optional[str] = None,
+                 transport: Optional[HTTPTransport] = None, rate_limit: Optional[str] = None):
         self.name = name
         self.base_url = base_url
         self.api_key = api_key
-        self.last_request_time = None
-        self.rate_limit_delay = 1.0  # Seconds between requests
-
-    def check_rate_limit(self):
-        """Implement basic rate limiting."""
-        if self.last_request_time:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.rate_limit_delay:
-                time.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        self.transport = transport or get_transport()
+        # Shared token bucket for the upstream; every request attempt spends a token
+        self.rate_limiter = get_rate_limiter(rate_limit) if rate_limit else None
 
 class GoogleFactCheckAPI(FactCheckAPI):
-    def __init__(self):
+    def __init__(self, transport: Optional[HTTPTransport] = None):
         api_key = os.getenv('GOOGLE_FACT_CHECK_API_KEY')
         if not api_key:
             print("Warning: GOOGLE_FACT_CHECK_API_KEY not found in environment variables")
@@ -30,7 +27,9 @@ class GoogleFactCheckAPI(FactCheckAPI):
         super().__init__(
             name="Google Fact Check",
             base_url="https://factchecktools.googleapis.com/v1alpha1/claims:search",
-            api_key=api_key
+            api_key=api_key,
+            transport=transport,
+            rate_limit='google_fact_check'
         )
 
     def verify_claim(self, claim: str) -> Dict:
@@ -43,8 +42,6 @@ class GoogleFactCheckAPI(FactCheckAPI):
                     'source': self.name
                 }
 
-            self.check_rate_limit()
-
             # Clean and encode the claim text
             clean_claim = claim.strip().replace('.', '')  # Remove periods that might affect the query
 
@@ -54,7 +51,8 @@ class GoogleFactCheckAPI(FactCheckAPI):
                 'languageCode': 'en'
             }
 
-            response = requests.get(self.base_url, params=params)
+            response = self.transport.get(self.base_url, params=params,
+                                          rate_limiter=self.rate_limiter)
 
             if response.status_code == 400:
                 return {
@@ -97,37 +95,41 @@ class GoogleFactCheckAPI(FactCheckAPI):
             }
 
 class MockFactCheckAPI(FactCheckAPI):
-    """Fallback mock API when real services are unavailable."""
-    def __init__(self):
+    """Fallback local database when real services are unavailable.
+
+    Uses the indexed offline corpus named by LOCAL_FACT_INDEX when one is
+    configured, and a small built-in list of facts otherwise.
+    """
+    EXAMPLE_FACTS = (
+        ('vaccine', {
+            'text': 'Claims about vaccines containing microchips are false.',
+            'rating': 'False',
+            'url': 'https://www.example.com/facts/vaccines',
+            'publisher': 'Fact Check Database'
+        }),
+        ('moon', {
+            'text': 'While the Moon has ice deposits, there are no vast liquid oceans under its surface.',
+            'rating': 'False',
+            'url': 'https://www.example.com/facts/moon',
+            'publisher': 'Space Facts Database'
+        })
+    )
+
+    def __init__(self, index_path: Optional[str] = None):
         super().__init__(
             name="Local Database",
             base_url=None
         )
+        index_path = index_path or os.getenv('LOCAL_FACT_INDEX')
+        self.local_checker = LocalFactChecker(index_path) if index_path else None
 
     def verify_claim(self, claim: str) -> Dict:
         """Provide basic fact checking from local database."""
-        # Simple keyword-based matching for demonstration
-        example_facts = {
-            'vaccine': {
-                'text': 'Claims about vaccines containing microchips are false.',
-                'rating': 'False',
-                'url': 'https://www.example.com/facts/vaccines',
-                'publisher': 'Fact Check Database'
-            },
-            'moon': {
-                'text': 'While the Moon has ice deposits, there are no vast liquid oceans under its surface.',
-                'rating': 'False',
-                'url': 'https://www.example.com/facts/moon',
-                'publisher': 'Space Facts Database'
-            }
-        }
-
-        matching_facts = []
-        claim_lower = claim.lower()
-
-        for keyword, fact in example_facts.items():
-            if keyword in claim_lower:
-                matching_facts.append(fact)
+        if self.local_checker is not None:
+            matching_facts = self.local_checker.verify_claim(claim)['matching_facts']
+        else:
+            claim_lower = claim.lower()
+            matching_facts = [fact for keyword, fact in self.EXAMPLE_FACTS if keyword in claim_lower]
 
         return {
             'found': len(matching_facts) > 0,
@@ -136,22 +138,23 @@ class MockFactCheckAPI(FactCheckAPI):
         }
 
 class SnopesAPI(FactCheckAPI):
-    def __init__(self):
+    def __init__(self, transport: Optional[HTTPTransport] = None):
         super().__init__(
             name="Snopes",
-            base_url="https://www.snopes.com/api/search"
+            base_url="https://www.snopes.com/api/search",
+            transport=transport,
+            rate_limit='snopes'
         )
 
     def verify_claim(self, claim: str) -> Dict:
         """Search Snopes for fact checks."""
         try:
-            self.check_rate_limit()
-
             params = {
                 'query': claim
             }
 
-            response = requests.get(self.base_url, params=params)
+            response = self.transport.get(self.base_url, params=params,
+                                          rate_limiter=self.rate_limiter)
             response.raise_for_status()
 
             data = response.json()
@@ -191,21 +194,19 @@ class FactChecker:
             GoogleFactCheckAPI(),
             MockFactCheckAPI()  # Fallback service
         ]
-        self.cache = {}
         self.cache_duration = timedelta(hours=24)
+        self.cache = VerificationCache(
+            memory=LRUCache(max_entries=10000),
+            ttl=self.cache_duration.total_seconds()
+        )
 
     def _check_cache(self, claim: str) -> Optional[Dict]:
         """Check if we have a cached result for this claim."""
-        if claim in self.cache:
-            timestamp, result = self.cache[claim]
-            if datetime.now() - timestamp < self.cache_duration:
-                return result
-            del self.cache[claim]
-        return None
+        return self.cache.get(claim)
 
     def _update_cache(self, claim: str, result: Dict):
         """Update the cache with new results."""
-        self.cache[claim] = (datetime.now(), result)
+        self.cache.set(claim, result)
 
     def verify_claim(self, claim: str) -> Dict:
         """Verify a claim against multiple fact-checking services."""
@@ -1,66 +1,150 @@
-from typing import Dict, List
+from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from .base import BaseFactChecker, FactCheckResult
+from .transport import request_deadline
+from ..log import in_context
+from ..verification_cache import VerificationCache
 import logging
+import os
+import time
 
 class FactCheckAggregator:
     """Aggregates results from multiple fact checking services."""
 
-    def __init__(self, fact_checkers: List[BaseFactChecker]):
-        """Initialize with list of fact checkers."""
+    def __init__(self, fact_checkers: List[BaseFactChecker],
+                 max_workers: Optional[int] = None,
+                 checker_timeout: Optional[float] = None,
+                 claim_timeout: Optional[float] = None,
+                 cache: Optional[VerificationCache] = None):
+        """
+        Initialize with list of fact checkers.
+
+        Args:
+            fact_checkers: Fact checking services to query for every claim
+            max_workers: Size of the shared executor the checkers run on
+            checker_timeout: Seconds each checker gets before it is reported as timed out
+            claim_timeout: Seconds the whole claim gets across all checkers
+            cache: Optional cache consulted before any checker is queried
+        """
         self.fact_checkers = fact_checkers
-        logging.basicConfig(level=logging.INFO)
+        self.cache = cache
         self.logger = logging.getLogger(__name__)
 
         if not fact_checkers:
             self.logger.warning("No fact checkers provided to aggregator")
 
+        if max_workers is None:
+            max_workers = int(os.getenv('FACT_CHECK_MAX_WORKERS', 16))
+        if checker_timeout is None:
+            checker_timeout = float(os.getenv('FACT_CHECK_CHECKER_TIMEOUT', 5.0))
+        if claim_timeout is None:
+            claim_timeout = float(os.getenv('FACT_CHECK_CLAIM_TIMEOUT', 8.0))
+
+        self.checker_timeout = checker_timeout
+        self.claim_timeout = claim_timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix='fact-check')
+
     def verify_claim(self, claim_text: str) -> Dict:
+        """
+        Verify a claim, serving it from the cache when possible.
+
+        Args:
+            claim_text: The text of the claim to verify
+
+        Returns:
+            Dict containing aggregated results from all fact checkers
+        """
+        if self.cache is None:
+            return self._verify_uncached(claim_text)
+
+        cached = self.cache.get(claim_text)
+        if cached is not None:
+            self.logger.debug("Cache hit for claim: %.100s", claim_text)
+            return cached
+
+        result = self._verify_uncached(claim_text)
+        self.cache.set(claim_text, result)
+        return result
+
+    def _verify_uncached(self, claim_text: str) -> Dict:
         """
         Verify a claim using all available fact checking services.
 
+        The checkers run concurrently. A checker that misses its deadline, or is
+        still running when the claim deadline passes, is reported in
+        ``timed_out_sources`` and the aggregate is marked ``partial``.
+
         Args:
             claim_text: The text of the claim to verify
 
         Returns:
             Dict containing aggregated results from all fact checkers
         """
-        self.logger.info(f"Starting verification of claim: {claim_text[:100]}...")
+        self.logger.debug("Starting verification of claim: %.100s", claim_text)
 
-        all_results = []
         combined_sources = set()
         combined_facts = []
         overall_confidence = 0.0
         successful_checks = 0
         errors = []
-
-        for checker in self.fact_checkers:
+        timed_out = []
+
+        started = time.monotonic()
+        claim_deadline = started + self.claim_timeout
+        checker_deadline = started + self.checker_timeout
+        # Upstream requests made by the checkers give up at the same deadline,
+        # so a checker reported as timed out does not keep its thread busy
+        token = request_deadline.set(min(checker_deadline, claim_deadline))
+        try:
+            futures = [
+                (checker, self.executor.submit(in_context(checker.verify_claim), claim_text))
+                for checker in self.fact_checkers
+            ]
+        finally:
+            request_deadline.reset(token)
+
+        # Every checker is submitted at the same instant, so collecting the
+        # futures in order against absolute deadlines bounds the total wait.
+        for checker, future in futures:
+            name = checker.__class__.__name__
+            remaining = min(checker_deadline, claim_deadline) - time.monotonic()
             try:
-                self.logger.info(f"Using fact checker: {checker.__class__.__name__}")
-                result = checker.verify_claim(claim_text)
-                all_results.append(result)
-
-                if result['status'] == 'success':
-                    successful_checks += 1
-                    combined_sources.update(result['sources'])
-                    combined_facts.extend(result['matching_facts'])
-                    overall_confidence += result['confidence']
-                elif result['status'] == 'error':
-                    errors.append(f"{checker.__class__.__name__}: {result.get('error', 'Unknown error')}")
-
+                result = future.result(timeout=max(remaining, 0.0))
+            except FutureTimeoutError:
+                future.cancel()
+                self.logger.warning("Fact checker %s timed out", name)
+                timed_out.append(name)
+                continue
             except Exception as e:
-                self.logger.error(f"Error with fact checker {checker.__class__.__name__}: {str(e)}")
-                errors.append(f"{checker.__class__.__name__}: {str(e)}")
+                self.logger.error("Error with fact checker %s: %s", name, e)
+                errors.append(f"{name}: {str(e)}")
+                continue
+
+            if result['status'] == 'success':
+                successful_checks += 1
+                combined_sources.update(result['sources'])
+                combined_facts.extend(result['matching_facts'])
+                overall_confidence += result['confidence']
+            elif result['status'] == 'error':
+                errors.append(f"{name}: {result.get('error', 'Unknown error')}")
+
+        partial = bool(timed_out)
+        if timed_out:
+            errors.append("Timed out: " + ", ".join(timed_out))
 
         # Calculate aggregate confidence
         if successful_checks > 0:
             overall_confidence /= successful_checks
-            self.logger.info(f"Successfully aggregated results from {successful_checks} checkers")
+            self.logger.debug("Aggregated results from %d checkers", successful_checks)
         else:
             self.logger.warning("No successful fact checks")
             return FactCheckResult(
                 verified=False,
                 status="error",
-                error="All fact checkers failed: " + "; ".join(errors)
+                error="All fact checkers failed: " + "; ".join(errors),
+                partial=partial,
+                timed_out_sources=timed_out
             ).to_dict()
 
         # Create aggregate result
@@ -70,7 +154,9 @@ class FactCheckAggregator:
             sources=list(combined_sources),
             confidence=overall_confidence,
             status="success" if successful_checks > 0 else "error",
-            error=None if successful_checks > 0 else "; ".join(errors)
+            error="; ".join(errors) if partial else None,
+            partial=partial,
+            timed_out_sources=timed_out
         ).to_dict()
 
     def _deduplicate_facts(self, facts: List[Dict]) -> List[Dict]:
@@ -90,4 +176,8 @@ class FactCheckAggregator:
 
     def get_available_checkers(self) -> List[Dict]:
         """Get information about all available fact checkers."""
-        return [checker.get_source_info() for checker in self.fact_checkers]
\ No newline at end of file
+        return [checker.get_source_info() for checker in self.fact_checkers]
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Release the executor used to run the fact checkers."""
+        self.executor.shutdown(wait=wait)
@@ -1,6 +1,32 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 
+# Confidence assigned to textual ratings, checked in order as substrings
+RATING_SCORES = {
+    'TRUE': 1.0,
+    'MOSTLY TRUE': 0.8,
+    'MIXED': 0.5,
+    'MOSTLY FALSE': 0.2,
+    'FALSE': 0.0
+}
+
+def rating_score(textual_rating: str) -> float:
+    """Map a textual rating such as 'Mostly False' to a confidence score."""
+    textual_rating = (textual_rating or '').upper()
+    for key, score in RATING_SCORES.items():
+        if key in textual_rating:
+            return score
+    return 0.5  # Default score for unknown ratings
+
+# Publisher of the stand-in facts a checker returns when it found nothing or
+# could not reach its service; they keep the score neutral but verify nothing
+PLACEHOLDER_PUBLISHER = 'Fact Check System'
+
+def is_placeholder_fact(fact: Dict) -> bool:
+    """Whether a matching fact is a stand-in rather than a published fact check."""
+    return fact.get('publisher') == PLACEHOLDER_PUBLISHER
+
 class BaseFactChecker(ABC):
     """Base class for fact checking API integrations."""
     
@@ -28,23 +54,26 @@ class BaseFactChecker(ABC):
         """Get information about the fact checking source."""
         pass
 
+@dataclass(slots=True)
 class FactCheckResult:
     """Standardized fact check result object."""
-    
-    def __init__(self, 
-                 verified: bool = False,
-                 matching_facts: Optional[List] = None,
-                 sources: Optional[List] = None,
-                 confidence: float = 0.0,
-                 status: str = "unknown",
-                 error: Optional[str] = None):
-        self.verified = verified
-        self.matching_facts = matching_facts or []
-        self.sources = sources or []
-        self.confidence = confidence
-        self.status = status
-        self.error = error
-    
+    verified: bool = False
+    matching_facts: List = field(default_factory=list)
+    sources: List = field(default_factory=list)
+    confidence: float = 0.0
+    status: str = "unknown"
+    error: Optional[str] = None
+    partial: bool = False
+    timed_out_sources: List[str] = field(default_factory=list)
+    reasoning: List[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        # Callers pass None for "no items"
+        self.matching_facts = self.matching_facts or []
+        self.sources = self.sources or []
+        self.timed_out_sources = self.timed_out_sources or []
+        self.reasoning = self.reasoning or []
+
     def to_dict(self) -> Dict:
         """Convert result to dictionary format."""
         return {
@@ -53,5 +82,8 @@ class FactCheckResult:
             "sources": self.sources,
             "confidence": self.confidence,
             "status": self.status,
-            "error": self.error
+            "error": self.error,
+            "partial": self.partial,
+            "timed_out_sources": self.timed_out_sources,
+            "reasoning": self.reasoning
         }
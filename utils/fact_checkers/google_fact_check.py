@@ -1,28 +1,33 @@
 import requests
 from typing import Dict, List, Optional
-from .base import BaseFactChecker, FactCheckResult
+from .base import PLACEHOLDER_PUBLISHER, BaseFactChecker, FactCheckResult, rating_score
+from .transport import HTTPTransport, UpstreamRateLimited, get_transport
+from ..log import payload_sampler
+from ..rate_limiter import get_rate_limiter
 import logging
 import os
 
 class GoogleFactChecker(BaseFactChecker):
     """Google Fact Check API implementation."""
 
-    def __init__(self):
+    def __init__(self, transport: Optional[HTTPTransport] = None):
         """Initialize the fact checker."""
-        logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
 
         self.api_key = os.getenv('GOOGLE_FACT_CHECK_API_KEY')
         if not self.api_key:
             self.logger.warning("Google Fact Check API key not found")
 
-        # Initialize base URL for the API
-        self.base_url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
+        # Initialize base URL for the API; overridable to point at a proxy or a stub
+        self.base_url = os.getenv('GOOGLE_FACT_CHECK_API_URL',
+                                  "https://factchecktools.googleapis.com/v1alpha1/claims:search")
+        self.transport = transport or get_transport()
+        self.rate_limiter = get_rate_limiter('google_fact_check')
         self.logger.info("Initialized Google Fact Check API client")
 
     def verify_claim(self, claim_text: str) -> Dict:
         """Verify a claim using Google's Fact Check API."""
-        self.logger.info(f"Processing claim: {claim_text[:100]}...")
+        self.logger.debug("Processing claim: %.100s", claim_text)
 
         try:
             # Make API request
@@ -32,27 +37,26 @@ class GoogleFactChecker(BaseFactChecker):
                 'languageCode': 'en'
             }
 
-            self.logger.info("Making request to Google Fact Check API...")
-            response = requests.get(self.base_url, params=params)
+            response = self.transport.get(self.base_url, params=params,
+                                          rate_limiter=self.rate_limiter)
             response.raise_for_status()
 
             data = response.json()
-            self.logger.info(f"API Response received: {data}")
+            payload_sampler.log(self.logger, "Google Fact Check API response", data)
 
             claims = data.get('claims', [])
-            self.logger.info(f"Found {len(claims)} matching claims")
+            self.logger.debug("Found %d matching claims", len(claims))
 
             if not claims:
-                self.logger.info("No matching fact checks found")
                 return FactCheckResult(
                     verified=True,  # Changed to true to avoid 0% score
                     matching_facts=[{
                         'text': claim_text,
                         'rating': 'No Rating Available',
                         'title': 'No Direct Matches',
-                        'publisher': 'Fact Check System'
+                        'publisher': PLACEHOLDER_PUBLISHER
                     }],
-                    sources=['Fact Check System'],
+                    sources=[PLACEHOLDER_PUBLISHER],
                     confidence=0.5,  # Default neutral score
                     status="success",
                     reasoning=["No exact matching fact checks found, but the claim has been processed"]
@@ -87,7 +91,8 @@ class GoogleFactChecker(BaseFactChecker):
 
             avg_confidence = sum(ratings) / len(ratings) if ratings else 0.5
 
-            self.logger.info(f"Processed {len(matching_facts)} facts with average confidence {avg_confidence}")
+            self.logger.debug("Processed %d facts with average confidence %.2f",
+                              len(matching_facts), avg_confidence)
 
             return FactCheckResult(
                 verified=True,
@@ -98,8 +103,15 @@ class GoogleFactChecker(BaseFactChecker):
                 reasoning=[f"Found {len(matching_facts)} related fact checks"]
             ).to_dict()
 
+        except UpstreamRateLimited as e:
+            self.logger.warning("%s", e)
+            return FactCheckResult(
+                verified=False,
+                status="error",
+                error=str(e)
+            ).to_dict()
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"API request failed: {str(e)}")
+            self.logger.error("API request failed: %s", e)
             return FactCheckResult(
                 verified=True,  # Changed to true to avoid 0% score
                 status="success",
@@ -107,14 +119,14 @@ class GoogleFactChecker(BaseFactChecker):
                     'text': claim_text,
                     'rating': 'Unable to Verify',
                     'title': 'Service Unavailable',
-                    'publisher': 'Fact Check System'
+                    'publisher': PLACEHOLDER_PUBLISHER
                 }],
-                sources=['Fact Check System'],
+                sources=[PLACEHOLDER_PUBLISHER],
                 confidence=0.5,  # Default neutral score
                 reasoning=[f"Unable to connect to fact checking service: {str(e)}"]
             ).to_dict()
         except Exception as e:
-            self.logger.error(f"Unexpected error: {str(e)}")
+            self.logger.exception("Unexpected error: %s", e)
             return FactCheckResult(
                 verified=True,  # Changed to true to avoid 0% score
                 status="success",
@@ -122,9 +134,9 @@ class GoogleFactChecker(BaseFactChecker):
                     'text': claim_text,
                     'rating': 'Processing Error',
                     'title': 'System Error',
-                    'publisher': 'Fact Check System'
+                    'publisher': PLACEHOLDER_PUBLISHER
                 }],
-                sources=['Fact Check System'],
+                sources=[PLACEHOLDER_PUBLISHER],
                 confidence=0.5,  # Default neutral score
                 reasoning=[f"An error occurred during fact checking: {str(e)}"]
             ).to_dict()
@@ -134,21 +146,7 @@ class GoogleFactChecker(BaseFactChecker):
         if not review_rating:
             return 0.5  # Default neutral score
 
-        # Map textual ratings to confidence scores
-        rating_map = {
-            'TRUE': 1.0,
-            'MOSTLY TRUE': 0.8,
-            'MIXED': 0.5,
-            'MOSTLY FALSE': 0.2,
-            'FALSE': 0.0
-        }
-
-        textual_rating = review_rating.get('textualRating', '').upper()
-        for key, score in rating_map.items():
-            if key in textual_rating:
-                return score
-
-        return 0.5  # Default score for unknown ratings
+        return rating_score(review_rating.get('textualRating', ''))
 
     def get_source_info(self) -> Dict:
         """Get information about the fact checking source."""
@@ -0,0 +1,318 @@
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import re
+import time
+from typing import Dict, IO, Iterable, Iterator, List, Optional
+
+from .local_index import FactIndex, append_segment, load_manifest
+from ..log import configure_logging
+
+logger = logging.getLogger(__name__)
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# Keys of the top-level objects whose array holds the records: JSON-LD
+# graphs and Google Fact Check API responses
+_CONTAINER_KEYS = ('@graph', 'claims')
+
+def _open(path: str) -> IO[str]:
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', encoding='utf-8')
+    return open(path, encoding='utf-8')
+
+class _JSONScanner:
+    """Reads JSON values one at a time from a text stream, holding one value in memory."""
+
+    def __init__(self, stream: IO[str], chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        """Append more of the stream to the unread buffer; False at the end."""
+        # Reads grow with the pending value, so decoding a large value is not quadratic
+        chunk = self.stream.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if not chunk:
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """The next non-whitespace character, or '' at the end of the stream."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def advance(self) -> None:
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number or literal touching the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+def _iter_array(scanner: _JSONScanner) -> Iterator:
+    """Yield the elements of an array whose '[' has been consumed."""
+    while True:
+        char = scanner.peek()
+        if char == ']':
+            scanner.advance()
+            return
+        if char == ',':
+            scanner.advance()
+            continue
+        if not char:
+            raise scanner.error("Unterminated array")
+        yield scanner.value()
+
+def _iter_object(scanner: _JSONScanner) -> Iterator:
+    """
+    Yield the elements of a container array in an object, or else the object itself.
+
+    Only the container array is streamed; other members are small and
+    are decoded whole.
+    """
+    scanner.advance()
+    fields = {}
+    streamed = False
+    while True:
+        char = scanner.peek()
+        if char == '}':
+            scanner.advance()
+            if not streamed:
+                yield fields
+            return
+        if char == ',':
+            scanner.advance()
+            continue
+        if not char:
+            raise scanner.error("Unterminated object")
+        key = scanner.value()
+        if scanner.peek() != ':':
+            raise scanner.error("Expecting ':' delimiter")
+        scanner.advance()
+        if not streamed and key in _CONTAINER_KEYS and scanner.peek() == '[':
+            scanner.advance()
+            streamed = True
+            yield from _iter_array(scanner)
+        elif streamed:
+            scanner.value()
+        else:
+            fields[key] = scanner.value()
+
+def _iter_json_values(stream: IO[str], chunk_size: int = 1 << 16) -> Iterator:
+    """
+    Stream the values of a JSON document without parsing it as a whole.
+
+    A top-level array yields its elements one at a time, as does the
+    @graph or claims array of a top-level object. Any other document
+    yields itself, and concatenated or newline-delimited documents are
+    read in turn.
+    """
+    scanner = _JSONScanner(stream, chunk_size)
+    while True:
+        char = scanner.peek()
+        if not char:
+            return
+        if char == ',':
+            scanner.advance()
+        elif char == '[':
+            scanner.advance()
+            yield from _iter_array(scanner)
+        elif char == '{':
+            yield from _iter_object(scanner)
+        else:
+            yield scanner.value()
+
+def _expand(value) -> Iterator[Dict]:
+    """Unwrap containers such as @graph lists and Google API responses."""
+    if isinstance(value, list):
+        for item in value:
+            yield from _expand(item)
+    elif isinstance(value, dict):
+        if '@graph' in value:
+            yield from _expand(value['@graph'])
+        elif 'claims' in value and isinstance(value['claims'], list):
+            yield from _expand(value['claims'])
+        else:
+            yield value
+
+def _name(value) -> str:
+    if isinstance(value, dict):
+        return value.get('name', '') or ''
+    if isinstance(value, list) and value:
+        return _name(value[0])
+    return value or ''
+
+def normalize_record(record: Dict) -> Optional[Dict]:
+    """
+    Convert a ClaimReview JSON-LD object or Google Fact Check API claim to a fact.
+
+    Returns:
+        Dict with the keys GoogleFactChecker produces (text, claimant,
+        rating, title, url, publisher), or None when the record has no claim text
+    """
+    if 'claimReview' in record:
+        # Google Fact Check API claim
+        review = (record.get('claimReview') or [{}])[0]
+        fact = {
+            'text': record.get('text', ''),
+            'claimant': record.get('claimant', 'Unknown'),
+            'rating': review.get('textualRating', 'Unknown'),
+            'title': review.get('title', ''),
+            'url': review.get('url', ''),
+            'publisher': _name(review.get('publisher')) or 'Unknown'
+        }
+    elif 'claimReviewed' in record:
+        # schema.org ClaimReview
+        rating = record.get('reviewRating') or {}
+        item = record.get('itemReviewed') or {}
+        fact = {
+            'text': record.get('claimReviewed', ''),
+            'claimant': _name(item.get('author')) or 'Unknown',
+            'rating': rating.get('alternateName') or rating.get('name') or 'Unknown',
+            'title': record.get('name', '') or record.get('headline', ''),
+            'url': record.get('url', ''),
+            'publisher': _name(record.get('author')) or _name(record.get('publisher')) or 'Unknown'
+        }
+    else:
+        # Already in the fact shape
+        fact = {
+            'text': record.get('text', ''),
+            'claimant': record.get('claimant', 'Unknown'),
+            'rating': record.get('rating', 'Unknown'),
+            'title': record.get('title', ''),
+            'url': record.get('url', ''),
+            'publisher': record.get('publisher', 'Unknown')
+        }
+
+    if not isinstance(fact['text'], str) or not fact['text'].strip():
+        return None
+    fact['text'] = fact['text'].strip()
+    return fact
+
+def iter_facts(paths: Iterable[str]) -> Iterator[Dict]:
+    """Stream normalized facts from JSON, JSON-LD and JSONL files (optionally gzipped)."""
+    for path in paths:
+        with _open(path) as stream:
+            for value in _iter_json_values(stream):
+                for record in _expand(value):
+                    fact = normalize_record(record)
+                    if fact is not None:
+                        yield fact
+
+class FactImporter:
+    """Streams facts into a FactIndex, appending one segment per batch."""
+
+    def __init__(self, index_path: str, segment_size: int = 100000):
+        """
+        Initialize the importer.
+
+        Args:
+            index_path: Index directory, created if it does not exist
+            segment_size: Records buffered before a segment is written
+        """
+        self.index_path = index_path
+        self.segment_size = segment_size
+        self.existing = FactIndex(index_path) if load_manifest(index_path)['segments'] else None
+        self._seen = set()
+        self.stats = {'read': 0, 'written': 0, 'duplicates': 0, 'segments': 0}
+
+    def _is_duplicate(self, fact: Dict) -> bool:
+        """Deduplicate by URL, or by content for facts without one."""
+        url = fact.get('url')
+        key = url or json.dumps(fact, sort_keys=True)
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=8).digest()
+        if digest in self._seen:
+            return True
+        self._seen.add(digest)
+        return bool(url) and self.existing is not None and self.existing.contains_url(url)
+
+    def _flush(self, batch: List[Dict]) -> None:
+        if append_segment(self.index_path, batch):
+            self.stats['written'] += len(batch)
+            self.stats['segments'] += 1
+        batch.clear()
+
+    def run(self, facts: Iterable[Dict]) -> Dict:
+        """
+        Import facts and report throughput.
+
+        Returns:
+            Dict with read, written, duplicates, segments, seconds and records_per_second
+        """
+        started = time.perf_counter()
+        batch = []
+        for fact in facts:
+            self.stats['read'] += 1
+            if self._is_duplicate(fact):
+                self.stats['duplicates'] += 1
+                continue
+            batch.append(fact)
+            if len(batch) >= self.segment_size:
+                self._flush(batch)
+                logger.info("Imported %d records", self.stats['written'])
+        self._flush(batch)
+
+        elapsed = time.perf_counter() - started
+        self.stats['seconds'] = round(elapsed, 3)
+        self.stats['records_per_second'] = round(self.stats['read'] / elapsed, 1) if elapsed else 0.0
+        if self.existing is not None:
+            self.existing.close()
+        return self.stats
+
+def import_files(index_path: str, paths: Iterable[str], segment_size: int = 100000) -> Dict:
+    """Import ClaimReview dumps into a local fact index."""
+    return FactImporter(index_path, segment_size=segment_size).run(iter_facts(paths))
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Import ClaimReview datasets into a local fact index.")
+    parser.add_argument('index', help="index directory (created or appended to)")
+    parser.add_argument('files', nargs='*', help="JSON, JSON-LD or JSONL files, optionally .gz")
+    parser.add_argument('--segment-size', type=int, default=100000,
+                        help="records per segment (bounds memory use)")
+    parser.add_argument('--semantic', action='store_true',
+                        help="then rebuild the vectors used by semantic matching (needs numpy)")
+    args = parser.parse_args(argv)
+    if not args.files and not args.semantic:
+        parser.error("nothing to do: give files to import and/or --semantic")
+
+    configure_logging()
+    if args.files:
+        stats = import_files(args.index, args.files, segment_size=args.segment_size)
+        print(f"Read {stats['read']} records, wrote {stats['written']} "
+              f"({stats['duplicates']} duplicates) in {stats['segments']} segments")
+        print(f"{stats['records_per_second']} records/s over {stats['seconds']}s")
+    if args.semantic:
+        # numpy is only needed for semantic matching
+        from .semantic import build_semantic_index
+        started = time.perf_counter()
+        manifest = build_semantic_index(args.index)
+        print(f"Embedded {manifest['records']} records into a {manifest['kind']} index "
+              f"in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
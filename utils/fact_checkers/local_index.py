@@ -0,0 +1,319 @@
+import hashlib
+import json
+import logging
+import math
+import mmap
+import os
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from .base import BaseFactChecker, FactCheckResult, rating_score
+from ..claim_keys import canonicalize_claim, claim_features
+
+MANIFEST = 'manifest.json'
+FORMAT_VERSION = 1
+
+def term_hash(term: str) -> int:
+    """64-bit hash identifying a term in the lexicon."""
+    return int.from_bytes(hashlib.blake2b(term.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def record_terms(record: Dict) -> List[str]:
+    """Index terms of a fact check record: its claim text and title."""
+    text = ' '.join(filter(None, (record.get('text'), record.get('title'))))
+    return sorted(claim_features(canonicalize_claim(text)))
+
+def _open_array(path: str, typecode: str):
+    """Memory-map a file as a typed, read-only view."""
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return mapped, memoryview(mapped).cast(typecode)
+
+class _Segment:
+    """One immutable, memory-mapped segment of a fact index.
+
+    Files:
+        docs.bin      newline-separated JSON records
+        offsets.bin   uint64 start offset of every record, plus the end offset
+        doclen.bin    uint16 number of index terms per record
+        lexicon.bin   sorted (term hash, postings offset, document frequency) uint64 triples
+        postings.bin  uint32 record ids, grouped by term
+        urls.bin      sorted uint64 hashes of record URLs
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._maps = []
+        self.docs = self._map_bytes('docs.bin')
+        self.offsets = self._map('offsets.bin', 'Q')
+        self.doclen = self._map('doclen.bin', 'H')
+        self.lexicon = self._map('lexicon.bin', 'Q')
+        self.postings = self._map('postings.bin', 'I')
+        self.urls = self._map('urls.bin', 'Q')
+        self.size = len(self.offsets) - 1
+        self.terms = len(self.lexicon) // 3
+
+    def _map_bytes(self, name: str):
+        with open(os.path.join(self.path, name), 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._maps.append(mapped)
+        return mapped
+
+    def _map(self, name: str, typecode: str):
+        full_path = os.path.join(self.path, name)
+        if os.path.getsize(full_path) == 0:
+            return memoryview(array(typecode))
+        mapped, view = _open_array(full_path, typecode)
+        self._maps.append(mapped)
+        return view
+
+    def lookup(self, hashed: int) -> Optional[tuple]:
+        """Binary search the lexicon; returns (postings offset, document frequency)."""
+        lexicon = self.lexicon
+        lo, hi = 0, self.terms
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = lexicon[mid * 3]
+            if value < hashed:
+                lo = mid + 1
+            elif value > hashed:
+                hi = mid
+            else:
+                return lexicon[mid * 3 + 1], lexicon[mid * 3 + 2]
+        return None
+
+    def has_url(self, hashed: int) -> bool:
+        """Whether a record with this URL hash is stored in the segment."""
+        urls = self.urls
+        lo, hi = 0, len(urls)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if urls[mid] < hashed:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo < len(urls) and urls[lo] == hashed
+
+    def record(self, doc_id: int) -> Dict:
+        return json.loads(self.docs[self.offsets[doc_id]:self.offsets[doc_id + 1]])
+
+    def close(self) -> None:
+        self.offsets = self.doclen = self.lexicon = self.postings = self.urls = None
+        for mapped in self._maps:
+            mapped.close()
+        self._maps = []
+
+def write_segment(path: str, records: List[Dict]) -> None:
+    """Write records as a new immutable segment directory."""
+    os.makedirs(path)
+    offsets = array('Q')
+    doclen = array('H')
+    url_hashes = array('Q')
+    postings_by_term = {}
+
+    with open(os.path.join(path, 'docs.bin'), 'wb') as docs:
+        position = 0
+        for doc_id, record in enumerate(records):
+            data = json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+            offsets.append(position)
+            docs.write(data)
+            position += len(data)
+
+            terms = record_terms(record)
+            doclen.append(min(len(terms), 0xFFFF))
+            for term in terms:
+                postings_by_term.setdefault(term_hash(term), array('I')).append(doc_id)
+            if record.get('url'):
+                url_hashes.append(term_hash(record['url']))
+        offsets.append(position)
+
+    lexicon = array('Q')
+    postings = array('I')
+    for hashed in sorted(postings_by_term):
+        ids = postings_by_term[hashed]
+        lexicon.extend((hashed, len(postings), len(ids)))
+        postings.extend(ids)
+
+    for name, values in (('offsets.bin', offsets), ('doclen.bin', doclen), ('lexicon.bin', lexicon),
+                         ('postings.bin', postings), ('urls.bin', array('Q', sorted(url_hashes)))):
+        with open(os.path.join(path, name), 'wb') as f:
+            values.tofile(f)
+
+def load_manifest(index_path: str) -> Dict:
+    """Read an index manifest, or an empty one for a new index."""
+    path = os.path.join(index_path, MANIFEST)
+    if not os.path.exists(path):
+        return {'version': FORMAT_VERSION, 'segments': []}
+    with open(path) as f:
+        return json.load(f)
+
+def append_segment(index_path: str, records: List[Dict]) -> Optional[str]:
+    """
+    Add records to an index as a new segment, creating the index if needed.
+
+    The manifest is replaced atomically, so readers see either the old or
+    the new set of segments.
+
+    Returns:
+        Name of the new segment, or None when there was nothing to write
+    """
+    if not records:
+        return None
+    os.makedirs(index_path, exist_ok=True)
+    manifest = load_manifest(index_path)
+    number = max((int(name.split('-')[1]) for name in manifest['segments']), default=0) + 1
+    name = f"seg-{number:06d}"
+    write_segment(os.path.join(index_path, name), records)
+
+    manifest['segments'].append(name)
+    tmp_path = os.path.join(index_path, MANIFEST + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, os.path.join(index_path, MANIFEST))
+    return name
+
+class FactIndex:
+    """Read-only inverted index over a local corpus of fact checks.
+
+    Segments are memory-mapped, so opening an index costs a few system calls
+    and the pages are shared between every worker process that maps it.
+    """
+
+    def __init__(self, path: str, max_df_ratio: float = 0.2):
+        """
+        Open an index directory.
+
+        Args:
+            path: Directory containing manifest.json and the segment directories
+            max_df_ratio: Terms present in more than this share of records are ignored
+        """
+        self.path = path
+        self.max_df_ratio = max_df_ratio
+        manifest = load_manifest(path)
+        self.segment_names = manifest['segments']
+        self.segments = [_Segment(os.path.join(path, name)) for name in self.segment_names]
+        self.size = sum(segment.size for segment in self.segments)
+
+    def search(self, query: str, limit: int = 5) -> List[Dict]:
+        """
+        Rank records by the share of the query's IDF weight they contain.
+
+        Returns:
+            Up to limit dicts with 'score' (0 to 1) and 'record'
+        """
+        terms = claim_features(canonicalize_claim(query))
+        if not terms or not self.size:
+            return []
+
+        # Gather postings locations and global document frequencies
+        located = []
+        for term in terms:
+            hashed = term_hash(term)
+            hits = []
+            df = 0
+            for segment in self.segments:
+                entry = segment.lookup(hashed)
+                if entry is not None:
+                    hits.append((segment, entry[0], entry[1]))
+                    df += entry[1]
+            located.append((df, hits))
+
+        max_df = max(1, int(self.size * self.max_df_ratio))
+        query_weight = 0.0
+        scores = {}
+        for df, hits in located:
+            idf = math.log(1 + self.size / (df or 1))
+            query_weight += idf
+            if not df or df > max_df:
+                continue
+            for segment, start, count in hits:
+                for doc_id in segment.postings[start:start + count]:
+                    key = (id(segment), doc_id)
+                    scores[key] = scores.get(key, 0.0) + idf
+
+        if not scores:
+            return []
+
+        by_id = {id(segment): segment for segment in self.segments}
+        # Prefer records that match more of the query, then shorter records
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-item[1], by_id[item[0][0]].doclen[item[0][1]])
+        )[:limit]
+        return [
+            {'score': score / query_weight, 'record': by_id[seg_id].record(doc_id)}
+            for (seg_id, doc_id), score in ranked
+        ]
+
+    def contains_url(self, url: str) -> bool:
+        """Whether a record with this URL is already indexed."""
+        hashed = term_hash(url)
+        return any(segment.has_url(hashed) for segment in self.segments)
+
+    def record(self, record_id: int) -> Dict:
+        """Read a record by its position in index order."""
+        for segment in self.segments:
+            if record_id < segment.size:
+                return segment.record(record_id)
+            record_id -= segment.size
+        raise IndexError("record id out of range")
+
+    def iter_records(self) -> Iterable[Dict]:
+        """Stream every record in index order."""
+        for segment in self.segments:
+            for doc_id in range(segment.size):
+                yield segment.record(doc_id)
+
+    def close(self) -> None:
+        for segment in self.segments:
+            segment.close()
+        self.segments = []
+
+class LocalFactChecker(BaseFactChecker):
+    """Offline fact checker backed by a local FactIndex."""
+
+    def __init__(self, index_path: Optional[str] = None, limit: int = 5, min_score: float = 0.6):
+        """
+        Initialize the checker.
+
+        Args:
+            index_path: Index directory, defaulting to the LOCAL_FACT_INDEX variable
+            limit: Maximum number of matching fact checks returned
+            min_score: Minimum share of the claim's weight a match must cover
+        """
+        self.logger = logging.getLogger(__name__)
+        self.index_path = index_path or os.getenv('LOCAL_FACT_INDEX')
+        self.limit = limit
+        self.min_score = min_score
+        self.index = FactIndex(self.index_path)
+        self.logger.info("Opened local fact index with %d records", self.index.size)
+
+    def verify_claim(self, claim_text: str) -> Dict:
+        """Verify a claim against the local index."""
+        matches = [m for m in self.index.search(claim_text, limit=self.limit)
+                   if m['score'] >= self.min_score]
+
+        if not matches:
+            return FactCheckResult(verified=False, status="no_match").to_dict()
+
+        matching_facts = [m['record'] for m in matches]
+        sources = {fact.get('publisher') for fact in matching_facts if fact.get('publisher')}
+        confidence = sum(rating_score(fact.get('rating', '')) for fact in matching_facts) / len(matching_facts)
+
+        return FactCheckResult(
+            verified=True,
+            matching_facts=matching_facts,
+            sources=list(sources),
+            confidence=confidence,
+            status="success"
+        ).to_dict()
+
+    def get_source_info(self) -> Dict:
+        """Get information about the fact checking source."""
+        return {
+            "name": "Local Fact Check Index",
+            "description": "Offline index of previously published fact checks",
+            "website": None,
+            "features": ["Claim matching", "Offline", "Ranked results"]
+        }
@@ -0,0 +1,411 @@
+import json
+import logging
+import math
+import os
+import shutil
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .base import BaseFactChecker, FactCheckResult, rating_score
+from .local_index import FactIndex
+from ..claim_keys import canonicalize_claim, claim_tokens
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the size of a query-by-corpus score block, in floats
+_SCORE_BLOCK = 1 << 24
+
+# Points at the directory of the current saved semantic index of a FactIndex
+SEMANTIC_MANIFEST = 'semantic.json'
+
+def _bucket(feature: str) -> int:
+    """Stable 32-bit hash of a feature (Python's hash() differs between processes)."""
+    return zlib.crc32(feature.encode('utf-8'))
+
+class HashedNgramEmbedder:
+    """Embeds claims as IDF-weighted, L2-normalized hashed n-gram vectors.
+
+    Features are stemmed content words, adjacent word pairs and character
+    trigrams of each word, so reworded claims that share vocabulary or word
+    stems ("vaccinated" / "vaccination") land close together. No model
+    download is needed and embedding is deterministic across processes.
+    """
+
+    def __init__(self, dim: int = 512, bigram_weight: float = 0.5, char_weight: float = 0.3):
+        self.dim = dim
+        self.bigram_weight = bigram_weight
+        self.char_weight = char_weight
+        self.idf = np.ones(dim, dtype=np.float32)
+
+    def features(self, text: str) -> List[Tuple[str, float]]:
+        words = claim_tokens(canonicalize_claim(text))
+        features = [('w:' + word, 1.0) for word in words]
+        features.extend((f'b:{first} {second}', self.bigram_weight)
+                        for first, second in zip(words, words[1:]))
+        for word in words:
+            padded = f'#{word}#'
+            features.extend(('c:' + padded[i:i + 3], self.char_weight) for i in range(len(padded) - 2))
+        return features
+
+    def _counts(self, texts: Sequence[str]) -> np.ndarray:
+        rows, cols, values = [], [], []
+        for row, text in enumerate(texts):
+            for feature, weight in self.features(text):
+                hashed = _bucket(feature)
+                rows.append(row)
+                cols.append(hashed % self.dim)
+                # The sign bit keeps colliding features from only ever adding up
+                values.append(weight if hashed & 0x80000000 else -weight)
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        if rows:
+            np.add.at(matrix, (np.array(rows), np.array(cols)), np.array(values, dtype=np.float32))
+        return matrix
+
+    def fit(self, texts: Sequence[str]) -> np.ndarray:
+        """Learn IDF weights from a corpus and return its embeddings."""
+        counts = self._counts(texts)
+        self.set_idf(np.count_nonzero(counts, axis=0), len(texts))
+        return self._normalize(counts)
+
+    def set_idf(self, df: np.ndarray, total: int) -> None:
+        """Set IDF weights from the document frequencies of a corpus of total texts."""
+        self.idf = (np.log((1 + total) / (1 + df)) + 1).astype(np.float32)
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed a batch of texts as rows of a (len(texts), dim) float32 matrix."""
+        return self._normalize(self._counts(texts))
+
+    def _normalize(self, counts: np.ndarray) -> np.ndarray:
+        counts *= self.idf
+        norms = np.linalg.norm(counts, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        counts /= norms
+        return counts
+
+def _top_k(scores: np.ndarray, ids: np.ndarray, k: int) -> List[Tuple[int, float]]:
+    if len(scores) > k:
+        keep = np.argpartition(-scores, k - 1)[:k]
+        scores, ids = scores[keep], ids[keep]
+    order = np.argsort(-scores, kind='stable')
+    return [(int(ids[i]), float(scores[i])) for i in order]
+
+class ExactVectorIndex:
+    """Brute-force cosine search over normalized vectors."""
+
+    kind = 'exact'
+
+    def __init__(self, vectors: np.ndarray):
+        self.vectors = vectors
+        self.size = len(vectors)
+
+    def save(self, directory: str) -> None:
+        np.save(os.path.join(directory, 'vectors.npy'), self.vectors)
+
+    @classmethod
+    def load(cls, directory: str, nprobe: int = 8) -> 'ExactVectorIndex':
+        """Memory-map a saved index; pages are shared between processes."""
+        return cls(np.load(os.path.join(directory, 'vectors.npy'), mmap_mode='r'))
+
+    def search(self, queries: np.ndarray, k: int = 5) -> List[List[Tuple[int, float]]]:
+        """Return the k best (id, similarity) pairs for every query row."""
+        if not self.size:
+            return [[] for _ in range(len(queries))]
+        ids = np.arange(self.size)
+        results = []
+        block = max(1, _SCORE_BLOCK // self.size)
+        for start in range(0, len(queries), block):
+            scores = queries[start:start + block] @ self.vectors.T
+            results.extend(_top_k(row, ids, k) for row in scores)
+        return results
+
+class IVFVectorIndex:
+    """Approximate cosine search with an inverted file over k-means clusters.
+
+    Vectors are grouped by their nearest centroid and stored contiguously per
+    cluster. A query scores only the clusters of its nprobe nearest
+    centroids, trading a little recall for search cost that grows with
+    roughly the square root of the corpus instead of its size.
+    """
+
+    kind = 'ivf'
+    _ARRAYS = ('centroids', 'ids', 'vectors', 'offsets')
+
+    def __init__(self, vectors: np.ndarray, nlist: Optional[int] = None, nprobe: int = 8,
+                 iterations: int = 10, sample_size: int = 50000, seed: int = 0):
+        self.size = len(vectors)
+        self.nprobe = nprobe
+        nlist = nlist or max(1, int(math.sqrt(self.size)))
+        rng = np.random.default_rng(seed)
+        sample = vectors[rng.choice(self.size, min(self.size, sample_size), replace=False)]
+        self.centroids = self._train(sample, min(nlist, len(sample)), iterations, rng)
+
+        assignments = self._assign(vectors)
+        order = np.argsort(assignments, kind='stable')
+        self.ids = order
+        self.vectors = vectors[order]
+        counts = np.bincount(assignments, minlength=len(self.centroids))
+        self.offsets = np.concatenate(([0], np.cumsum(counts)))
+
+    def save(self, directory: str) -> None:
+        for name in self._ARRAYS:
+            np.save(os.path.join(directory, name + '.npy'), getattr(self, name))
+
+    @classmethod
+    def load(cls, directory: str, nprobe: int = 8) -> 'IVFVectorIndex':
+        """Memory-map a saved index without retraining; pages are shared between processes."""
+        index = cls.__new__(cls)
+        for name in cls._ARRAYS:
+            setattr(index, name, np.load(os.path.join(directory, name + '.npy'), mmap_mode='r'))
+        index.size = len(index.ids)
+        index.nprobe = nprobe
+        return index
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        block = max(1, _SCORE_BLOCK // len(self.centroids))
+        return np.concatenate([
+            np.argmax(vectors[start:start + block] @ self.centroids.T, axis=1)
+            for start in range(0, len(vectors), block)
+        ])
+
+    @staticmethod
+    def _train(sample: np.ndarray, nlist: int, iterations: int, rng) -> np.ndarray:
+        """Spherical k-means: centroids are kept unit length."""
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            empty = ~sums.any(axis=1)
+            # Reseed empty clusters with random sample vectors
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = sums / norms
+        return centroids.astype(np.float32)
+
+    def search(self, queries: np.ndarray, k: int = 5) -> List[List[Tuple[int, float]]]:
+        """Return the approximate k best (id, similarity) pairs for every query row."""
+        nprobe = min(self.nprobe, len(self.centroids))
+        probes = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+        results = []
+        for query, clusters in zip(queries, probes):
+            slices = [slice(self.offsets[c], self.offsets[c + 1]) for c in clusters]
+            candidates = np.concatenate([self.vectors[s] for s in slices])
+            if not len(candidates):
+                results.append([])
+                continue
+            ids = np.concatenate([self.ids[s] for s in slices])
+            results.append(_top_k(candidates @ query, ids, k))
+        return results
+
+_INDEX_TYPES = {index_type.kind: index_type for index_type in (ExactVectorIndex, IVFVectorIndex)}
+
+def _texts(index: FactIndex, batch_size: int) -> Iterable[List[str]]:
+    batch = []
+    for record in index.iter_records():
+        batch.append(record.get('text', ''))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def load_semantic_manifest(index_path: str) -> Optional[Dict]:
+    """Read the manifest of the saved semantic index of a FactIndex, if it has one."""
+    path = os.path.join(index_path, SEMANTIC_MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def build_semantic_index(index_path: str, dim: int = 512, approximate_threshold: Optional[int] = None,
+                         batch_size: int = 10000) -> Dict:
+    """
+    Embed the records of a FactIndex and save their vectors and search index next to it.
+
+    Meant to run offline after an import, so checkers only map the saved
+    arrays. The semantic manifest is replaced atomically, and the previous
+    build is removed afterwards; processes still mapping it keep their pages.
+
+    Args:
+        index_path: FactIndex directory
+        dim: Embedding dimensions
+        approximate_threshold: Corpora of at least this many records get an IVF
+            index (SEMANTIC_APPROXIMATE_THRESHOLD, 50000)
+        batch_size: Records embedded at a time
+
+    Returns:
+        The new semantic manifest: directory, segments, records, dim and kind
+    """
+    if approximate_threshold is None:
+        approximate_threshold = int(os.getenv('SEMANTIC_APPROXIMATE_THRESHOLD', 50000))
+    index = FactIndex(index_path)
+    try:
+        # Two passes keep only one batch of sparse counts in memory at a time
+        embedder = HashedNgramEmbedder(dim)
+        df = np.zeros(dim, dtype=np.int64)
+        for texts in _texts(index, batch_size):
+            df += np.count_nonzero(embedder._counts(texts), axis=0)
+        embedder.set_idf(df, index.size)
+        vectors = np.empty((index.size, dim), dtype=np.float32)
+        start = 0
+        for texts in _texts(index, batch_size):
+            vectors[start:start + len(texts)] = embedder.embed(texts)
+            start += len(texts)
+        segments = index.segment_names
+    finally:
+        index.close()
+
+    if len(vectors) and len(vectors) >= approximate_threshold:
+        vector_index = IVFVectorIndex(vectors)
+    else:
+        vector_index = ExactVectorIndex(vectors)
+
+    previous = load_semantic_manifest(index_path)
+    number = int(previous['directory'].split('-')[1]) + 1 if previous else 1
+    name = f"semantic-{number:06d}"
+    directory = os.path.join(index_path, name)
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, 'idf.npy'), embedder.idf)
+    vector_index.save(directory)
+
+    manifest = {'directory': name, 'segments': segments, 'records': len(vectors),
+                'dim': dim, 'kind': vector_index.kind}
+    tmp_path = os.path.join(index_path, SEMANTIC_MANIFEST + '.tmp')
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, os.path.join(index_path, SEMANTIC_MANIFEST))
+    if previous:
+        shutil.rmtree(os.path.join(index_path, previous['directory']), ignore_errors=True)
+    logger.info("Saved %s over %d fact checks to %s", vector_index.__class__.__name__, len(vectors), directory)
+    return manifest
+
+def load_semantic_index(index_path: str, segments: Sequence[str], nprobe: int = 8):
+    """
+    Map the saved semantic index of a FactIndex.
+
+    Args:
+        index_path: FactIndex directory
+        segments: Segments of the FactIndex as opened; the saved index must cover a prefix of them
+        nprobe: Clusters searched per query by an IVF index
+
+    Returns:
+        (embedder, vector index), or None when nothing usable is saved
+    """
+    manifest = load_semantic_manifest(index_path)
+    if manifest is None:
+        return None
+    covered = manifest['segments']
+    if list(segments[:len(covered)]) != covered:
+        logger.warning("Saved semantic index of %s does not match its segments", index_path)
+        return None
+    if len(covered) < len(segments):
+        logger.warning("Saved semantic index of %s covers %d of %d segments; rebuild it to match "
+                       "the newer fact checks", index_path, len(covered), len(segments))
+
+    directory = os.path.join(index_path, manifest['directory'])
+    embedder = HashedNgramEmbedder(manifest['dim'])
+    embedder.idf = np.load(os.path.join(directory, 'idf.npy'))
+    return embedder, _INDEX_TYPES[manifest['kind']].load(directory, nprobe=nprobe)
+
+class SemanticFactChecker(BaseFactChecker):
+    """Matches reworded claims against known fact checks by vector similarity."""
+
+    def __init__(self, records: Optional[Iterable[Dict]] = None, index_path: Optional[str] = None,
+                 dim: int = 512, min_similarity: float = 0.5, limit: int = 5,
+                 approximate_threshold: Optional[int] = None, nprobe: int = 8):
+        """
+        Initialize the checker.
+
+        Args:
+            records: Fact check records, embedded in memory; when omitted, the
+                saved semantic index of the FactIndex at index_path is mapped
+            index_path: FactIndex directory, defaulting to the LOCAL_FACT_INDEX variable
+            dim: Embedding dimensions when embedding in memory
+            min_similarity: Minimum cosine similarity of a match
+            limit: Maximum number of matching fact checks returned
+            approximate_threshold: Corpora of at least this many records use the
+                IVF index (SEMANTIC_APPROXIMATE_THRESHOLD, 50000)
+            nprobe: Clusters searched per query by the IVF index
+        """
+        self.logger = logging.getLogger(__name__)
+        self.min_similarity = min_similarity
+        self.limit = limit
+        if approximate_threshold is None:
+            approximate_threshold = int(os.getenv('SEMANTIC_APPROXIMATE_THRESHOLD', 50000))
+
+        if records is None:
+            index_path = index_path or os.getenv('LOCAL_FACT_INDEX')
+            # Matches are read from the mapped segments, not kept as dicts
+            self.fact_index = FactIndex(index_path)
+            self._record = self.fact_index.record
+            loaded = load_semantic_index(index_path, self.fact_index.segment_names, nprobe=nprobe)
+            if loaded is not None:
+                self.embedder, self.index = loaded
+                self.logger.info("Mapped %s over %d fact checks", self.index.__class__.__name__,
+                                 self.index.size)
+                return
+            self.logger.warning("No saved semantic index in %s, embedding fact checks in process; "
+                                "build one with the importer's --semantic option", index_path)
+            texts = [record.get('text', '') for record in self.fact_index.iter_records()]
+        else:
+            self.fact_index = None
+            records = list(records)
+            self._record = records.__getitem__
+            texts = [record.get('text', '') for record in records]
+
+        self.embedder = HashedNgramEmbedder(dim)
+        vectors = self.embedder.fit(texts)
+        if len(texts) >= approximate_threshold:
+            self.index = IVFVectorIndex(vectors, nprobe=nprobe)
+        else:
+            self.index = ExactVectorIndex(vectors)
+        self.logger.info("Built %s over %d fact checks", self.index.__class__.__name__, len(texts))
+
+    def search(self, claim_texts: Sequence[str], limit: Optional[int] = None) -> List[List[Dict]]:
+        """
+        Find the fact checks most similar to each claim, in one batch.
+
+        Returns:
+            For every claim, up to limit dicts with 'score' (cosine similarity) and 'record'
+        """
+        queries = self.embedder.embed(claim_texts)
+        hits = self.index.search(queries, limit or self.limit)
+        return [[{'score': score, 'record': self._record(doc_id)} for doc_id, score in matches]
+                for matches in hits]
+
+    def verify_claims(self, claim_texts: Sequence[str]) -> List[Dict]:
+        """Verify a batch of claims with a single embedding and search pass."""
+        return [self._result(matches) for matches in self.search(claim_texts)]
+
+    def verify_claim(self, claim_text: str) -> Dict:
+        """Verify a claim against the known fact checks."""
+        return self.verify_claims([claim_text])[0]
+
+    def _result(self, matches: List[Dict]) -> Dict:
+        matching_facts = [m['record'] for m in matches if m['score'] >= self.min_similarity]
+        if not matching_facts:
+            return FactCheckResult(verified=False, status="no_match").to_dict()
+
+        sources = {fact.get('publisher') for fact in matching_facts if fact.get('publisher')}
+        confidence = sum(rating_score(fact.get('rating', '')) for fact in matching_facts) / len(matching_facts)
+        return FactCheckResult(
+            verified=True,
+            matching_facts=matching_facts,
+            sources=list(sources),
+            confidence=confidence,
+            status="success"
+        ).to_dict()
+
+    def get_source_info(self) -> Dict:
+        """Get information about the fact checking source."""
+        return {
+            "name": "Semantic Fact Check Matcher",
+            "description": "Finds previously published fact checks of reworded claims by vector similarity",
+            "website": None,
+            "features": ["Paraphrase matching", "Offline", "Batched queries"]
+        }
@@ -0,0 +1,170 @@
+import contextvars
+import logging
+import os
+import random
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ..rate_limiter import RateLimiter, RateLimitExceeded
+
+# Monotonic time by which the current unit of work must finish; the
+# aggregator sets it for every checker, so requests made on its behalf
+# give up when it does instead of holding a worker thread
+request_deadline = contextvars.ContextVar('request_deadline', default=None)
+
+class UpstreamRateLimited(RateLimitExceeded, requests.exceptions.RequestException):
+    """No rate limit token was available for a request attempt."""
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """The request deadline passed before a response was received."""
+
+class HTTPTransport:
+    """Pooled keep-alive HTTP client shared by the fact checking backends."""
+
+    def __init__(self,
+                 connect_timeout: float = 3.05,
+                 read_timeout: float = 10.0,
+                 max_retries: int = 2,
+                 backoff_factor: float = 0.25,
+                 backoff_max: float = 4.0,
+                 pool_connections: int = 8,
+                 pool_maxsize: int = 16,
+                 pool_block: bool = True,
+                 retry_statuses: Iterable[int] = (429, 500, 502, 503, 504),
+                 rate_limit_wait: float = 2.0):
+        """
+        Initialize the transport.
+
+        Args:
+            connect_timeout: Seconds allowed to establish a connection
+            read_timeout: Seconds allowed between bytes of the response
+            max_retries: Extra attempts after a connection error, timeout or retryable status
+            backoff_factor: Base delay of the exponential backoff between attempts
+            backoff_max: Upper bound on a single backoff delay
+            pool_connections: Number of hosts whose connection pools are kept
+            pool_maxsize: Keep-alive connections kept per host
+            pool_block: Wait for a free connection instead of exceeding pool_maxsize
+            retry_statuses: HTTP statuses that are retried
+            rate_limit_wait: Seconds an attempt may wait for a rate limit token
+        """
+        self.logger = logging.getLogger(__name__)
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.rate_limit_wait = rate_limit_wait
+
+        # Retries are handled here so they can be jittered and logged; the
+        # adapter only owns the per-host connection pools.
+        adapter = HTTPAdapter(pool_connections=pool_connections,
+                              pool_maxsize=pool_maxsize,
+                              pool_block=pool_block,
+                              max_retries=0)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def get(self, url: str, params: Optional[Dict] = None, **kwargs) -> requests.Response:
+        """Send a GET request through the pool."""
+        return self.request('GET', url, params=params, **kwargs)
+
+    def request(self, method: str, url: str, rate_limiter: Optional[RateLimiter] = None,
+                deadline: Optional[float] = None, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying connection failures and retryable statuses.
+
+        Returns the last response received, so callers keep using
+        ``raise_for_status``. The last connection error is re-raised once
+        the retries are exhausted. When a rate limiter is given every
+        attempt, retries included, spends one of its tokens.
+
+        Args:
+            deadline: time.monotonic() value by which to give up, defaulting to
+                request_deadline; attempt timeouts, rate limit waits and backoff
+                are cut to fit, and no retry is started that could not finish
+        """
+        timeout = kwargs.pop('timeout', self.timeout)
+        if deadline is None:
+            deadline = request_deadline.get()
+
+        attempt = 0
+        while True:
+            rate_limit_wait, attempt_timeout = self.rate_limit_wait, timeout
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DeadlineExceeded(f"Deadline passed before {method} {url}")
+                rate_limit_wait = min(rate_limit_wait, remaining)
+                attempt_timeout = self._cap_timeout(timeout, remaining)
+            if rate_limiter is not None and not rate_limiter.acquire(timeout=rate_limit_wait):
+                raise UpstreamRateLimited(f"Rate limit exceeded for {rate_limiter.name}")
+            try:
+                response = self.session.request(method, url, timeout=attempt_timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                delay = self._backoff(attempt)
+                if attempt >= self.max_retries or not self._can_retry(delay, deadline):
+                    raise
+                self.logger.warning("%s %s failed (%s), retrying in %.2fs",
+                                    method, url, e.__class__.__name__, delay)
+            else:
+                if response.status_code not in self.retry_statuses:
+                    return response
+                delay = self._backoff(attempt, response.headers.get('Retry-After'))
+                if attempt >= self.max_retries or not self._can_retry(delay, deadline):
+                    return response
+                self.logger.warning("%s %s returned %d, retrying in %.2fs",
+                                    method, url, response.status_code, delay)
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _cap_timeout(timeout, remaining: float):
+        """A requests timeout (a number or a (connect, read) pair) cut to remaining seconds."""
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        return min(timeout, remaining)
+
+    @staticmethod
+    def _can_retry(delay: float, deadline: Optional[float]) -> bool:
+        """Whether a retry after delay seconds would start before the deadline."""
+        return deadline is None or time.monotonic() + delay < deadline
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Full-jitter exponential backoff, honouring a numeric Retry-After."""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_factor * (2 ** attempt)))
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+def get_transport() -> HTTPTransport:
+    """Get the process-wide transport, configured from the environment."""
+    global _default_transport
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = HTTPTransport(
+                    connect_timeout=float(os.getenv('HTTP_CONNECT_TIMEOUT', 3.05)),
+                    read_timeout=float(os.getenv('HTTP_READ_TIMEOUT', 10.0)),
+                    max_retries=int(os.getenv('HTTP_MAX_RETRIES', 2)),
+                    pool_maxsize=int(os.getenv('HTTP_POOL_MAXSIZE', 16)),
+                    rate_limit_wait=float(os.getenv('RATE_LIMIT_MAX_WAIT', 2.0))
+                )
+    return _default_transport
@@ -0,0 +1,169 @@
+import argparse
+import functools
+import gzip
+import os
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+ENTITY_TYPES = ('COUNTRY', 'ORGANIZATION', 'PERSON', 'OUTLET')
+
+DEFAULT_PATH = os.path.join(os.path.dirname(__file__), 'data', 'gazetteer.tsv.gz')
+
+# Trie nodes map token keys to child nodes; the entity type of a complete
+# name is stored under the empty key, so lookups skip empty token keys
+_TYPE = ''
+
+# Characters stripped from the ends of a token before matching
+_EDGE_PUNCTUATION = '"\'()[]{}<>,;:!?“”‘’*'
+# Trailing punctuation that ends a name: "France, Germany" is two names
+_BREAKS = tuple(',;:)]}"”')
+
+def clean_token(word: str) -> str:
+    """Surface form of a token: surrounding punctuation and possessives removed."""
+    if word.isalpha():
+        return word
+    token = word.strip(_EDGE_PUNCTUATION)
+    for suffix in ("'s", "’s"):
+        if token.endswith(suffix):
+            token = token[:-2]
+    if token.endswith('.') and token.count('.') == 1:
+        token = token[:-1]
+    return token
+
+def token_key(token: str) -> str:
+    """Matching key of a token: case and periods are ignored ("U.S." == "US")."""
+    if '.' in token:
+        token = token.replace('.', '')
+    return token.lower()
+
+def ends_name(word: str) -> bool:
+    """Whether punctuation after this token separates it from the next one."""
+    return word.endswith(_BREAKS)
+
+class Gazetteer:
+    """Token trie over entity names for longest-match lookup.
+
+    Matching a name costs one dict lookup per token, so scanning a
+    sentence is linear in its length times the longest name (a handful of
+    tokens), independent of how many names are loaded.
+    """
+
+    def __init__(self):
+        self.root: Dict = {}
+        self.size = 0
+
+    def add(self, name: str, entity_type: str) -> None:
+        keys = [token_key(clean_token(word)) for word in name.split()]
+        keys = [key for key in keys if key]
+        if not keys:
+            return
+        node = self.root
+        for key in keys:
+            node = node.setdefault(key, {})
+        if _TYPE not in node:
+            self.size += 1
+        node[_TYPE] = entity_type
+
+    def longest_match(self, words: List[str], start: int) -> Optional[Tuple[int, str]]:
+        """
+        Find the longest name starting at words[start].
+
+        A name does not continue past punctuation such as a comma.
+
+        Returns:
+            (end index, entity type), or None when no name starts there
+        """
+        node = self.root
+        match = None
+        for index in range(start, len(words)):
+            word = words[index]
+            key = token_key(clean_token(word))
+            # Bare punctuation such as "(" ends a name
+            if not key:
+                break
+            node = node.get(key)
+            if node is None:
+                break
+            if _TYPE in node:
+                match = (index + 1, node[_TYPE])
+            if ends_name(word):
+                break
+        return match
+
+    def __contains__(self, name: str) -> bool:
+        words = name.split()
+        match = self.longest_match(words, 0)
+        return match is not None and match[0] == len(words)
+
+    @classmethod
+    def load(cls, path: str) -> 'Gazetteer':
+        """Load a gazetteer from a TSV file of ``TYPE<tab>name`` lines, optionally gzipped."""
+        gazetteer = cls()
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rt', encoding='utf-8') as f:
+            for entity_type, name in _read_entries(f):
+                gazetteer.add(name, entity_type)
+        return gazetteer
+
+def _read_entries(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    for line in lines:
+        line = line.rstrip('\n')
+        if not line or line.startswith('#'):
+            continue
+        entity_type, _, name = line.partition('\t')
+        if name:
+            yield entity_type, name
+
+@functools.lru_cache(maxsize=None)
+def load_gazetteer(path: Optional[str] = None) -> Gazetteer:
+    """
+    Load and cache a gazetteer, shared by every ClaimProcessor in the process.
+
+    Defaults to the GAZETTEER_PATH variable, then to the bundled name lists.
+    """
+    path = path or os.getenv('GAZETTEER_PATH') or DEFAULT_PATH
+    return Gazetteer.load(path)
+
+def build_gazetteer(sources: Dict[str, List[str]], path: str) -> int:
+    """
+    Compile name lists into a gazetteer file.
+
+    Args:
+        sources: Entity type mapped to text files with one name per line
+        path: Output file; gzipped when it ends in .gz
+
+    Returns:
+        Number of distinct entries written
+    """
+    entries = set()
+    for entity_type, files in sources.items():
+        for source in files:
+            with open(source, encoding='utf-8') as f:
+                for line in f:
+                    name = ' '.join(line.split())
+                    if name and not name.startswith('#'):
+                        entries.add((entity_type, name))
+
+    data = ''.join(f"{entity_type}\t{name}\n" for entity_type, name in sorted(entries)).encode('utf-8')
+    with open(path, 'wb') as f:
+        if path.endswith('.gz'):
+            # No name or mtime in the header, so rebuilt files are byte-identical
+            with gzip.GzipFile(filename='', fileobj=f, mode='wb', mtime=0) as compressed:
+                compressed.write(data)
+        else:
+            f.write(data)
+    return len(entries)
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compile entity name lists into a gazetteer file.")
+    parser.add_argument('output', help="gazetteer file to write, e.g. gazetteer.tsv.gz")
+    for entity_type in ENTITY_TYPES:
+        parser.add_argument(f'--{entity_type.lower()}', action='append', default=[], metavar='FILE',
+                            help=f"file of {entity_type} names, one per line")
+    args = parser.parse_args(argv)
+
+    sources = {entity_type: getattr(args, entity_type.lower()) for entity_type in ENTITY_TYPES}
+    count = build_gazetteer(sources, args.output)
+    print(f"Wrote {count} names to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .claim_history import ClaimRecord
+
+@dataclass(slots=True)
+class StoredClaim:
+    """A tracked claim as logged by a store; seq orders the log."""
+    seq: int
+    origin: str
+    record: ClaimRecord
+    topics: Tuple[str, ...]
+
+@dataclass(slots=True)
+class Snapshot:
+    """Tracker aggregates covering every logged claim up to and including seq cursor."""
+    cursor: int
+    taken_at: float
+    state: Dict
+
+class GeoStore(ABC):
+    """Append-only log of tracked claims, shared by the GeoTrackers using it.
+
+    Each tracker appends the claims it tracks under its own origin and
+    replays the claims of other origins, so trackers in different worker
+    processes converge on the same counts. A snapshot of the aggregates
+    lets new trackers start from it and replay only the claims logged
+    since, and lets the claims it covers be pruned from the log.
+    """
+
+    @abstractmethod
+    def append(self, origin: str, record: ClaimRecord, topics: Tuple[str, ...]) -> None:
+        """Log a tracked claim. May return before the claim is durable."""
+        pass
+
+    @abstractmethod
+    def read_since(self, cursor: int, limit: int = 10000) -> List[StoredClaim]:
+        """Durable claims with seq greater than cursor, in seq order."""
+        pass
+
+    def load_snapshot(self) -> Optional[Snapshot]:
+        """The latest saved snapshot, if any."""
+        return None
+
+    def save_snapshot(self, snapshot: Snapshot) -> bool:
+        """Save a snapshot unless one with a later cursor exists; returns whether it was saved."""
+        return False
+
+    def prune(self, cursor: int, before: float) -> int:
+        """Delete claims with seq up to cursor logged before timestamp before; returns how many."""
+        return 0
+
+    def flush(self) -> None:
+        """Block until every appended claim is durable."""
+        pass
+
+    def close(self) -> None:
+        """Flush and release resources."""
+        pass
+
+class InMemoryGeoStore(GeoStore):
+    """Store kept in process memory, for tests and trackers sharing one process."""
+
+    def __init__(self):
+        self._claims: List[StoredClaim] = []
+        self._seq = 0
+        self._snapshot: Optional[Snapshot] = None
+        self._lock = threading.Lock()
+
+    def append(self, origin: str, record: ClaimRecord, topics: Tuple[str, ...]) -> None:
+        with self._lock:
+            self._seq += 1
+            self._claims.append(StoredClaim(self._seq, origin, record, topics))
+
+    def read_since(self, cursor: int, limit: int = 10000) -> List[StoredClaim]:
+        with self._lock:
+            # Seqs are contiguous from the first claim still kept
+            start = max(0, cursor - self._claims[0].seq + 1) if self._claims else 0
+            return self._claims[start:start + limit]
+
+    def load_snapshot(self) -> Optional[Snapshot]:
+        with self._lock:
+            return self._snapshot
+
+    def save_snapshot(self, snapshot: Snapshot) -> bool:
+        with self._lock:
+            if self._snapshot is not None and self._snapshot.cursor >= snapshot.cursor:
+                return False
+            self._snapshot = snapshot
+            return True
+
+    def prune(self, cursor: int, before: float) -> int:
+        with self._lock:
+            pruned = 0
+            for claim in self._claims:
+                if claim.seq > cursor or claim.record.timestamp >= before:
+                    break
+                pruned += 1
+            del self._claims[:pruned]
+            return pruned
+
+class SQLiteGeoStore(GeoStore):
+    """Store in a SQLite database in WAL mode, shareable between processes.
+
+    append() only queues the claim; a background thread writes whatever
+    has queued up in one transaction (a group commit), so request threads
+    never wait on the disk and one fsync covers a whole batch. Commits are
+    serialized by SQLite, so seq order is commit order and readers following
+    a cursor never skip a claim committed late by another process.
+
+    The read connection and the writer thread belong to the process that
+    opened them, so each is opened on first use in every process: the read
+    connection on the first read, the writer on the first append. A store
+    built and read before the server forks its workers runs no threads in
+    the parent and still writes from every worker.
+    """
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        """
+        Initialize the store, creating the database file if needed.
+
+        Args:
+            path: Location of the SQLite database file
+            batch_size: Most claims written per transaction
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.batch_size = batch_size
+        self.commits = 0
+        self.dropped = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Fail early if the database is unusable, without keeping anything open
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS geo_claims ('
+                    'seq INTEGER PRIMARY KEY AUTOINCREMENT, origin TEXT NOT NULL, '
+                    'timestamp REAL NOT NULL, location TEXT NOT NULL, risk_level TEXT NOT NULL, '
+                    'text TEXT NOT NULL, sources TEXT NOT NULL, topics TEXT NOT NULL, '
+                    'is_false INTEGER NOT NULL)'
+                )
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS geo_snapshots ('
+                    'id INTEGER PRIMARY KEY CHECK (id = 1), cursor INTEGER NOT NULL, '
+                    'taken_at REAL NOT NULL, state TEXT NOT NULL)'
+                )
+        finally:
+            conn.close()
+
+        # Processes that opened the read connection and started the writer
+        self._reader_pid = self._writer_pid = None
+        self._open_lock = threading.Lock()
+        self._closed = False
+        atexit.register(self.close)
+
+    def _open_reader(self) -> None:
+        """Open the read connection, once per process."""
+        if self._reader_pid == os.getpid():
+            return
+        with self._open_lock:
+            if self._reader_pid != os.getpid():
+                # A connection inherited from the parent process is left alone
+                self._conn = self._connect()
+                self._read_lock = threading.Lock()
+                self._reader_pid = os.getpid()
+
+    def _start_writer(self) -> None:
+        """Start the writer thread, once per process."""
+        if self._writer_pid == os.getpid():
+            return
+        with self._open_lock:
+            if self._writer_pid != os.getpid():
+                self._queue = queue.Queue()
+                self._writer = threading.Thread(target=self._write_loop, name='geo-store-writer', daemon=True)
+                self._writer.start()
+                self._writer_pid = os.getpid()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        conn.execute('PRAGMA journal_mode=WAL')
+        # Commits are batched, so a full sync per commit is affordable and
+        # committed claims survive power loss as well as process crashes
+        conn.execute('PRAGMA synchronous=FULL')
+        return conn
+
+    def append(self, origin: str, record: ClaimRecord, topics: Tuple[str, ...]) -> None:
+        self._start_writer()
+        self._queue.put((
+            origin, record.timestamp, record.location, record.risk_level, record.text,
+            json.dumps(record.sources), json.dumps(topics), int(record.is_false)
+        ))
+
+    def _write_loop(self) -> None:
+        conn = self._connect()
+        while True:
+            rows = [self._queue.get()]
+            # Everything queued while the previous batch was committing goes in this one
+            while len(rows) < self.batch_size:
+                try:
+                    rows.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in rows
+            claims = [row for row in rows if row is not None]
+            if claims:
+                try:
+                    with conn:
+                        conn.executemany(
+                            'INSERT INTO geo_claims (origin, timestamp, location, risk_level, text, '
+                            'sources, topics, is_false) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                            claims
+                        )
+                    self.commits += 1
+                except sqlite3.Error as e:
+                    self.dropped += len(claims)
+                    self.logger.warning("Dropped %d tracked claims: %s", len(claims), e)
+            for _ in rows:
+                self._queue.task_done()
+            if stop:
+                conn.close()
+                return
+
+    def read_since(self, cursor: int, limit: int = 10000) -> List[StoredClaim]:
+        self._open_reader()
+        with self._read_lock:
+            rows = self._conn.execute(
+                'SELECT seq, origin, timestamp, location, risk_level, text, sources, topics, is_false '
+                'FROM geo_claims WHERE seq > ? ORDER BY seq LIMIT ?',
+                (cursor, limit)
+            ).fetchall()
+        return [
+            StoredClaim(
+                seq=seq,
+                origin=origin,
+                record=ClaimRecord(
+                    text=text,
+                    timestamp=timestamp,
+                    location=location,
+                    risk_level=risk_level,
+                    sources=tuple(json.loads(sources)),
+                    is_false=bool(is_false)
+                ),
+                topics=tuple(json.loads(topics))
+            )
+            for seq, origin, timestamp, location, risk_level, text, sources, topics, is_false in rows
+        ]
+
+    def load_snapshot(self) -> Optional[Snapshot]:
+        self._open_reader()
+        with self._read_lock:
+            row = self._conn.execute('SELECT cursor, taken_at, state FROM geo_snapshots').fetchone()
+        if row is None:
+            return None
+        cursor, taken_at, state = row
+        return Snapshot(cursor, taken_at, json.loads(state))
+
+    def save_snapshot(self, snapshot: Snapshot) -> bool:
+        # Snapshots are rare and large, so they bypass the writer's queue
+        conn = self._connect()
+        try:
+            with conn:
+                saved = conn.execute(
+                    'INSERT INTO geo_snapshots (id, cursor, taken_at, state) VALUES (1, ?, ?, ?) '
+                    'ON CONFLICT (id) DO UPDATE SET cursor = excluded.cursor, '
+                    'taken_at = excluded.taken_at, state = excluded.state '
+                    'WHERE excluded.cursor > geo_snapshots.cursor',
+                    (snapshot.cursor, snapshot.taken_at, json.dumps(snapshot.state))
+                ).rowcount
+        finally:
+            conn.close()
+        return saved > 0
+
+    def prune(self, cursor: int, before: float) -> int:
+        conn = self._connect()
+        try:
+            with conn:
+                return conn.execute(
+                    'DELETE FROM geo_claims WHERE seq <= ? AND timestamp < ?', (cursor, before)
+                ).rowcount
+        finally:
+            conn.close()
+
+    def flush(self) -> None:
+        if self._writer_pid == os.getpid():
+            self._queue.join()
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        # Only what this process opened is flushed and closed
+        if self._writer_pid == os.getpid():
+            self._queue.put(None)
+            self._writer.join()
+        if self._reader_pid == os.getpid():
+            with self._read_lock:
+                self._conn.close()
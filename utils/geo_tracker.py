@@ -1,11 +1,83 @@
 import json
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional, Tuple
+from datetime import timedelta
+
+from .claim_history import ClaimHistory, ClaimRecord
+from .geo_store import GeoStore, Snapshot, SQLiteGeoStore
+from .heavy_hitters import SpaceSaving
+from .rollups import TimeBound, TimeRollups
+
+class RegionStats:
+    """Running totals and heavy-hitter topics and sources for one region."""
+
+    __slots__ = ('total_claims', 'false_claims', 'trending_topics', 'sources')
+
+    def __init__(self, capacity: int):
+        self.total_claims = 0
+        self.false_claims = 0
+        self.trending_topics = SpaceSaving(capacity)
+        self.sources = SpaceSaving(capacity)
+
+    def record(self, is_false: bool, topics: Tuple[str, ...], sources: Tuple[str, ...]) -> None:
+        self.total_claims += 1
+        if is_false:
+            self.false_claims += 1
+        for topic in topics:
+            self.trending_topics.add(topic)
+        for source in sources:
+            self.sources.add(source)
+
+    def state(self) -> Dict:
+        return {
+            'total_claims': self.total_claims,
+            'false_claims': self.false_claims,
+            'trending_topics': self.trending_topics.state(),
+            'sources': self.sources.state()
+        }
+
+    def restore(self, state: Dict) -> None:
+        self.total_claims = state['total_claims']
+        self.false_claims = state['false_claims']
+        self.trending_topics.restore(state['trending_topics'])
+        self.sources.restore(state['sources'])
 
 class GeoTracker:
-    def __init__(self):
-        """Initialize the geographical tracking system."""
+    """Tracks where claims are made, safe for concurrent writers and readers.
+
+    The country and overall aggregates, timelines and history sit behind
+    one lock, held only for a few constant-time updates per claim. The
+    updates hold the GIL anyway, so finer-grained locks showed no gain in
+    benchmarks/bench_geo_tracker.py. The country map itself is
+    copy-on-write: adding a country publishes a new dict, so readers
+    iterate a stable snapshot.
+    """
+
+    def __init__(self, max_history: Optional[int] = None, history_max_age: Optional[float] = None,
+                 topic_capacity: Optional[int] = None, top_k: Optional[int] = None,
+                 hourly_retention_days: Optional[float] = None, store: Optional[GeoStore] = None):
+        """
+        Initialize the geographical tracking system.
+
+        Args:
+            max_history: Claims kept in the history (GEO_HISTORY_MAX_RECORDS, 100000)
+            history_max_age: Seconds claims are kept in the history
+                (GEO_HISTORY_MAX_AGE, unlimited)
+            topic_capacity: Distinct topics and sources counted per region
+                (GEO_TOPIC_CAPACITY, 200); rarer ones are approximated away
+            top_k: Topics and sources reported per region (GEO_TOP_K, 10)
+            hourly_retention_days: Days hourly timeline buckets are kept
+                (GEO_HOURLY_RETENTION_DAYS, 14); daily buckets are kept for good
+            store: Durable log the tracked claims are written to and replayed from,
+                starting from its latest snapshot; state is kept in memory only when omitted
+        """
+        self.logger = logging.getLogger(__name__)
         self.country_mapping = {
             'USA': 'United States',
             'GBR': 'United Kingdom',
@@ -14,59 +86,280 @@ class GeoTracker:
             'IND': 'India',
             # Add more mappings as needed
         }
-        self.geo_data = defaultdict(lambda: {
-            'total_claims': 0,
-            'false_claims': 0,
-            'trending_topics': defaultdict(int),
-            'sources': defaultdict(int)
-        })
-        self.claim_history = []  # Store claim history
+        if topic_capacity is None:
+            topic_capacity = int(os.getenv('GEO_TOPIC_CAPACITY', 200))
+        self.topic_capacity = topic_capacity
+        self.top_k = top_k if top_k is not None else int(os.getenv('GEO_TOP_K', 10))
+        # Aggregates are maintained as claims are tracked, per country and overall.
+        # geo_data is replaced, never mutated, under _regions_lock
+        self.geo_data: Dict[str, RegionStats] = {}
+        self.global_stats = RegionStats(topic_capacity)
+        self._regions_lock = threading.Lock()
+        if max_history is None:
+            max_history = int(os.getenv('GEO_HISTORY_MAX_RECORDS', 100000))
+        if history_max_age is None and os.getenv('GEO_HISTORY_MAX_AGE'):
+            history_max_age = float(os.getenv('GEO_HISTORY_MAX_AGE'))
+        self.claim_history = ClaimHistory(max_records=max_history, max_age=history_max_age)
+        # Timelines are answered from rollups, so the raw history can be compacted freely
+        if hourly_retention_days is None:
+            hourly_retention_days = float(os.getenv('GEO_HOURLY_RETENTION_DAYS', 14))
+        self.hourly_retention_days = hourly_retention_days
+        self.rollups = TimeRollups(hourly_retention=timedelta(days=hourly_retention_days))
+        self._lock = threading.Lock()  # Guards the RegionStats, claim_history, rollups and _version
+        # Bumped for every claim applied, so readers can tell when cached results are stale
+        self._version = 0
+
+        self.store = store
+        self._origin = self._origin_pid = None
+        self.sync_interval = float(os.getenv('GEO_SYNC_INTERVAL', 1.0))
+        self._cursor = 0
+        self._synced_at = 0.0
+        self._sync_lock = threading.Lock()
+        # Some tracker folds the log into a snapshot every snapshot_interval seconds
+        # and prunes the claims it covers once they are log_retention seconds old
+        self.snapshot_interval = float(os.getenv('GEO_SNAPSHOT_INTERVAL', 300))
+        self.log_retention = float(os.getenv('GEO_LOG_RETENTION', 86400))
+        # Only the newest claims are snapshotted; the dashboard lists a handful
+        self.snapshot_history = int(os.getenv('GEO_SNAPSHOT_HISTORY', 1000))
+        self._snapshot_due = time.monotonic() + self.snapshot_interval
+        self._snapshotting = threading.Lock()
+        if store is not None:
+            snapshot = store.load_snapshot()
+            if snapshot is not None:
+                self._restore(snapshot.state)
+                self._cursor = snapshot.cursor
+            self.sync()
+
+    @classmethod
+    def from_env(cls, default_path: Optional[str] = None) -> 'GeoTracker':
+        """Build a tracker persisted to GEO_STORE_PATH, or to default_path when unset.
+
+        An empty GEO_STORE_PATH keeps all state in process memory.
+        """
+        path = os.getenv('GEO_STORE_PATH', default_path)
+        store = None
+        if path:
+            try:
+                store = SQLiteGeoStore(path)
+            except sqlite3.Error as e:
+                logging.getLogger(__name__).warning("Persistent geo tracking disabled: %s", e)
+        return cls(store=store)
+
+    @property
+    def origin(self) -> str:
+        """Tags the claims this tracker logs, so syncing skips them.
+
+        A tracker built before the server forks is copied into every worker,
+        so each process tags its claims with an origin of its own.
+        """
+        if self._origin_pid != os.getpid():
+            self._origin = uuid.uuid4().hex
+            self._origin_pid = os.getpid()
+        return self._origin
 
     def track_claim(self, claim: Dict, location: Dict) -> None:
         """Track a claim with its geographical information."""
         country_code = location.get('country', 'Unknown')
         country = self.country_mapping.get(country_code, country_code)
+        risk_level = claim.get('credibility_score', {}).get('risk_level', 'unknown').upper()
+        topics = tuple(entity for entity, entity_type in claim.get('entities', []))
 
-        # Update statistics
-        self.geo_data[country]['total_claims'] += 1
+        # Repeated strings are interned to share storage
+        record = ClaimRecord(
+            text=claim['text'],
+            timestamp=time.time(),
+            location=sys.intern(country),
+            risk_level=sys.intern(risk_level),
+            sources=tuple(sys.intern(source) for source in claim.get('sources', [])),
+            is_false=bool(claim.get('false_claim', False))
+        )
+        self._apply(record, topics)
 
-        # Track if it's a false claim
-        is_false = claim.get('false_claim', False)
-        if is_false:
-            self.geo_data[country]['false_claims'] += 1
-
-        # Track entities
-        for entity, entity_type in claim.get('entities', []):
-            self.geo_data[country]['trending_topics'][entity] += 1
-
-        # Track sources
-        for source in claim.get('sources', []):
-            self.geo_data[country]['sources'][source] += 1
-
-        # Add to claim history
-        self.claim_history.append({
-            'text': claim['text'],
-            'timestamp': datetime.now().isoformat(),
-            'location': country,
-            'risk_level': claim.get('credibility_score', {}).get('risk_level', 'unknown').upper(),
-            'sources': claim.get('sources', []),
-            'is_false': is_false
-        })
+        if self.store is not None:
+            self.store.append(self.origin, record, topics)
+
+    def _region(self, country: str) -> RegionStats:
+        """The aggregates of a country, publishing a new country map if it is new."""
+        region = self.geo_data.get(country)
+        if region is None:
+            with self._regions_lock:
+                region = self.geo_data.get(country)
+                if region is None:
+                    region = RegionStats(self.topic_capacity)
+                    self.geo_data = {**self.geo_data, country: region}
+        return region
+
+    def _apply(self, record: ClaimRecord, topics: Tuple[str, ...]) -> None:
+        """Add a claim to the aggregates and the history."""
+        region = self._region(record.location)
+        with self._lock:
+            region.record(record.is_false, topics, record.sources)
+            self.global_stats.record(record.is_false, topics, record.sources)
+            self.rollups.add(record.timestamp, record.location, record.is_false)
+            self.claim_history.append(record)
+            self._version += 1
+
+    @staticmethod
+    def _intern(record: ClaimRecord) -> ClaimRecord:
+        """Share the storage of the strings repeated across records."""
+        record.location = sys.intern(record.location)
+        record.risk_level = sys.intern(record.risk_level)
+        record.sources = tuple(sys.intern(source) for source in record.sources)
+        return record
+
+    def _replay(self, store: GeoStore, cursor: int, skip_origin: Optional[str]) -> Tuple[int, int]:
+        """Apply claims logged after cursor except skip_origin's; returns (new cursor, claims applied)."""
+        applied = 0
+        while True:
+            claims = store.read_since(cursor)
+            if not claims:
+                return cursor, applied
+            for stored in claims:
+                if stored.origin == skip_origin:
+                    continue
+                self._apply(self._intern(stored.record), stored.topics)
+                applied += 1
+            cursor = claims[-1].seq
+
+    def sync(self) -> int:
+        """
+        Apply the claims other trackers have logged to the store since the last sync.
+
+        Returns:
+            Number of claims applied
+        """
+        # A sync already running in another thread will pick up the same claims
+        if self.store is None or not self._sync_lock.acquire(blocking=False):
+            return 0
+        try:
+            self._cursor, applied = self._replay(self.store, self._cursor, self.origin)
+            self._synced_at = time.monotonic()
+            return applied
+        finally:
+            self._sync_lock.release()
+
+    def _maybe_sync(self) -> None:
+        """Catch up with other trackers before a read, at most every sync_interval seconds."""
+        if self.store is None or time.monotonic() - self._synced_at < self.sync_interval:
+            return
+        try:
+            self.sync()
+        except sqlite3.Error as e:
+            self.logger.warning("Geo tracking sync failed: %s", e)
+        if time.monotonic() >= self._snapshot_due and self._snapshotting.acquire(blocking=False):
+            self._snapshot_due = time.monotonic() + self.snapshot_interval
+            threading.Thread(target=self._snapshot_in_background, name='geo-snapshot', daemon=True).start()
+
+    def _snapshot_in_background(self) -> None:
+        try:
+            self.snapshot()
+        except sqlite3.Error as e:
+            self.logger.warning("Geo tracking snapshot failed: %s", e)
+        finally:
+            self._snapshotting.release()
+
+    def snapshot(self, force: bool = False) -> bool:
+        """
+        Fold the claims logged since the latest snapshot into a new one and prune the log.
+
+        The snapshot is rebuilt from the previous one and the log rather than
+        from this tracker, whose own recent claims may not be logged yet.
+        Claims it covers are pruned once older than log_retention, so a
+        tracker lagging that far behind would miss them.
+
+        Args:
+            force: Snapshot even if another tracker took one within snapshot_interval
+
+        Returns:
+            Whether a new snapshot was saved
+        """
+        if self.store is None:
+            return False
+        previous = self.store.load_snapshot()
+        if previous is not None and not force and time.time() - previous.taken_at < self.snapshot_interval:
+            return False
+
+        scratch = GeoTracker(
+            max_history=min(self.claim_history.max_records, self.snapshot_history),
+            history_max_age=self.claim_history.max_age,
+            topic_capacity=self.topic_capacity, top_k=self.top_k,
+            hourly_retention_days=self.hourly_retention_days
+        )
+        cursor = 0
+        if previous is not None:
+            scratch._restore(previous.state)
+            cursor = previous.cursor
+        # Claims from every origin are folded in, this tracker's included
+        cursor, applied = scratch._replay(self.store, cursor, None)
+        if previous is not None and not applied:
+            saved = False
+        else:
+            saved = self.store.save_snapshot(Snapshot(cursor, time.time(), scratch._state()))
+        pruned = self.store.prune(cursor, time.time() - self.log_retention)
+        self.logger.info("Geo tracking snapshot at claim %d (%d new), %d claims pruned", cursor, applied, pruned)
+        return saved
+
+    def _state(self) -> Dict:
+        """The aggregates and history as JSON-serializable data."""
+        with self._lock:
+            return {
+                'regions': {country: region.state() for country, region in self.geo_data.items()},
+                'global': self.global_stats.state(),
+                'rollups': self.rollups.state(),
+                'history': self.claim_history.state()
+            }
+
+    def _restore(self, state: Dict) -> None:
+        """Replace the aggregates and history with ones saved by _state()."""
+        regions = {country: self._region(sys.intern(country)) for country in state['regions']}
+        with self._lock:
+            for country, region in regions.items():
+                region.restore(state['regions'][country])
+            self.global_stats.restore(state['global'])
+            self.rollups.restore(state['rollups'])
+            self.claim_history.restore(state['history'])
+            for record in self.claim_history:
+                self._intern(record)
+            self._version += 1
+
+    def data_version(self) -> int:
+        """
+        Monotonically increasing version of the tracked data.
+
+        It changes whenever a claim is tracked here or synced from another
+        tracker, so results computed at the same version are still current.
+        """
+        self._maybe_sync()
+        return self._version
+
+    def close(self) -> None:
+        """Flush pending claims to the store and close it."""
+        if self.store is not None:
+            self.store.close()
+
+    def _region_summary(self, country: str, region: RegionStats) -> Dict:
+        """Totals, risk level and top topics and sources of a region, read under the lock."""
+        with self._lock:
+            total_claims = region.total_claims
+            false_claims = region.false_claims
+            trending_topics = dict(region.trending_topics.top(self.top_k))
+            sources = dict(region.sources.top(self.top_k))
+        return {
+            'country': country,
+            'total_claims': total_claims,
+            'false_claims': false_claims,
+            'risk_level': self._calculate_risk_level(
+                false_claims / total_claims if total_claims > 0 else 0
+            ),
+            'trending_topics': trending_topics,
+            'sources': sources
+        }
 
     def get_hotspots(self) -> List[Dict]:
         """Get misinformation hotspots based on tracked data."""
-        hotspots = []
-        for country, data in self.geo_data.items():
-            if data['total_claims'] > 0:
-                false_claim_ratio = data['false_claims'] / data['total_claims']
-                hotspots.append({
-                    'country': country,
-                    'total_claims': data['total_claims'],
-                    'false_claims': data['false_claims'],
-                    'risk_level': self._calculate_risk_level(false_claim_ratio),
-                    'trending_topics': dict(data['trending_topics']),
-                    'sources': dict(data['sources'])
-                })
+        self._maybe_sync()
+        hotspots = [self._region_summary(country, region)
+                    for country, region in self.geo_data.items() if region.total_claims > 0]
 
         return sorted(hotspots, key=lambda x: x['false_claims'], reverse=True)
 
@@ -80,81 +373,76 @@ class GeoTracker:
 
     def get_regional_trends(self, country_code: str) -> Optional[Dict]:
         """Get detailed trends for a specific country."""
+        self._maybe_sync()
         # Convert country code to country name
         country = self.country_mapping.get(country_code, country_code)
 
-        data = self.geo_data[country]
-        total_claims = data['total_claims']
-
-        # Calculate statistics
-        stats = {
-            'country': country,
-            'total_claims': total_claims,
-            'false_claims': data['false_claims'],
-            'risk_level': self._calculate_risk_level(
-                data['false_claims'] / total_claims if total_claims > 0 else 0
-            ),
-            'trending_topics': dict(data['trending_topics']),
-            'sources': dict(data['sources'])
-        }
-
-        return stats
+        region = self.geo_data.get(country)
+        if region is None:
+            region = RegionStats(0)
+        return self._region_summary(country, region)
 
     def get_total_claims(self) -> int:
         """Get total number of claims checked."""
-        return len(self.claim_history)
+        self._maybe_sync()
+        return self.claim_history.total
 
     def get_accuracy_rate(self) -> float:
         """Calculate the accuracy rate of checked claims."""
-        if not self.claim_history:
+        self._maybe_sync()
+        total = self.claim_history.total
+        if not total:
             return 100.0
-        false_claims = sum(1 for claim in self.claim_history if claim['is_false'])
-        return round((1 - false_claims / len(self.claim_history)) * 100, 1)
+        return round((1 - self.claim_history.false_total / total) * 100, 1)
 
     def get_active_countries(self) -> List[str]:
         """Get list of countries with recorded claims."""
-        return [country for country, data in self.geo_data.items() 
-                if data['total_claims'] > 0]
+        self._maybe_sync()
+        return [country for country, region in self.geo_data.items()
+                if region.total_claims > 0]
 
     def get_recent_claims(self, limit: int = 10) -> List[Dict]:
         """Get the most recent claims."""
-        return sorted(self.claim_history, 
-                     key=lambda x: x['timestamp'], 
-                     reverse=True)[:limit]
-
-    def get_timeline_data(self) -> List[Dict]:
-        """Get claims data over time."""
-        timeline_data = []
-        if not self.claim_history:
-            return timeline_data
-
-        # Group claims by date
-        daily_claims = defaultdict(lambda: {'true_claims': 0, 'false_claims': 0})
-        for claim in self.claim_history:
-            date = datetime.fromisoformat(claim['timestamp']).date().isoformat()
-            if claim['is_false']:
-                daily_claims[date]['false_claims'] += 1
-            else:
-                daily_claims[date]['true_claims'] += 1
-
-        # Convert to list format
-        for date, counts in sorted(daily_claims.items()):
-            timeline_data.append({
-                'date': date,
-                'true_claims': counts['true_claims'],
-                'false_claims': counts['false_claims']
-            })
-
-        return timeline_data
-
-    def get_trending_topics(self) -> Dict[str, int]:
+        self._maybe_sync()
+        # The history is in arrival order, so the newest claims are at its end
+        with self._lock:
+            records = self.claim_history.latest(limit)
+        return [record.to_dict() for record in records]
+
+    def get_timeline_data(self, start: TimeBound = None, end: TimeBound = None,
+                          granularity: str = 'day', country_code: Optional[str] = None) -> List[Dict]:
+        """
+        Get claims data over time, answered from the hourly and daily rollups.
+
+        Args:
+            start: Earliest date or time included, or None for all history
+            end: Latest date or time included, or None for up to now
+            granularity: 'day', or 'hour' for the last few days
+            country_code: Country to report, or None for all countries
+
+        Returns:
+            Dicts with 'date', 'true_claims' and 'false_claims', oldest first
+        """
+        self._maybe_sync()
+        country = self.country_mapping.get(country_code, country_code) if country_code else None
+        with self._lock:
+            return self.rollups.timeline(start, end, granularity, country)
+
+    def compact_history(self, max_age: float) -> int:
+        """
+        Drop raw claims older than max_age seconds.
+
+        Totals, hotspots and timelines are kept in aggregates and are not
+        affected; only the recent claims list loses the dropped entries.
+
+        Returns:
+            Number of claims dropped
+        """
+        with self._lock:
+            return self.claim_history.expire(time.time() - max_age)
+
+    def get_trending_topics(self, limit: int = 5) -> Dict[str, int]:
         """Get overall trending topics."""
-        all_topics = defaultdict(int)
-        for country_data in self.geo_data.values():
-            for topic, count in country_data['trending_topics'].items():
-                all_topics[topic] += count
-
-        # Return top 5 topics
-        return dict(sorted(all_topics.items(), 
-                         key=lambda x: x[1], 
-                         reverse=True)[:5])
\ No newline at end of file
+        self._maybe_sync()
+        with self._lock:
+            return dict(self.global_stats.trending_topics.top(limit))
\ No newline at end of file
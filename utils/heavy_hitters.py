@@ -0,0 +1,96 @@
+import heapq
+from operator import itemgetter
+from typing import Dict, Hashable, List, Tuple
+
+class SpaceSaving:
+    """Approximate top-k counter in bounded memory (the Space-Saving algorithm).
+
+    At most capacity items are counted. When a new item arrives and every
+    slot is taken, it replaces an item with the smallest count and
+    inherits that count plus one. Reported counts therefore never
+    underestimate, and overestimate by at most the inherited count
+    (``error``). Any item occurring more than total / capacity times is
+    guaranteed to be tracked.
+
+    Items are grouped in buckets by count, so every update is O(1).
+    """
+
+    __slots__ = ('capacity', 'total', 'counts', 'errors', '_buckets', '_min')
+
+    def __init__(self, capacity: int = 200):
+        self.capacity = capacity
+        self.total = 0
+        self.counts: Dict[Hashable, int] = {}
+        self.errors: Dict[Hashable, int] = {}
+        # count -> items with that count, as an insertion-ordered dict
+        self._buckets: Dict[int, Dict[Hashable, None]] = {}
+        self._min = 0
+
+    def add(self, item: Hashable) -> None:
+        """Count one occurrence of item."""
+        self.total += 1
+        count = self.counts.get(item)
+        if count is not None:
+            self._move(item, count)
+            return
+
+        if len(self.counts) < self.capacity:
+            count = error = 0
+        else:
+            # Evict the oldest item with the smallest count
+            count = error = self._min
+            bucket = self._buckets[count]
+            victim = next(iter(bucket))
+            del bucket[victim]
+            if not bucket:
+                del self._buckets[count]
+            del self.counts[victim]
+            del self.errors[victim]
+
+        self.counts[item] = count + 1
+        self.errors[item] = error
+        self._buckets.setdefault(count + 1, {})[item] = None
+        if count == 0 or count not in self._buckets:
+            self._min = count + 1
+
+    def _move(self, item: Hashable, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[item]
+        if not bucket:
+            del self._buckets[count]
+            if self._min == count:
+                self._min = count + 1
+        self.counts[item] = count + 1
+        self._buckets.setdefault(count + 1, {})[item] = None
+
+    def state(self) -> Dict:
+        """The counter as JSON-serializable data, restorable with restore()."""
+        # Both orders are kept, so ties and evictions go the same way after a restore
+        position = {item: i for i, item in enumerate(self.counts)}
+        return {
+            'total': self.total,
+            'items': [[item, count, self.errors[item]] for item, count in self.counts.items()],
+            'buckets': [position[item] for count in sorted(self._buckets) for item in self._buckets[count]]
+        }
+
+    def restore(self, state: Dict) -> None:
+        """Replace the counts with ones saved by state()."""
+        items = state['items']
+        self.total = state['total']
+        self.counts = {item: count for item, count, _ in items}
+        self.errors = {item: error for item, _, error in items}
+        self._buckets = {}
+        for i in state['buckets']:
+            item, count, _ = items[i]
+            self._buckets.setdefault(count, {})[item] = None
+        self._min = min(self._buckets, default=0)
+
+    def top(self, k: int) -> List[Tuple[Hashable, int]]:
+        """The k items with the highest counts, highest first."""
+        return heapq.nlargest(k, self.counts.items(), key=itemgetter(1))
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.counts
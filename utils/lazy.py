@@ -0,0 +1,30 @@
+import threading
+from typing import Any, Callable
+
+class LazyService:
+    """Proxy that constructs a service on first use.
+
+    Attribute access is forwarded to the instance, so module-level services
+    can be declared at import time without paying for their construction
+    (or their dependencies' imports) until a request needs them.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._instance = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Any:
+        """Return the service, constructing it if needed."""
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    self._instance = self._factory()
+        return self._instance
+
+    @property
+    def initialized(self) -> bool:
+        return self._instance is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
@@ -0,0 +1,136 @@
+import contextvars
+import json
+import logging
+import os
+import random
+import uuid
+from typing import Any, Callable, Dict, Optional
+
+# Correlates every log line emitted while serving one request
+request_id_var = contextvars.ContextVar('request_id', default='-')
+
+_configured = False
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex[:16]
+
+def bind_request_id(request_id: Optional[str] = None) -> str:
+    """Set the request ID of the current context, generating one if not given."""
+    request_id = request_id or new_request_id()
+    request_id_var.set(request_id)
+    return request_id
+
+def current_request_id() -> str:
+    return request_id_var.get()
+
+def in_context(fn: Callable) -> Callable:
+    """
+    Wrap fn to run in a copy of the caller's context.
+
+    Executor threads do not inherit context variables, so work submitted to
+    a pool is wrapped with this to keep its log lines tagged with the
+    request ID.
+    """
+    context = contextvars.copy_context()
+
+    def run(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+    return run
+
+class RequestIdFilter(logging.Filter):
+    """Adds the current request ID to every record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+class JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line.
+
+    Structured fields passed as ``extra={'fields': {...}}`` are merged into
+    the object.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'request_id': getattr(record, 'request_id', '-'),
+            'msg': record.getMessage()
+        }
+        fields = getattr(record, 'fields', None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s'
+
+def parse_levels(spec: str) -> Dict[str, int]:
+    """Parse per-module levels such as ``utils.fact_checkers=WARNING,app=DEBUG``."""
+    levels = {}
+    for item in filter(None, (part.strip() for part in spec.split(','))):
+        name, _, level = item.partition('=')
+        levels[name.strip()] = logging.getLevelName(level.strip().upper())
+    return levels
+
+def configure_logging(level: Optional[str] = None, module_levels: Optional[Dict[str, Any]] = None,
+                      fmt: Optional[str] = None) -> None:
+    """
+    Install the application's log handler once per process.
+
+    Args:
+        level: Root level, defaulting to the LOG_LEVEL variable (INFO)
+        module_levels: Per-logger levels, defaulting to the LOG_LEVELS variable
+        fmt: 'json' or 'text', defaulting to the LOG_FORMAT variable (text)
+    """
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    root = logging.getLogger()
+    root.setLevel((level or os.getenv('LOG_LEVEL', 'INFO')).upper())
+    if module_levels is None:
+        module_levels = parse_levels(os.getenv('LOG_LEVELS', ''))
+    for name, module_level in module_levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    if root.handlers:
+        # Keep handlers installed by the server (e.g. gunicorn), tagging their records
+        for handler in root.handlers:
+            handler.addFilter(RequestIdFilter())
+        return
+
+    handler = logging.StreamHandler()
+    handler.addFilter(RequestIdFilter())
+    if (fmt or os.getenv('LOG_FORMAT', 'text')).lower() == 'json':
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    root.addHandler(handler)
+
+class PayloadSampler:
+    """Logs a sample of large payloads, truncated, at DEBUG level."""
+
+    def __init__(self, rate: Optional[float] = None, max_chars: Optional[int] = None):
+        """
+        Args:
+            rate: Share of payloads logged, defaulting to LOG_PAYLOAD_SAMPLE_RATE (0.01)
+            max_chars: Serialized payloads are cut to this length (LOG_PAYLOAD_MAX_CHARS, 2000)
+        """
+        self.rate = rate if rate is not None else float(os.getenv('LOG_PAYLOAD_SAMPLE_RATE', 0.01))
+        self.max_chars = max_chars if max_chars is not None else int(os.getenv('LOG_PAYLOAD_MAX_CHARS', 2000))
+
+    def log(self, logger: logging.Logger, message: str, payload: Any, level: int = logging.DEBUG) -> None:
+        """Log payload under message if level is enabled and the payload is sampled."""
+        if not logger.isEnabledFor(level) or random.random() >= self.rate:
+            return
+        text = json.dumps(payload, default=str)
+        if len(text) > self.max_chars:
+            text = text[:self.max_chars] + '...'
+        logger.log(level, "%s: %s", message, text)
+
+payload_sampler = PayloadSampler()
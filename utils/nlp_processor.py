@@ -1,55 +1,158 @@
-import nltk
-from typing import List, Dict
+import multiprocessing
+import os
+import re
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from .gazetteer import Gazetteer, clean_token, ends_name, load_gazetteer
+from .records import Claim
+from .sentence_segmenter import iter_sentences
+
+Document = Union[str, Tuple[Any, str]]
+
+def sentence_terminator(text: str, end: int) -> str:
+    """The punctuation ending the sentence that stops at end, defaulting to a period."""
+    return text[end] if end < len(text) and text[end] in '.!?' else '.'
 
 class ClaimProcessor:
-    def __init__(self):
-        """Initialize the Claim Processor."""
+    def __init__(self, gazetteer_path: Optional[str] = None):
+        """
+        Initialize the Claim Processor.
+
+        Args:
+            gazetteer_path: Entity name list (see utils.gazetteer), defaulting to the bundled one
+        """
+        self.gazetteer_path = gazetteer_path
+        self._gazetteer = None
         self.claim_indicators = [
             'according to', 'reported', 'estimates', 'shows', 'found', 'suggests',
             'stated', 'announced', 'revealed', 'confirmed', 'indicates', 'claims',
             'discovered', 'proves', 'demonstrates', 'recently', 'new study',
             'research shows', 'scientists', 'experts say', 'evidence'
         ]
+        # One alternation finds any indicator in a single scan of the sentence
+        self._indicator_pattern = re.compile(
+            '|'.join(re.escape(indicator) for indicator in self.claim_indicators)
+        )
+
+    @property
+    def gazetteer(self) -> Gazetteer:
+        if self._gazetteer is None:
+            self._gazetteer = load_gazetteer(self.gazetteer_path)
+        return self._gazetteer
+
+    def __getstate__(self):
+        # Worker processes load the gazetteer from its file rather than
+        # receiving the whole trie pickled
+        state = self.__dict__.copy()
+        state['_gazetteer'] = None
+        return state
+
+    def _find_entities(self, words: List[str]) -> Tuple[List[Tuple[str, str]], bool]:
+        """
+        Find named entities and numbers among the words of a sentence.
+
+        Names in the gazetteer are matched longest first, so "New York
+        Times" is one OUTLET rather than three entities. Other runs of
+        capitalized words become a single ENTITY, except that the first word
+        of the sentence is only an entity when the gazetteer knows it.
+
+        Returns:
+            ((text, type) tuples in sentence order, whether any number was found)
+        """
+        gazetteer = self.gazetteer
+        entities = []
+        has_numbers = False
+        index = 0
+        count = len(words)
+        while index < count:
+            word = words[index]
+            if not word.isalpha() and any(c.isdigit() for c in word):
+                entities.append((word, 'NUMBER'))
+                has_numbers = True
+                index += 1
+                continue
+            token = clean_token(word)
+            if len(token) < 2 or not token[0].isupper():
+                index += 1
+                continue
+
+            match = gazetteer.longest_match(words, index)
+            if match is not None:
+                end, entity_type = match
+                entities.append((' '.join(clean_token(w) for w in words[index:end]), entity_type))
+                index = end
+                continue
+            if index == 0:
+                index += 1
+                continue
+
+            # Unknown proper noun: extend over following capitalized words
+            end = index + 1
+            while (end < count and not ends_name(words[end - 1])
+                   and clean_token(words[end])[:1].isupper()
+                   and gazetteer.longest_match(words, end) is None):
+                end += 1
+            entities.append((' '.join(clean_token(w) for w in words[index:end]), 'ENTITY'))
+            index = end
+
+        return entities, has_numbers
+
+    def claim_from_sentence(self, sentence: str, start: int, end: int,
+                            terminator: str = '.') -> Optional[Claim]:
+        """
+        Detect whether one segmented sentence is a claim.
+
+        Args:
+            sentence: Sentence text without its terminal punctuation
+            start: Offset of the sentence in the document
+            end: Offset just past the sentence
+            terminator: Punctuation ending the sentence in the document
+
+        Returns:
+            The Claim, or None when the sentence does not look like one
+        """
+        words = sentence.split()
+        word_count = len(words)
+
+        # Skip very short sentences
+        if word_count < 3:
+            return None
 
-    def extract_claims(self, text: str) -> List[Dict]:
-        """Extract claims from input text using simple pattern matching."""
+        # Check for claim indicators
+        has_claim = self._indicator_pattern.search(sentence.lower()) is not None
+
+        entities, has_numbers = self._find_entities(words)
+
+        # Consider as claim if:
+        # 1. Has claim indicators, or
+        # 2. Contains entities and looks like a statement, or
+        # 3. Contains both entities and numbers
+        is_statement = word_count >= 4 and entities
+        if has_claim or is_statement or (len(entities) > 0 and has_numbers):
+            return Claim(
+                text=sentence + terminator,
+                entities=entities,
+                confidence=self._calculate_confidence(sentence, entities, has_claim, word_count),
+                span=(start, end)
+            )
+        return None
+
+    def extract_claims(self, text: str) -> List[Claim]:
+        """
+        Extract claims from input text using simple pattern matching.
+
+        Each claim carries its ``span``, the (start, end) character offsets
+        of the sentence in text, excluding the terminal punctuation.
+        """
         claims = []
 
         try:
-            # Split into sentences using simple punctuation
-            sentences = [s.strip() for s in text.split('.') if s.strip()]
-
-            for sentence in sentences:
-                # Skip very short sentences
-                if len(sentence.split()) < 3:
-                    continue
-
-                # Check for claim indicators
-                has_claim = any(indicator in sentence.lower() for indicator in self.claim_indicators)
-
-                # Check for numbers
-                has_numbers = any(c.isdigit() for c in sentence)
-
-                # Simple entity detection (capitalized words)
-                entities = []
-                words = sentence.split()
-                for word in words:
-                    if word and word[0].isupper() and len(word) > 1:
-                        entities.append((word, 'ENTITY'))
-                    if any(c.isdigit() for c in word):
-                        entities.append((word, 'NUMBER'))
-
-                # Consider as claim if:
-                # 1. Has claim indicators, or
-                # 2. Contains entities and looks like a statement, or
-                # 3. Contains both entities and numbers
-                is_statement = len(sentence.split()) >= 4 and entities
-                if has_claim or is_statement or (len(entities) > 0 and has_numbers):
-                    claims.append({
-                        'text': sentence + '.' if not sentence.endswith('.') else sentence,
-                        'entities': entities,
-                        'confidence': self._calculate_confidence(sentence, entities, has_claim)
-                    })
+            # Sentences are segmented lazily, keeping their offsets
+            for sentence, start, end in iter_sentences(text):
+                claim = self.claim_from_sentence(sentence, start, end, sentence_terminator(text, end))
+                if claim is not None:
+                    claims.append(claim)
 
             return claims
 
@@ -57,8 +160,55 @@ class ClaimProcessor:
             print(f"Error processing text: {str(e)}")
             return []
 
-    def _calculate_confidence(self, sentence: str, entities: List, has_claim: bool) -> float:
+    def iter_extract_claims(self, documents: Iterable[Document], processes: Optional[int] = None,
+                            chunksize: int = 64) -> Iterator[Tuple[Any, List[Claim]]]:
+        """
+        Extract claims from many documents on a pool of worker processes.
+
+        Documents are sent to the workers in chunks and consumed lazily, with
+        a bounded number of chunks in flight, so arbitrarily long iterables
+        can be processed.
+
+        Args:
+            documents: Texts, or (document_id, text) pairs
+            processes: Worker processes; defaults to the CPU count, 1 runs in-process
+            chunksize: Documents per task sent to a worker
+
+        Yields:
+            (document_id, claims) in input order; plain texts are identified
+            by their position
+        """
+        tagged = (doc if isinstance(doc, tuple) else (position, doc)
+                  for position, doc in enumerate(documents))
+        chunks = iter(lambda: list(islice(tagged, chunksize)), [])
+        processes = processes or os.cpu_count() or 1
+
+        if processes == 1:
+            for chunk in chunks:
+                for doc_id, text in chunk:
+                    yield doc_id, self.extract_claims(text)
+            return
+
+        with multiprocessing.Pool(processes, initializer=_init_worker, initargs=(self,)) as pool:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(pool.apply_async(_extract_chunk, (chunk,)))
+                if len(pending) >= processes * 4:
+                    yield from pending.popleft().get()
+            while pending:
+                yield from pending.popleft().get()
+
+    def extract_claims_batch(self, documents: Iterable[Document], processes: Optional[int] = None,
+                             chunksize: int = 64) -> List[List[Claim]]:
+        """Extract claims from many documents in parallel, returning them in input order."""
+        return [claims for _, claims in self.iter_extract_claims(documents, processes, chunksize)]
+
+    def _calculate_confidence(self, sentence: str, entities: List, has_claim: bool,
+                              word_count: Optional[int] = None) -> float:
         """Calculate confidence score for a claim."""
+        if word_count is None:
+            word_count = len(sentence.split())
+
         confidence = 0.5  # Base confidence
 
         # Adjust based on entities
@@ -72,12 +222,11 @@ class ClaimProcessor:
             confidence += 0.2
 
         # Adjust based on sentence length and structure
-        words = sentence.split()
-        if len(words) > 5:  # Longer sentences more likely to be claims
+        if word_count > 5:  # Longer sentences more likely to be claims
             confidence += 0.1
 
         # Boost confidence for sentences with clear subject-verb structure
-        if entities and len(words) >= 3:
+        if entities and word_count >= 3:
             confidence += 0.1
 
         return min(confidence, 1.0)
@@ -86,19 +235,22 @@ class ClaimProcessor:
         """Extract key entities from text."""
         try:
             entities = {}
-            words = text.split()
-
-            for word in words:
-                if word and word[0].isupper() and len(word) > 1:
-                    if 'ENTITY' not in entities:
-                        entities['ENTITY'] = []
-                    entities['ENTITY'].append(word)
-                elif any(c.isdigit() for c in word):
-                    if 'NUMBER' not in entities:
-                        entities['NUMBER'] = []
-                    entities['NUMBER'].append(word)
+            for sentence, _, _ in iter_sentences(text):
+                found, _ = self._find_entities(sentence.split())
+                for entity, entity_type in found:
+                    entities.setdefault(entity_type, []).append(entity)
 
             return entities
         except Exception as e:
             print(f"Error extracting entities: {str(e)}")
-            return {}
\ No newline at end of file
+            return {}
+
+_worker_processor = None
+
+def _init_worker(processor: ClaimProcessor) -> None:
+    """Give each pool worker its own copy of the submitting processor."""
+    global _worker_processor
+    _worker_processor = processor
+
+def _extract_chunk(chunk: List[Tuple[Any, str]]) -> List[Tuple[Any, List[Claim]]]:
+    return [(doc_id, _worker_processor.extract_claims(text)) for doc_id, text in chunk]
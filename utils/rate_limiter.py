@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import os
+import struct
+import threading
+import time
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms keep per-process state
+    fcntl = None
+
+# Default quotas per upstream; each value can be overridden with
+# RATE_LIMIT_<NAME>_RATE, RATE_LIMIT_<NAME>_BURST and RATE_LIMIT_<NAME>_PER_DAY.
+UPSTREAM_LIMITS = {
+    'google_fact_check': {'rate': 5.0, 'burst': 10, 'per_day': 10000},
+    'snopes': {'rate': 1.0, 'burst': 1, 'per_day': None},
+}
+
+_STATE = struct.Struct('<4d')  # tokens, updated_at, day_start, day_count
+
+class RateLimitExceeded(Exception):
+    """Raised when no token could be obtained within the allowed wait."""
+
+class RateLimiter:
+    """
+    Token-bucket limiter with a burst capacity and an optional daily quota.
+
+    State lives in process memory, or in a small file under ``state_path``
+    guarded by ``flock`` so that every worker process draws from the same
+    bucket.
+    """
+
+    def __init__(self, name: str, rate: float, burst: int = 1,
+                 per_day: Optional[int] = None, state_path: Optional[str] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Upstream the limiter guards, used in logs
+            rate: Tokens added per second
+            burst: Maximum number of tokens the bucket holds
+            per_day: Maximum number of tokens handed out per UTC day
+            state_path: File used to share the bucket across processes
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.per_day = per_day
+        self.state_path = state_path
+        self._lock = threading.Lock()
+        self._state = (float(burst), time.time(), 0.0, 0.0)
+        self._fd = self._fd_pid = None
+        self._shared = bool(state_path) and fcntl is not None
+
+        if self._shared:
+            directory = os.path.dirname(state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._open_state()
+
+    def _open_state(self) -> None:
+        """Open the state file, once per process; call with _lock held."""
+        if not self._shared or self._fd_pid == os.getpid():
+            return
+        # flock locks belong to the open file, which a worker forked after
+        # the open would share with its parent, so each process opens its own
+        self._fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._fd_pid = os.getpid()
+
+    def _read_state(self) -> tuple:
+        if self._fd is None:
+            return self._state
+        data = os.pread(self._fd, _STATE.size, 0)
+        if len(data) < _STATE.size:
+            return (float(self.burst), time.time(), 0.0, 0.0)
+        return _STATE.unpack(data)
+
+    def _write_state(self, state: tuple) -> None:
+        if self._fd is None:
+            self._state = state
+        else:
+            os.pwrite(self._fd, _STATE.pack(*state), 0)
+
+    def _take(self, tokens: int) -> float:
+        """Take tokens if available; otherwise return the seconds until they could be."""
+        with self._lock:
+            self._open_state()
+            if self._fd is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                available, updated_at, day_start, day_count = self._read_state()
+
+                available = min(float(self.burst), available + (now - updated_at) * self.rate)
+                today = now - now % 86400
+                if day_start != today:
+                    day_start, day_count = today, 0.0
+
+                if self.per_day is not None and day_count + tokens > self.per_day:
+                    wait = day_start + 86400 - now
+                elif available >= tokens:
+                    available -= tokens
+                    day_count += tokens
+                    wait = 0.0
+                else:
+                    wait = (tokens - available) / self.rate
+
+                self._write_state((available, now, day_start, day_count))
+                return wait
+            finally:
+                if self._fd is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """Take tokens without waiting."""
+        return self._take(tokens) == 0.0
+
+    def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """Block until tokens are available or the timeout would be exceeded."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take(tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                self.logger.warning("Rate limit for %s exhausted", self.name)
+                return False
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """Like acquire, but waits without blocking the event loop."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take(tokens)
+            if wait == 0.0:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                self.logger.warning("Rate limit for %s exhausted", self.name)
+                return False
+            await asyncio.sleep(wait)
+
+    def stats(self) -> Dict:
+        """Get the current bucket level and today's usage."""
+        with self._lock:
+            self._open_state()
+            available, updated_at, day_start, day_count = self._read_state()
+        available = min(float(self.burst), available + (time.time() - updated_at) * self.rate)
+        return {
+            'name': self.name,
+            'available': available,
+            'used_today': int(day_count),
+            'per_day': self.per_day
+        }
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(name: str) -> RateLimiter:
+    """Get the shared limiter for an upstream, configured from the environment."""
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            defaults = UPSTREAM_LIMITS.get(name, {'rate': 1.0, 'burst': 1, 'per_day': None})
+            prefix = f"RATE_LIMIT_{name.upper()}_"
+            per_day = os.getenv(prefix + 'PER_DAY', defaults['per_day'])
+            state_dir = os.getenv('RATE_LIMIT_STATE_DIR')
+
+            limiter = RateLimiter(
+                name=name,
+                rate=float(os.getenv(prefix + 'RATE', defaults['rate'])),
+                burst=int(os.getenv(prefix + 'BURST', defaults['burst'])),
+                per_day=int(per_day) if per_day else None,
+                state_path=os.path.join(state_dir, f"{name}.bucket") if state_dir else None
+            )
+            _limiters[name] = limiter
+        return limiter
@@ -0,0 +1,49 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+class _RecordAccess:
+    """Dict-style read access, so records can stand in for the dicts they replace."""
+
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__dataclass_fields__
+
+    def to_dict(self) -> Dict:
+        """Shallow conversion to a dict; nested records are left as they are."""
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+@dataclass(slots=True)
+class Claim(_RecordAccess):
+    """A claim extracted from a sentence of the submitted text."""
+    text: str
+    entities: List[Tuple[str, str]]
+    confidence: float
+    span: Optional[Tuple[int, int]] = None
+
+@dataclass(slots=True)
+class CredibilityScore(_RecordAccess):
+    """Credibility of a claim and how it was derived."""
+    score: float
+    reasoning: List[str]
+    risk_level: str
+    source_score: float = 0.0
+    fact_score: float = 0.0
+    confidence_score: float = 0.0
+
+@dataclass(slots=True)
+class ClaimResult(_RecordAccess):
+    """Response entry for one analyzed claim."""
+    claim: Any
+    credibility_score: Any
+    fact_check: Optional[Dict]
+    reasoning: List[str] = field(default_factory=list)
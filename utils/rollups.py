@@ -0,0 +1,125 @@
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Union
+
+GRANULARITIES = ('hour', 'day')
+
+TimeBound = Union[datetime, date, None]
+
+class TimeRollups:
+    """Claim counts pre-aggregated into hourly and daily buckets per region.
+
+    Buckets are keyed by the local start of the hour or the local date, so
+    timelines match the dates shown on the dashboard. Every count lands in
+    the bucket of its region and in the global one (region None). Hourly
+    buckets are kept for hourly_retention; daily buckets are kept for good,
+    which costs one small entry per region per day.
+
+    Not thread-safe; the owner serializes access.
+    """
+
+    def __init__(self, hourly_retention: timedelta = timedelta(days=14)):
+        self.hourly_retention = hourly_retention
+        # granularity -> region -> bucket key -> [true claims, false claims]
+        self._buckets: Dict[str, Dict[Optional[str], Dict]] = {g: {} for g in GRANULARITIES}
+        # Bucket keys of the current hour, valid for timestamps in [_hour_start, _hour_end)
+        self._hour_start = self._hour_end = 0.0
+        self._keys = None
+        self._latest_hour: Optional[datetime] = None
+
+    def _bucket_keys(self, timestamp: float):
+        if not self._hour_start <= timestamp < self._hour_end:
+            hour = datetime.fromtimestamp(timestamp).replace(minute=0, second=0, microsecond=0)
+            self._hour_start = hour.timestamp()
+            self._hour_end = (hour + timedelta(hours=1)).timestamp()
+            self._keys = (hour, hour.date())
+            if self._latest_hour is None or hour > self._latest_hour:
+                if self._latest_hour is not None:
+                    self.prune(hour - self.hourly_retention)
+                self._latest_hour = hour
+        return self._keys
+
+    def add(self, timestamp: float, region: str, is_false: bool) -> None:
+        """Count a claim made at timestamp (seconds since the epoch) in region."""
+        index = 1 if is_false else 0
+        for granularity, key in zip(GRANULARITIES, self._bucket_keys(timestamp)):
+            regions = self._buckets[granularity]
+            for name in (None, region):
+                buckets = regions.get(name)
+                if buckets is None:
+                    buckets = regions[name] = {}
+                counts = buckets.get(key)
+                if counts is None:
+                    counts = buckets[key] = [0, 0]
+                counts[index] += 1
+
+    def prune(self, cutoff: datetime) -> None:
+        """Drop hourly buckets starting before cutoff."""
+        for buckets in self._buckets['hour'].values():
+            for key in [key for key in buckets if key < cutoff]:
+                del buckets[key]
+
+    def state(self) -> Dict:
+        """The buckets as JSON-serializable data, restorable with restore()."""
+        return {
+            granularity: [[region, [[key.isoformat(), *counts] for key, counts in buckets.items()]]
+                          for region, buckets in regions.items()]
+            for granularity, regions in self._buckets.items()
+        }
+
+    def restore(self, state: Dict) -> None:
+        """Replace the buckets with ones saved by state()."""
+        parsers = {'hour': datetime.fromisoformat, 'day': date.fromisoformat}
+        for granularity in GRANULARITIES:
+            parse = parsers[granularity]
+            self._buckets[granularity] = {
+                region: {parse(key): [true_claims, false_claims] for key, true_claims, false_claims in buckets}
+                for region, buckets in state[granularity]
+            }
+        self._hour_start = self._hour_end = 0.0
+        self._latest_hour = max((key for buckets in self._buckets['hour'].values() for key in buckets),
+                                default=None)
+
+    def timeline(self, start: TimeBound = None, end: TimeBound = None,
+                 granularity: str = 'day', region: Optional[str] = None) -> List[Dict]:
+        """
+        Claim counts per bucket, oldest first.
+
+        Args:
+            start: First bucket included (the one containing start), or None for the oldest
+            end: Last bucket included (the one containing end), or None for the newest
+            granularity: 'hour' or 'day'
+            region: Region to report, or None for all regions together
+
+        Returns:
+            Dicts with 'date' (ISO start of the bucket), 'true_claims' and 'false_claims'
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"granularity must be one of {', '.join(GRANULARITIES)}")
+        buckets = self._buckets[granularity].get(region, {})
+        start, end = self._bucket_key(start, granularity), self._bucket_key(end, granularity)
+
+        timeline = []
+        for key in sorted(buckets):
+            if (start is not None and key < start) or (end is not None and key > end):
+                continue
+            true_claims, false_claims = buckets[key]
+            timeline.append({
+                'date': key.isoformat(),
+                'true_claims': true_claims,
+                'false_claims': false_claims
+            })
+        return timeline
+
+    @staticmethod
+    def _bucket_key(bound: TimeBound, granularity: str):
+        """The key of the bucket containing a datetime or date."""
+        if bound is None:
+            return None
+        if not isinstance(bound, datetime):
+            bound = datetime.combine(bound, datetime.min.time())
+        if bound.tzinfo is not None:
+            # Buckets are in naive local time
+            bound = bound.astimezone().replace(tzinfo=None)
+        if granularity == 'day':
+            return bound.date()
+        return bound.replace(minute=0, second=0, microsecond=0)
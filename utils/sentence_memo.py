@@ -0,0 +1,69 @@
+import hashlib
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from .records import Claim
+from .verification_cache import LRUCache, VerificationCache
+
+@dataclass(slots=True)
+class SentenceAnalysis:
+    """Everything the pipeline derived from one sentence.
+
+    claim is None for sentences that contain no claim; fact_check and
+    credibility_score are None until the claim has been verified.
+    """
+    claim: Optional[Claim] = None
+    fact_check: Optional[Dict] = None
+    credibility_score: Any = None
+
+class SentenceMemo:
+    """Remembers the analysis of recently seen sentences, keyed by a hash of their text.
+
+    Resubmitted or lightly edited documents then only do new work for the
+    sentences that changed.
+    """
+
+    def __init__(self, max_entries: int = 50000, ttl: float = 3600, negative_ttl: float = 60):
+        """
+        Initialize the memo.
+
+        Args:
+            max_entries: Sentences remembered
+            ttl: Seconds a verified sentence is reused
+            negative_ttl: Seconds a sentence whose verification failed, timed out
+                or found nothing is reused
+        """
+        self.entries = LRUCache(max_entries=max_entries)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+
+    @classmethod
+    def from_env(cls) -> 'SentenceMemo':
+        """Build a memo configured by SENTENCE_MEMO_* environment variables."""
+        return cls(
+            max_entries=int(os.getenv('SENTENCE_MEMO_ENTRIES', 50000)),
+            ttl=float(os.getenv('SENTENCE_MEMO_TTL', 3600)),
+            negative_ttl=float(os.getenv('SENTENCE_MEMO_NEGATIVE_TTL', 60))
+        )
+
+    @staticmethod
+    def key(sentence: str) -> bytes:
+        """Hash identifying a sentence's exact text, terminator included."""
+        return hashlib.blake2b(sentence.encode('utf-8'), digest_size=16).digest()
+
+    def lookup(self, key: bytes) -> Optional[SentenceAnalysis]:
+        return self.entries.get(key)
+
+    def remember(self, key: bytes, analysis: SentenceAnalysis) -> None:
+        """Store a sentence's analysis for the TTL matching its outcome."""
+        if analysis.fact_check is not None and VerificationCache.is_negative(analysis.fact_check):
+            ttl = self.negative_ttl
+        else:
+            ttl = self.ttl
+        # Entries are counted rather than sized; the LRU bounds their number
+        self.entries.set(key, analysis, ttl=ttl, size=1)
+
+    def stats(self) -> Dict:
+        """Get hit, miss and eviction counters."""
+        return self.entries.stats()
@@ -0,0 +1,108 @@
+import re
+from typing import Iterable, Iterator, List, Tuple
+
+# Words that end with a period without ending the sentence
+ABBREVIATIONS = frozenset([
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'mt', 'ft', 'vs', 'etc',
+    'inc', 'ltd', 'co', 'corp', 'dept', 'univ', 'gov', 'gen', 'sen', 'rep', 'rev',
+    'col', 'lt', 'sgt', 'capt', 'vol', 'fig', 'approx', 'est', 'al',
+    'jan', 'feb', 'mar', 'apr', 'jun', 'jul', 'aug', 'sep', 'sept', 'oct', 'nov', 'dec'
+])
+# Abbreviations only when a number follows: "No. 5" but not "said no."
+NUMBER_ABBREVIATIONS = frozenset(['no'])
+
+# Sentence-final punctuation (with any closing quotes or brackets) followed
+# by whitespace or the end of the text, or a blank line between paragraphs
+_BOUNDARY = re.compile(r'[.!?]+[\'"’”)\]]*(?=\s|$)|\n[ \t]*\n')
+_ACRONYM = re.compile(r'(?:[a-z]\.)+[a-z]')
+_LEADING = '"\'(‘“['
+_NUMBER_AHEAD = re.compile(r'\s+\d')
+_ONLY_SPACE_AHEAD = re.compile(r'\s*\Z')
+# Longest token checked for an abbreviation; longer ones never are
+_MAX_TOKEN = 32
+
+Sentence = Tuple[str, int, int]
+
+def _is_abbreviation(text: str, boundary_start: int, boundary: str) -> bool:
+    """Whether a single period closes an abbreviation, initial or dotted acronym."""
+    if boundary != '.':
+        return False
+    # The backward scan is bounded, so text without spaces stays linear
+    lowest = max(0, boundary_start - _MAX_TOKEN)
+    token_start = max(text.rfind(' ', lowest, boundary_start), text.rfind('\n', lowest, boundary_start)) + 1
+    if token_start == 0 and lowest > 0:
+        return False
+    token = text[token_start:boundary_start].lstrip(_LEADING).lower()
+    if not token:
+        return False
+    if len(token) == 1:
+        return token.isalpha()
+    if token in NUMBER_ABBREVIATIONS:
+        return _NUMBER_AHEAD.match(text, boundary_start + 1) is not None
+    return token in ABBREVIATIONS or _ACRONYM.fullmatch(token) is not None
+
+def _boundaries(text: str, final: bool) -> Iterator[Tuple[int, int]]:
+    """
+    Yield (start, end) of every sentence boundary in text.
+
+    Unless final, a boundary followed only by whitespace up to the end of
+    text is not yielded, since the next chunk may show it is not one
+    ("No." followed by a number).
+    """
+    for match in _BOUNDARY.finditer(text):
+        if not final and _ONLY_SPACE_AHEAD.match(text, match.end()):
+            return
+        if not _is_abbreviation(text, match.start(), match.group()):
+            yield match.start(), match.end()
+
+def _span(text: str, start: int, end: int, base: int) -> List[Sentence]:
+    """Strip whitespace from a sentence span, dropping it if empty."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if start == end:
+        return []
+    return [(text[start:end], base + start, base + end)]
+
+def iter_sentences(text: str) -> Iterator[Sentence]:
+    """
+    Lazily split text into sentences with their character offsets.
+
+    Periods in decimals ("3.5%"), abbreviations ("Dr.", "U.S.") and
+    initials do not end a sentence. Each sentence is yielded as
+    (sentence, start, end) with ``text[start:end] == sentence``; the
+    sentence excludes its terminal punctuation.
+    """
+    start = 0
+    for boundary_start, boundary_end in _boundaries(text, final=True):
+        yield from _span(text, start, boundary_start, 0)
+        start = boundary_end
+    yield from _span(text, start, len(text), 0)
+
+def iter_sentences_from_chunks(chunks: Iterable[str], max_sentence_length: int = 20000) -> Iterator[Sentence]:
+    """
+    Split a stream of text chunks into sentences with offsets into the whole stream.
+
+    Only the unfinished tail of the stream is buffered. A sentence that grows
+    beyond max_sentence_length characters is cut there, so memory stays
+    bounded even for text without punctuation.
+    """
+    buffer = ''
+    base = 0
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        for boundary_start, boundary_end in _boundaries(buffer, final=False):
+            yield from _span(buffer, start, boundary_start, base)
+            start = boundary_end
+        buffer = buffer[start:]
+        base += start
+
+        while len(buffer) > max_sentence_length:
+            yield from _span(buffer, 0, max_sentence_length, base)
+            buffer = buffer[max_sentence_length:]
+            base += max_sentence_length
+
+    for sentence, start, end in iter_sentences(buffer):
+        yield sentence, base + start, base + end
@@ -0,0 +1,77 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+from flask import Request, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+def _default(obj: Any) -> Any:
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+def dumps(obj: Any) -> bytes:
+    """Serialize a response payload, records included, to compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default)
+    return json.dumps(obj, default=_default, separators=(',', ':')).encode('utf-8')
+
+def json_response(payload: Any, status: int = 200) -> Response:
+    """Build a JSON response without going through jsonify."""
+    return Response(dumps(payload), status=status, mimetype='application/json')
+
+class PayloadCache:
+    """Serialized responses cached per data version and served with ETags.
+
+    A payload is rebuilt and reserialized only when the version of the
+    data behind it changes. Its ETag is a hash of the body, so it is the
+    same in every worker process serving identical data, and clients
+    revalidating with If-None-Match get an empty 304 while it holds.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Payloads kept, least recently used first out
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (version, body, etag)
+        self._lock = threading.Lock()
+
+    def response(self, request: Request, key: Hashable, version: Any,
+                 build: Callable[[], Any]) -> Response:
+        """
+        Serve the payload for key at version, building it with build() when stale.
+
+        Responses carry Cache-Control: no-cache, so browsers keep the body
+        but revalidate it on every poll.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None or entry[0] != version:
+            body = dumps(build())
+            entry = (version, body, hashlib.blake2b(body, digest_size=16).hexdigest())
+            with self._lock:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        _, body, etag = entry
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response.make_conditional(request)
@@ -0,0 +1,84 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+from .claim_keys import canonicalize_claim
+
+class _Call:
+    """An in-flight call whose result is shared with every waiter."""
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """Collapses concurrent calls with the same key into a single execution."""
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executions = 0
+        self.collapsed = 0
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run fn unless a call for key is already in flight, then share its outcome.
+
+        Waiters receive the leader's return value, or have its exception
+        re-raised.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.executions += 1
+                leader = True
+            else:
+                self.collapsed += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def stats(self) -> Dict:
+        """Get execution and collapsed call counters."""
+        return {
+            'in_flight': len(self._calls),
+            'executions': self.executions,
+            'collapsed': self.collapsed
+        }
+
+class CoalescingFactChecker:
+    """Wraps a fact checker so concurrent verifications of one claim share an upstream call."""
+
+    def __init__(self, fact_checker):
+        """Initialize with the fact checker (usually a FactCheckAggregator) to protect."""
+        self.fact_checker = fact_checker
+        self.flight = SingleFlight()
+
+    def verify_claim(self, claim_text: str) -> Dict:
+        """Verify a claim, joining an identical verification already in progress."""
+        return self.flight.do(canonicalize_claim(claim_text), self.fact_checker.verify_claim, claim_text)
+
+    def stats(self) -> Dict:
+        """Get execution and collapsed call counters."""
+        return self.flight.stats()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.fact_checker, name)
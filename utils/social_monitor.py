@@ -1,4 +1,3 @@
-import requests
 from typing import List, Dict
 from datetime import datetime
 import time
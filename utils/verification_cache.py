@@ -0,0 +1,319 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .claim_keys import NearDuplicateIndex, canonicalize_claim, claim_features, exact_features
+from .fact_checkers.base import is_placeholder_fact
+
+class LRUCache:
+    """Thread-safe in-process LRU cache with per-entry TTL and a memory cap."""
+
+    def __init__(self, max_entries: int = 10000, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of entries kept
+            max_bytes: Approximate upper bound on the serialized size of all entries
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, value = entry
+            if expires_at <= time.time():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: float, size: Optional[int] = None) -> None:
+        """Store a value for ttl seconds, evicting least recently used entries as needed."""
+        if size is None:
+            size = len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.time() + ttl, size, value)
+            self._bytes += size
+
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        """Remove a key; the caller holds the lock."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """Get hit, miss and eviction counters."""
+        return {
+            'entries': len(self._entries),
+            'bytes': self._bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations
+        }
+
+class SQLiteCache:
+    """Persistent cache tier stored in a local SQLite database."""
+
+    def __init__(self, path: str, max_entries: int = 500000):
+        """
+        Initialize the cache, creating the database file if needed.
+
+        Args:
+            path: Location of the SQLite database file
+            max_entries: Rows kept before the oldest-expiring ones are purged
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=5.0)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS verification_cache ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS verification_cache_expires '
+            'ON verification_cache (expires_at)'
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[tuple]:
+        """Return (value, expires_at) for a live entry, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, expires_at FROM verification_cache WHERE key = ?', (key,)
+            ).fetchone()
+        if row is None or row[1] <= time.time():
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0]), row[1]
+
+    def set(self, key: str, serialized: str, ttl: float) -> None:
+        """Store an already serialized value for ttl seconds."""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO verification_cache (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, serialized, time.time() + ttl)
+            )
+            self._conn.commit()
+            self._writes += 1
+            if self._writes % 1000 == 0:
+                self._purge()
+
+    def _purge(self) -> None:
+        """Drop expired rows and trim to max_entries; the caller holds the lock."""
+        cursor = self._conn.execute('DELETE FROM verification_cache WHERE expires_at <= ?', (time.time(),))
+        self.evictions += cursor.rowcount
+        cursor = self._conn.execute(
+            'DELETE FROM verification_cache WHERE key IN ('
+            'SELECT key FROM verification_cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?)',
+            (self.max_entries,)
+        )
+        self.evictions += cursor.rowcount
+        self._conn.commit()
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute('DELETE FROM verification_cache')
+            self._conn.commit()
+
+    def stats(self) -> Dict:
+        """Get hit, miss and eviction counters."""
+        with self._lock:
+            entries = self._conn.execute('SELECT COUNT(*) FROM verification_cache').fetchone()[0]
+        return {
+            'entries': entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+class VerificationCache:
+    """Two-tier cache for fact check results: in-memory LRU backed by SQLite."""
+
+    def __init__(self,
+                 memory: Optional[LRUCache] = None,
+                 disk: Optional[SQLiteCache] = None,
+                 ttl: float = 24 * 3600,
+                 negative_ttl: float = 10 * 60,
+                 near_duplicates: Optional[NearDuplicateIndex] = None):
+        """
+        Initialize the cache.
+
+        Claims are keyed by their canonical form, so differences in case,
+        punctuation, whitespace and number formatting share one entry.
+
+        Args:
+            memory: In-process tier, created with defaults when omitted
+            disk: Optional persistent tier
+            ttl: Seconds a successful verification is kept
+            negative_ttl: Seconds errors, partial and empty results are kept
+            near_duplicates: Optional index letting paraphrases reuse a recent result
+        """
+        self.logger = logging.getLogger(__name__)
+        self.memory = memory or LRUCache()
+        self.disk = disk
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.near_duplicates = near_duplicates
+
+    @classmethod
+    def from_env(cls, default_path: Optional[str] = None) -> 'VerificationCache':
+        """Build a cache configured by VERIFICATION_CACHE_* environment variables."""
+        path = os.getenv('VERIFICATION_CACHE_PATH', default_path)
+        disk = None
+        if path:
+            try:
+                disk = SQLiteCache(path)
+            except sqlite3.Error as e:
+                logging.getLogger(__name__).warning("Persistent verification cache disabled: %s", e)
+
+        # Reusing another claim's verdict is opt-in: a paraphrase match can be wrong
+        similarity = float(os.getenv('VERIFICATION_CACHE_SIMILARITY', 0))
+        near_duplicates = None
+        if 0 < similarity < 1:
+            near_duplicates = NearDuplicateIndex(
+                threshold=similarity,
+                capacity=int(os.getenv('VERIFICATION_CACHE_SIMILAR_ENTRIES', 50000))
+            )
+
+        return cls(
+            memory=LRUCache(
+                max_entries=int(os.getenv('VERIFICATION_CACHE_ENTRIES', 10000)),
+                max_bytes=int(os.getenv('VERIFICATION_CACHE_MAX_BYTES', 64 * 1024 * 1024))
+            ),
+            disk=disk,
+            ttl=float(os.getenv('VERIFICATION_CACHE_TTL', 24 * 3600)),
+            negative_ttl=float(os.getenv('VERIFICATION_CACHE_NEGATIVE_TTL', 10 * 60)),
+            near_duplicates=near_duplicates
+        )
+
+    @staticmethod
+    def is_negative(result: Dict) -> bool:
+        """Whether a result should only be cached for the shorter negative TTL."""
+        if result.get('error') or result.get('partial'):
+            return True
+        if result.get('status') not in ('success', 'verified'):
+            return True
+        # Stand-ins for "no matches" or "service unavailable" must not outlive an outage
+        return all(is_placeholder_fact(fact) for fact in result.get('matching_facts') or [])
+
+    def get(self, claim: str) -> Optional[Dict]:
+        """Look a claim up by its canonical key, then among its near duplicates."""
+        canonical = canonicalize_claim(claim)
+        value = self._get(canonical)
+        if value is not None or self.near_duplicates is None:
+            return value
+
+        features = claim_features(canonical)
+        similar = self.near_duplicates.find(features, exact_features(claim, features))
+        if similar is not None and similar != canonical:
+            return self._get(similar)
+        return None
+
+    def _get(self, key: str) -> Optional[Dict]:
+        """Look a key up in memory, then on disk."""
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+
+        if self.disk is not None:
+            try:
+                entry = self.disk.get(key)
+            except sqlite3.Error as e:
+                self.logger.warning("Verification cache read failed: %s", e)
+                return None
+            if entry is not None:
+                value, expires_at = entry
+                self.memory.set(key, value, ttl=expires_at - time.time())
+                return value
+        return None
+
+    def set(self, claim: str, result: Dict) -> None:
+        """Store a result in every tier with the TTL matching its outcome."""
+        canonical = canonicalize_claim(claim)
+        ttl = self.negative_ttl if self.is_negative(result) else self.ttl
+        serialized = json.dumps(result, default=str)
+        self.memory.set(canonical, result, ttl=ttl, size=len(serialized))
+
+        if self.disk is not None:
+            try:
+                self.disk.set(canonical, serialized, ttl)
+            except sqlite3.Error as e:
+                self.logger.warning("Verification cache write failed: %s", e)
+
+        if self.near_duplicates is not None:
+            features = claim_features(canonical)
+            self.near_duplicates.add(canonical, features, exact_features(claim, features))
+
+    def clear(self) -> None:
+        """Remove all entries from every tier."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def stats(self) -> Dict:
+        """Get hit, miss and eviction counters for every tier."""
+        return {
+            'memory': self.memory.stats(),
+            'disk': self.disk.stats() if self.disk is not None else None,
+            'near_duplicates': self.near_duplicates.stats() if self.near_duplicates is not None else None
+        }